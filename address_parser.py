@@ -0,0 +1,305 @@
+"""
+행정구역 지명 사전 + 주소 분해
+시/도 → 시/군/구 → 읍/면/동(리) → 도로명을 지명 단위 트라이로 묶어 두고,
+업체 주소를 단계별 지명 / 번지·건물번호 / 상세(층·호·건물명)로 나눈다 (토큰 단위 사전 조회라 수 µs)
+
+- 기본 내장: 시/도 17개(약칭 포함) + 시/군/구 전체 (행정구 포함)
+- 읍/면/동·도로명: 내장 목록 대신 접미사 규칙으로 인식, GAZETTEER_PATH에 행정표준코드
+  법정동 파일("코드<TAB>서울특별시 종로구 청운동<TAB>존재") 또는 "시도 시군구 지명" 줄 목록을
+  주면 트라이에 추가해 사전 기준으로 검증 (os.pathsep로 여러 파일)
+
+타지역업체 판정의 "시/구/동까지만 있는 주소"(is_area_only)와 시/군/구별 묶기(district)에 사용
+"""
+
+import os
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Iterable, List, Tuple
+
+
+# 시/도 공식 명칭 → 약칭 (업체 주소는 대부분 "서울 강남구 ..." 처럼 약칭)
+SIDO_ALIASES = {
+    "서울특별시": ("서울", "서울시"),
+    "부산광역시": ("부산", "부산시"),
+    "대구광역시": ("대구", "대구시"),
+    "인천광역시": ("인천", "인천시"),
+    "광주광역시": ("광주",),
+    "대전광역시": ("대전", "대전시"),
+    "울산광역시": ("울산", "울산시"),
+    "세종특별자치시": ("세종", "세종시"),
+    "경기도": ("경기",),
+    "강원특별자치도": ("강원", "강원도"),
+    "충청북도": ("충북",),
+    "충청남도": ("충남",),
+    "전북특별자치도": ("전북", "전라북도"),
+    "전라남도": ("전남",),
+    "경상북도": ("경북",),
+    "경상남도": ("경남",),
+    "제주특별자치도": ("제주", "제주도"),
+}
+
+# 시/도별 시/군/구 (행정구가 있는 시는 "시:구,구")
+SIGUNGU = {
+    "서울특별시": "종로구 중구 용산구 성동구 광진구 동대문구 중랑구 성북구 강북구 도봉구 노원구 은평구 "
+                 "서대문구 마포구 양천구 강서구 구로구 금천구 영등포구 동작구 관악구 서초구 강남구 송파구 강동구",
+    "부산광역시": "중구 서구 동구 영도구 부산진구 동래구 남구 북구 해운대구 사하구 금정구 강서구 연제구 "
+                 "수영구 사상구 기장군",
+    "대구광역시": "중구 동구 서구 남구 북구 수성구 달서구 달성군 군위군",
+    "인천광역시": "중구 동구 미추홀구 연수구 남동구 부평구 계양구 서구 강화군 옹진군",
+    "광주광역시": "동구 서구 남구 북구 광산구",
+    "대전광역시": "동구 중구 서구 유성구 대덕구",
+    "울산광역시": "중구 남구 동구 북구 울주군",
+    "세종특별자치시": "",
+    "경기도": "수원시:장안구,권선구,팔달구,영통구 성남시:수정구,중원구,분당구 의정부시 안양시:만안구,동안구 "
+             "부천시:원미구,소사구,오정구 광명시 평택시 동두천시 안산시:상록구,단원구 "
+             "고양시:덕양구,일산동구,일산서구 과천시 구리시 남양주시 오산시 시흥시 군포시 의왕시 하남시 "
+             "용인시:처인구,기흥구,수지구 파주시 이천시 안성시 김포시 화성시 광주시 양주시 포천시 여주시 "
+             "연천군 가평군 양평군",
+    "강원특별자치도": "춘천시 원주시 강릉시 동해시 태백시 속초시 삼척시 홍천군 횡성군 영월군 평창군 정선군 "
+                     "철원군 화천군 양구군 인제군 고성군 양양군",
+    "충청북도": "청주시:상당구,서원구,흥덕구,청원구 충주시 제천시 보은군 옥천군 영동군 증평군 진천군 괴산군 "
+               "음성군 단양군",
+    "충청남도": "천안시:동남구,서북구 공주시 보령시 아산시 서산시 논산시 계룡시 당진시 금산군 부여군 서천군 "
+               "청양군 홍성군 예산군 태안군",
+    "전북특별자치도": "전주시:완산구,덕진구 군산시 익산시 정읍시 남원시 김제시 완주군 진안군 무주군 장수군 "
+                     "임실군 순창군 고창군 부안군",
+    "전라남도": "목포시 여수시 순천시 나주시 광양시 담양군 곡성군 구례군 고흥군 보성군 화순군 장흥군 강진군 "
+               "해남군 영암군 무안군 함평군 영광군 장성군 완도군 진도군 신안군",
+    "경상북도": "포항시:남구,북구 경주시 김천시 안동시 구미시 영주시 영천시 상주시 문경시 경산시 의성군 청송군 "
+               "영양군 영덕군 청도군 고령군 성주군 칠곡군 예천군 봉화군 울진군 울릉군",
+    "경상남도": "창원시:의창구,성산구,마산합포구,마산회원구,진해구 진주시 통영시 사천시 김해시 밀양시 거제시 "
+               "양산시 의령군 함안군 창녕군 고성군 남해군 하동군 산청군 함양군 거창군 합천군",
+    "제주특별자치도": "제주시 서귀포시",
+}
+
+# 토큰 종류 (접미사 규칙)
+SIGUNGU_RE = re.compile(r'^[가-힣]+[시군구]$')
+DONG_RE = re.compile(r'^[가-힣]+(?:\d*동|\d+가|읍|면)$')    # 역삼동, 역삼1동, 저동2가, 양평읍, 서면
+RI_RE = re.compile(r'^[가-힣]+\d*리$')
+ROAD_RE = re.compile(r'^[가-힣\d][가-힣\d.]*(?:로|길)$')    # 테헤란로, 세종대로, 논현로28길, 중앙로10번길, 3.15대로
+ROAD_SUFFIX_RE = re.compile(r'^\d+번?길$')                  # "중앙로 10번길"처럼 띄어 쓴 경우
+NUMBER_RE = re.compile(r'^(?:산\s?)?\d+(?:-\d+)?(?:번지)?$')
+NUMBER_PREFIXES = ("산", "지하")
+
+# 주소에서 토큰 구분으로 보는 문자
+SEPARATORS = str.maketrans({",": " "})
+
+
+@dataclass(frozen=True)
+class ParsedAddress:
+    """주소 분해 결과 (없는 단계는 빈 문자열)"""
+    raw: str
+    sido: str = ""          # 공식 명칭 (서울 → 서울특별시)
+    sigungu: str = ""       # 시/군/구 (행정구 포함: "성남시 분당구")
+    eupmyeondong: str = ""  # 읍/면/동 (법정동·행정동)
+    ri: str = ""
+    road: str = ""          # 도로명
+    number: str = ""        # 지번(123-4, 산12) 또는 건물번호
+    detail: str = ""        # 나머지 (층/호/건물명/괄호)
+    known: bool = False     # 시/군/구까지의 경로가 지명 사전에 있음
+
+    @property
+    def district(self) -> str:
+        """시/군/구 단위 묶음 키 ("서울특별시 강남구", 알 수 없으면 빈 문자열)"""
+        return f"{self.sido} {self.sigungu}".strip() if self.sigungu else self.sido
+
+    @property
+    def has_region(self) -> bool:
+        return bool(self.sido or self.sigungu or self.eupmyeondong)
+
+    @property
+    def is_area_only(self) -> bool:
+        """행정구역/도로명까지만 있고 번지·건물번호·상세가 없음 ("서울 강남구 역삼동", "경기 안산시 단원구")"""
+        return self.has_region and not self.number and not self.detail
+
+    @property
+    def level(self) -> str:
+        """가장 깊이 인식된 단계 (sido/sigungu/eupmyeondong/ri/road/number, 없으면 빈 문자열)"""
+        for name in ("number", "road", "ri", "eupmyeondong", "sigungu", "sido"):
+            if getattr(self, name):
+                return name
+        return ""
+
+
+class Gazetteer:
+    """지명 단위 트라이 (시/도 → 시/군/구 → 행정구 → 읍/면/동·도로명 → 리)"""
+
+    def __init__(self, sigungu: Dict[str, str] = SIGUNGU, aliases: Dict[str, Tuple[str, ...]] = SIDO_ALIASES):
+        self._root: Dict[str, dict] = {}
+        self._sido_names: Dict[str, str] = {}
+        # 시/도 없이 쓴 시/군/구 → [(시/도, "시 구" 경로)]
+        self._sigungu_index: Dict[str, List[Tuple[str, str]]] = {}
+
+        for sido, names in aliases.items():
+            self._sido_names[sido] = sido
+            for alias in names:
+                self._sido_names[alias] = sido
+        for sido, text in sigungu.items():
+            self.insert([sido])
+            for entry in text.split():
+                city, _, gus = entry.partition(":")
+                self.insert([sido, city])
+                for gu in filter(None, gus.split(",")):
+                    self.insert([sido, city, gu])
+
+    @classmethod
+    def from_env(cls):
+        """환경변수 설정 (GAZETTEER_PATH=법정동/도로명 목록 파일, os.pathsep로 여러 개)"""
+        gazetteer = cls()
+        for path in filter(None, os.getenv("GAZETTEER_PATH", "").split(os.pathsep)):
+            count = gazetteer.load(path)
+            print(f"🗺️ 지명 사전 추가: {path} ({count:,}건)")
+        return gazetteer
+
+    def load(self, path: str) -> int:
+        """지명 파일 추가 → 추가한 줄 수
+
+        - 행정표준코드 법정동 파일: "코드<TAB>전체 지명<TAB>존재|폐지" (폐지는 건너뜀)
+        - 단순 목록: 줄마다 "시도 시군구 [읍면동|도로명 ...]"
+        """
+        count = 0
+        with open(path, encoding="utf-8-sig") as f:
+            for line in f:
+                fields = line.rstrip("\r\n").split("\t")
+                if len(fields) > 1 and fields[0].strip().isdigit():
+                    if len(fields) > 2 and fields[2].strip() == "폐지":
+                        continue
+                    name = fields[1]
+                else:
+                    name = fields[0]
+                tokens = name.split()
+                if tokens and tokens[0] in self._sido_names:
+                    self.insert([self._sido_names[tokens[0]]] + tokens[1:])
+                    count += 1
+        return count
+
+    def insert(self, path: List[str]):
+        node = self._root
+        for depth, name in enumerate(path):
+            if name not in node:
+                node[name] = {}
+                self._index(path[:depth + 1])
+            node = node[name]
+
+    def contains(self, path: Iterable[str]) -> bool:
+        """경로가 사전과 맞는지 - 사전에 하위 지명이 없는 단계부터는 검증하지 않음"""
+        node = self._root
+        for name in path:
+            if not node:
+                return True
+            if name not in node:
+                return False
+            node = node[name]
+        return True
+
+    def sido(self, token: str) -> str:
+        """시/도 이름/약칭 → 공식 명칭 (아니면 빈 문자열)"""
+        return self._sido_names.get(token, "")
+
+    def children(self, path: Iterable[str]) -> Dict[str, dict]:
+        node = self._root
+        for name in path:
+            node = node.get(name)
+            if node is None:
+                return {}
+        return node
+
+    def find_sigungu(self, token: str) -> List[Tuple[str, str]]:
+        """시/도 없이 쓴 시/군/구 → [(시/도, 시/군/구 경로)] (중구처럼 여러 곳이면 여러 개)"""
+        return self._sigungu_index.get(token, [])
+
+    def _index(self, path: List[str]):
+        # 시/군/구(깊이 2)와 행정구(깊이 3, "성남시 분당구")만 색인
+        if len(path) == 2 and SIGUNGU_RE.match(path[1]):
+            self._sigungu_index.setdefault(path[1], []).append((path[0], path[1]))
+        elif len(path) == 3 and path[1].endswith("시") and path[2].endswith("구"):
+            self._sigungu_index.setdefault(path[2], []).append((path[0], f"{path[1]} {path[2]}"))
+
+    # ========== 주소 분해 ==========
+
+    def parse(self, address: str) -> ParsedAddress:
+        """주소 → ParsedAddress (인식 못 한 나머지는 detail)"""
+        raw = address or ""
+        tokens = raw.translate(SEPARATORS).split()
+        n = len(tokens)
+        i = 0
+
+        sido = self.sido(tokens[0]) if tokens else ""
+        if sido:
+            i += 1
+
+        sigungu = ""
+        known = False
+        if i < n and SIGUNGU_RE.match(tokens[i]):
+            sido, sigungu, used, known = self._resolve_sigungu(sido, tokens[i], tokens[i + 1] if i + 1 < n else "")
+            i += used
+        elif sido:
+            known = True
+
+        eupmyeondong = ri = road = number = ""
+        if i < n and DONG_RE.match(tokens[i]):
+            eupmyeondong = tokens[i]
+            i += 1
+            if i < n and eupmyeondong[-1] in "읍면" and RI_RE.match(tokens[i]):
+                ri = tokens[i]
+                i += 1
+        if i < n and ROAD_RE.match(tokens[i]):
+            road = tokens[i]
+            i += 1
+            if i < n and ROAD_SUFFIX_RE.match(tokens[i]):
+                road += tokens[i]
+                i += 1
+        if i < n:
+            if tokens[i] in NUMBER_PREFIXES and i + 1 < n and NUMBER_RE.match(tokens[i + 1]):
+                number = f"{tokens[i]} {tokens[i + 1]}"
+                i += 2
+            elif NUMBER_RE.match(tokens[i]):
+                number = tokens[i]
+                i += 1
+
+        if known and eupmyeondong:
+            known = self.contains([sido, *sigungu.split(), eupmyeondong])
+
+        return ParsedAddress(raw, sido, sigungu, eupmyeondong, ri, road, number, " ".join(tokens[i:]), known)
+
+    def _resolve_sigungu(self, sido: str, token: str, following: str) -> Tuple[str, str, int, bool]:
+        """시/군/구 토큰 → (시/도, 시/군/구, 사용한 토큰 수, 사전 확인 여부)"""
+        if sido:
+            cities = self.children([sido])
+            if token in cities:
+                gus = cities[token]
+                if following in gus:
+                    return sido, f"{token} {following}", 2, True
+                return sido, token, 1, True
+            return sido, token, 1, False
+
+        hits = self.find_sigungu(token)
+        if not hits:
+            return "", token, 1, False
+        if len(hits) == 1:
+            found_sido, path = hits[0]
+            gus = self.children([found_sido, token])
+            if following in gus:
+                return found_sido, f"{path} {following}", 2, True
+            return found_sido, path, 1, True
+        # 중구/동구처럼 여러 시/도에 있으면 시/도는 비워 둠
+        return "", token, 1, False
+
+
+# 프로세스 공용 사전
+gazetteer = Gazetteer.from_env()
+
+
+@lru_cache(maxsize=8192)
+def parse_address(address: str) -> ParsedAddress:
+    """공용 사전으로 주소 분해 (같은 주소는 캐시)"""
+    return gazetteer.parse(address)
+
+
+def group_by_district(records: Iterable[Dict], field: str = "address") -> Dict[str, List[Dict]]:
+    """결과를 시/군/구별로 묶기 (알 수 없는 주소는 빈 문자열 키)"""
+    groups: Dict[str, List[Dict]] = {}
+    for record in records:
+        groups.setdefault(parse_address(record.get(field) or "").district, []).append(record)
+    return groups
@@ -0,0 +1,132 @@
+"""
+__APOLLO_STATE__ 기반 플레이스 추출
+검색 결과 페이지에 포함된 Apollo 캐시(JSON)를 한 번 디코딩해 결과 레코드로 변환
+아이템마다 query_selector를 반복하는 셀렉터 방식은 상태가 없을 때만 사용
+"""
+
+import json
+import re
+from typing import Dict, List, Optional
+
+from phone_numbers import normalize_phone
+
+# 모바일 통합검색은 naver.search.ext.<섹션>.salt.__APOLLO_STATE__ = {...} 형태로
+# 섹션마다 상태를 따로 넣으므로 window 전역이 아니라 HTML 전체에서 찾는다
+APOLLO_STATE_PATTERN = re.compile(r'__APOLLO_STATE__\s*=\s*')
+
+# 목록 결과(ROOT_QUERY 값)에서 제외할 필드 - 광고
+AD_QUERY_PREFIXES = ('adBusinesses',)
+
+MOBILE_PLACE_URL = "https://m.place.naver.com/place/{place_id}/home"
+
+_TAG_PATTERN = re.compile(r'<[^>]+>')
+
+
+def parse_apollo_states(html: str) -> List[Dict]:
+    """HTML 안의 모든 __APOLLO_STATE__ 객체 (문서 순서)"""
+    decoder = json.JSONDecoder()
+    states = []
+    for match in APOLLO_STATE_PATTERN.finditer(html or ""):
+        try:
+            state, _ = decoder.raw_decode(html, match.end())
+        except ValueError:
+            continue
+        if isinstance(state, dict):
+            states.append(state)
+    return states
+
+
+def extract_places(states: List[Dict], max_results: Optional[int] = None) -> List[Dict]:
+    """Apollo 상태 목록 → 플레이스 레코드 (목록 순서, ID 기준 중복 제거)
+
+    레코드 키: place_id, name, category, address, phone, rating, reviews,
+    image_url, place_link, latitude, longitude
+    """
+    records = []
+    seen = set()
+    for state in states:
+        for entity in _list_entities(state):
+            place_id = str(entity.get('id') or "")
+            if not place_id or place_id in seen:
+                continue
+            seen.add(place_id)
+            records.append(_to_record(state, entity))
+            if max_results is not None and len(records) >= max_results:
+                return records
+    return records
+
+
+def extract_places_from_html(html: str, max_results: Optional[int] = None) -> List[Dict]:
+    return extract_places(parse_apollo_states(html), max_results)
+
+
+def _list_entities(state: Dict) -> List[Dict]:
+    """ROOT_QUERY의 목록 결과(items 참조) 순서대로 엔티티 반환
+
+    목록 참조가 없으면 __typename이 ...Summary인 엔티티를 상태 순서대로 사용
+    """
+    entities = []
+    root = state.get('ROOT_QUERY') or {}
+    for field, value in root.items():
+        if field.startswith(AD_QUERY_PREFIXES) or not isinstance(value, dict):
+            continue
+        for item in value.get('items') or []:
+            entity = _resolve(state, item)
+            if entity and entity.get('name'):
+                entities.append(entity)
+    if entities:
+        return entities
+
+    return [
+        value for value in state.values()
+        if isinstance(value, dict) and value.get('id') and value.get('name')
+        and str(value.get('__typename', '')).endswith('Summary')
+    ]
+
+
+def _resolve(state: Dict, value):
+    if isinstance(value, dict) and '__ref' in value:
+        return state.get(value['__ref'])
+    return value if isinstance(value, dict) else None
+
+
+def _to_record(state: Dict, entity: Dict) -> Dict:
+    place_id = str(entity['id'])
+
+    address = entity.get('fullAddress') or ""
+    if not address:
+        parts = [entity.get('commonAddress'), entity.get('roadAddress') or entity.get('address')]
+        address = " ".join(p for p in parts if p)
+
+    reviews = entity.get('visitorReviewCount') or entity.get('totalReviewCount') or ""
+    reviews = re.sub(r'[^0-9]', '', str(reviews)) or "0"
+
+    # 번호 형식이 아니면 원문 유지 (판정기가 종류 없음으로 처리)
+    phone = entity.get('phone') or entity.get('virtualPhone') or ""
+    phone = normalize_phone(phone) or phone
+
+    latitude, longitude = entity.get('y'), entity.get('x')
+    if not (latitude and longitude):
+        panorama = _resolve(state, entity.get('streetPanorama')) or {}
+        latitude, longitude = panorama.get('lat'), panorama.get('lon')
+
+    return {
+        'place_id': place_id,
+        'name': _TAG_PATTERN.sub('', entity.get('name') or "").strip(),
+        'category': entity.get('category') or "",
+        'address': address,
+        'phone': phone,
+        'rating': str(entity.get('visitorReviewScore') or ""),
+        'reviews': reviews,
+        'image_url': entity.get('imageUrl') or "",
+        'place_link': MOBILE_PLACE_URL.format(place_id=place_id),
+        'latitude': _to_float(latitude),
+        'longitude': _to_float(longitude),
+    }
+
+
+def _to_float(value) -> Optional[float]:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
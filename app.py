@@ -4,9 +4,10 @@ import sys
 import os
 from io import BytesIO
 from datetime import datetime
-import asyncio
 import subprocess
 from auth import AuthSystem
+from phase_timing import latency_recorder
+from cancellation import CancelToken
 
 # Playwright 브라우저 자동 설치 (최초 1회)
 @st.cache_resource
@@ -59,6 +60,35 @@ def install_playwright_browsers():
         traceback.print_exc()
         return False
 
+# 공유 브라우저 런타임 (모든 세션이 이벤트 루프 1개 + 브라우저 풀 1개를 공유)
+@st.cache_resource
+def get_browser_runtime():
+    """Chromium을 한 번만 실행하고 컨텍스트 풀을 세션 간에 공유"""
+    from async_browser_pool import BrowserRuntime
+    from naver_crawler_streamlit import DESKTOP_CONTEXT_OPTIONS, STEALTH_SCRIPT
+    return BrowserRuntime(
+        max_contexts=int(os.getenv('BROWSER_POOL_SIZE', '2')),
+        checkout_timeout=float(os.getenv('BROWSER_CHECKOUT_TIMEOUT', '120')),
+        context_options=DESKTOP_CONTEXT_OPTIONS,
+        init_script=STEALTH_SCRIPT
+    )
+
+# 검색 결과 캐시 (세션 간 공유, SQLite)
+@st.cache_resource
+def get_result_cache():
+    """같은 키워드 반복 검색은 크롤링 없이 캐시에서 반환"""
+    from result_cache import ResultCache
+    return ResultCache.from_env()
+
+# 상세 정보 캐시 (플레이스 ID별 전화번호, 세션 간 공유)
+@st.cache_resource
+def get_detail_cache():
+    from detail_cache import DetailCache
+    return DetailCache.from_env()
+
+# 결과 캐시 모드 (PC 지도 검색 크롤링 결과)
+CACHE_MODE = 'pcmap'
+
 # 브라우저 설치 실행
 with st.spinner("🔧 Playwright 브라우저 설치 중... (최초 1회, 약 2분 소요)"):
     install_status = install_playwright_browsers()
@@ -258,6 +288,7 @@ with st.sidebar:
     
     st.markdown("### 🎯 크롤링 옵션")
     max_results = st.slider("최대 결과 수", 5, 100, 20, 5)
+    bypass_cache = st.checkbox("캐시 무시 (항상 새로 크롤링)", value=False)
     
     st.markdown("### 🧪 테스트 모드")
     demo_mode = st.checkbox("데모 모드 (Playwright 문제 시)", value=False)
@@ -269,6 +300,23 @@ with st.sidebar:
         stats = st.session_state.stats
         st.metric("총 검색 횟수", stats.get('total_searches', 0))
         st.metric("총 추출 업체", stats.get('total_results', 0))
+    
+    cache_stats = get_result_cache().stats()
+    if cache_stats['enabled']:
+        st.metric("캐시 적중률", f"{cache_stats['hit_rate'] * 100:.0f}%")
+        st.caption(
+            f"적중 {cache_stats['hits']} · 만료 후 재사용 {cache_stats['stale_hits']} · "
+            f"미스 {cache_stats['misses']} · 저장 {cache_stats['entries']}건"
+        )
+    
+    # 키워드당 크롤링 시간 분포 (프로세스 시작 이후 누적)
+    total_latency = latency_recorder.snapshot().get('total')
+    if total_latency:
+        st.caption(
+            f"⏱ 키워드당 p50 {total_latency['p50_ms'] / 1000:.1f}s · "
+            f"p95 {total_latency['p95_ms'] / 1000:.1f}s · p99 {total_latency['p99_ms'] / 1000:.1f}s "
+            f"({total_latency['count']}회)"
+        )
 
 # 메인 영역
 col1, col2 = st.columns([2, 1])
@@ -350,9 +398,13 @@ if start_button and keywords:
         
         # Import the crawler
         from naver_crawler_streamlit import NaverPlaceCrawler
+        from concurrent.futures import TimeoutError as FutureTimeout
         
         all_results = []
         
+        # 이번 실행 전체의 취소 토큰 (중지/재실행 시 취소) - 시간 예산(CRAWL_TIME_BUDGET)은 키워드마다 하위 토큰으로 따로
+        token = CancelToken()
+        
         # 각 키워드별로 크롤링
         for idx, keyword in enumerate(keywords):
             status_text.markdown(f"### 🔍 검색 중: **{keyword}** ({idx+1}/{len(keywords)})")
@@ -387,10 +439,28 @@ if start_button and keywords:
                     old_stdout = sys.stdout
                     sys.stdout = log_buffer = io.StringIO()
                     
+                    future = None
                     try:
-                        crawler = NaverPlaceCrawler()
-                        results = asyncio.run(crawler.crawl(keyword, max_results=max_results))
+                        runtime = get_browser_runtime()
+                        crawler = NaverPlaceCrawler(pool=runtime.pool, detail_cache=get_detail_cache())
+                        future = get_result_cache().submit(
+                            keyword, CACHE_MODE, max_results,
+                            lambda keyword=keyword: runtime.submit(crawler.crawl(keyword, max_results=max_results, token=token.child())),
+                            bypass=bypass_cache
+                        )
+                        # 1초마다 화면을 갱신 - 중지 버튼/재실행은 st 호출 시점에 예외로 전달되므로
+                        # 그때 finally에서 토큰을 취소해 브라우저 작업도 멈춤
+                        waited = 0
+                        while True:
+                            try:
+                                results = future.result(timeout=1)
+                                break
+                            except FutureTimeout:
+                                waited += 1
+                                status_text.markdown(f"### 🔍 검색 중: **{keyword}** ({idx+1}/{len(keywords)}) · {waited}초")
                     finally:
+                        if future is not None and not future.done():
+                            token.cancel('session_stopped')
                         # 로그 복원
                         sys.stdout = old_stdout
                         log_output = log_buffer.getvalue()
@@ -400,6 +470,20 @@ if start_button and keywords:
                         with st.expander(f"🔍 '{keyword}' 크롤링 로그 (클릭하여 보기)"):
                             st.code(log_output, language="text")
                     
+                    # 단계별 소요 시간 (캐시에서 바로 나온 결과는 없음)
+                    timing = getattr(results, 'timing', None)
+                    if timing:
+                        st.caption("⏱ " + " · ".join(
+                            f"{name} {ms / 1000:.1f}s" for name, ms in timing['phases_ms'].items()
+                            if name != 'detail_item'
+                        ))
+                    
+                    if getattr(results, 'status', None) == 'blocked':
+                        st.error(f"⛔ '{keyword}': 네이버 차단/캡차 페이지 감지 ({results.reason}) - 잠시 후 다시 시도하세요.")
+                    
+                    if getattr(results, 'partial', False):
+                        st.warning(f"⏱ '{keyword}': 시간 예산 초과로 일부 단계(스크롤/상세 페이지)를 생략한 부분 결과입니다.")
+                    
                     if not results:
                         st.warning(f"⚠️ '{keyword}': 결과 없음")
                         st.info("💡 위의 로그를 확인하거나, 사이드바에서 '데모 모드'를 활성화해보세요.")
@@ -584,7 +668,8 @@ if start_button and keywords:
             
             # CSV 다운로드
             with col_dl2:
-                csv = filtered_df.to_csv(index=False, encoding='utf-8-sig')
+                with latency_recorder.measure('serialize'):
+                    csv = filtered_df.to_csv(index=False, encoding='utf-8-sig')
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                 filename_csv = f"네이버플레이스_{timestamp}.csv"
                 
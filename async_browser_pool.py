@@ -0,0 +1,163 @@
+"""
+비동기 브라우저 풀 - Streamlit 크롤러용
+하나의 이벤트 루프에서 Chromium 1개와 제한된 수의 컨텍스트를 모든 세션이 공유
+"""
+
+import asyncio
+import threading
+from contextlib import asynccontextmanager
+from typing import Dict, List, Optional
+
+from playwright.async_api import async_playwright
+
+
+DEFAULT_LAUNCH_ARGS = [
+    '--disable-blink-features=AutomationControlled',
+    '--disable-dev-shm-usage',
+    '--no-sandbox',
+]
+
+
+class AsyncBrowserPool:
+    """Chromium 1개 + 컨텍스트 풀 (최대 max_contexts개 동시 대여)
+
+    브라우저는 첫 대여 시 실행되며, 그 시점의 이벤트 루프에 묶인다.
+    반환된 컨텍스트는 페이지만 닫고 재사용한다.
+    """
+
+    def __init__(self, max_contexts: int = 3, checkout_timeout: float = 60,
+                 context_options: Optional[Dict] = None, init_script: str = "",
+                 launch_args: Optional[List[str]] = None, max_context_uses: int = 50):
+        self.max_contexts = max(1, max_contexts)
+        self.checkout_timeout = checkout_timeout
+        self.context_options = context_options or {}
+        self.init_script = init_script
+        self.launch_args = launch_args or DEFAULT_LAUNCH_ARGS
+        self.max_context_uses = max_context_uses
+
+        self._playwright = None
+        self._browser = None
+        self._idle: List = []
+        self._uses: Dict = {}
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._launch_lock: Optional[asyncio.Lock] = None
+        self.in_use = 0
+
+    @asynccontextmanager
+    async def context(self, timeout: Optional[float] = None):
+        """컨텍스트 대여 - timeout 안에 빈 슬롯이 없으면 TimeoutError"""
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_contexts)
+            self._launch_lock = asyncio.Lock()
+
+        timeout = self.checkout_timeout if timeout is None else timeout
+        try:
+            await asyncio.wait_for(self._slots.acquire(), timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"브라우저 컨텍스트 대기 시간 초과 ({timeout}초)")
+
+        context = None
+        self.in_use += 1
+        try:
+            context = await self._checkout()
+            yield context
+        finally:
+            self.in_use -= 1
+            if context is not None:
+                await self._checkin(context)
+            self._slots.release()
+
+    async def close(self):
+        """모든 컨텍스트와 브라우저 종료"""
+        for context in self._idle:
+            await self._close_context(context)
+        self._idle = []
+        try:
+            if self._browser:
+                await self._browser.close()
+            if self._playwright:
+                await self._playwright.stop()
+        except Exception:
+            pass
+        self._browser = None
+        self._playwright = None
+
+    async def _ensure_browser(self):
+        async with self._launch_lock:
+            if self._browser is not None and self._browser.is_connected():
+                return
+            if self._browser is not None:
+                print("⚠️ 브라우저 연결 끊김 - 재시작")
+                self._idle = []
+                self._uses = {}
+            if self._playwright is None:
+                self._playwright = await async_playwright().start()
+            self._browser = await self._playwright.chromium.launch(
+                headless=True,
+                args=self.launch_args
+            )
+            print("✓ Chromium 브라우저 실행 성공 (공유 풀)")
+
+    async def _checkout(self):
+        await self._ensure_browser()
+        if self._idle:
+            return self._idle.pop()
+
+        context = await self._browser.new_context(**self.context_options)
+        if self.init_script:
+            await context.add_init_script(self.init_script)
+        self._uses[context] = 0
+        return context
+
+    async def _checkin(self, context):
+        try:
+            for page in list(context.pages):
+                await page.close()
+        except Exception:
+            pass
+
+        uses = self._uses.get(context, 0) + 1
+        self._uses[context] = uses
+        if uses >= self.max_context_uses or not self._browser or not self._browser.is_connected():
+            await self._close_context(context)
+            return
+        self._idle.append(context)
+
+    async def _close_context(self, context):
+        self._uses.pop(context, None)
+        try:
+            await context.close()
+        except Exception:
+            pass
+
+
+class BrowserRuntime:
+    """전용 스레드에서 도는 이벤트 루프 1개 + 공유 AsyncBrowserPool
+
+    Streamlit 스크립트 스레드마다 asyncio.run()으로 새 루프를 만들면
+    브라우저를 공유할 수 없으므로, 코루틴을 이 루프로 보내 실행한다.
+    """
+
+    def __init__(self, **pool_options):
+        self.pool = AsyncBrowserPool(**pool_options)
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run_loop, name="browser-loop", daemon=True)
+        self._thread.start()
+
+    def _run_loop(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def submit(self, coro):
+        """코루틴을 공유 루프에 제출하고 concurrent.futures.Future 반환"""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run(self, coro, timeout: Optional[float] = None):
+        """코루틴을 공유 루프에서 실행하고 결과를 기다림"""
+        return self.submit(coro).result(timeout)
+
+    def close(self):
+        try:
+            self.run(self.pool.close(), timeout=30)
+        finally:
+            self.loop.call_soon_threadsafe(self.loop.stop)
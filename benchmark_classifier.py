@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+타지역업체 판정 벤치마크 + 정확도 확인
+region_fixtures.json(사람이 붙인 label + 프로필별 기대 판정 expected)으로
+
+- 정확도: 프로필별 label 일치율, 오분류 목록
+- 회귀: 프로필별 판정이 expected와 다르면 종료 코드 1 (규칙을 바꾸면 expected도 함께 갱신)
+- 번호 찾기: 텍스트 속 번호 후보(find_phones)가 PHONE_TEXT_CASES와 다르면 회귀로 셈
+- 속도: 픽스처를 --rows 행으로 늘려 일괄 판정(dict/DataFrame) vs 1건씩 판정 처리량 비교
+
+사용 예:
+    python benchmark_classifier.py
+    python benchmark_classifier.py --rows 200000 --repeat 5 --profile core
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+
+from phone_numbers import find_phones
+from region_classifier import COLUMNS, PROFILES, classify, classify_place
+
+
+DEFAULT_FIXTURE = "region_fixtures.json"
+
+# 목록/상세 텍스트 → 찾아야 하는 번호 (등장 순, 표준 형식)
+PHONE_TEXT_CASES = [
+    ("1588-1234 0507-1313-3523", ["1588-1234", "0507-1313-3523"]),   # 대표번호가 뒤 번호 앞자리를 삼키지 않음
+    ("대표 1588-1234\n2023년 개업", ["1588-1234"]),
+    ("tel:070-4207-0588 02-555-1234", ["070-4207-0588", "02-555-1234"]),
+    ("(02) 555-1234 / +82 10-1234-5678", ["02-555-1234", "010-1234-5678"]),
+    ("+82 1588-1234", ["1588-1234"]),
+    ("주문번호 1588123456, 2024.01.15", []),
+]
+
+
+def load_fixture(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def to_table(rows, size=None):
+    """행 목록 → 열 단위 표 (size를 주면 행을 반복해 늘림)"""
+    if size is not None:
+        rows = [rows[i % len(rows)] for i in range(size)]
+    table = {column: [row.get(column, "") for row in rows] for column in COLUMNS}
+    table.update({column: [row.get(column) for row in rows] for column in ("latitude", "longitude")})
+    return table
+
+
+# ========== 정확도 ==========
+
+def check_accuracy(rows, profiles):
+    """프로필별 label 일치율 + expected 회귀 → 회귀 건수"""
+    table = to_table(rows)
+    regressions = 0
+
+    print(f"\n🎯 정확도 ({len(rows)}건)")
+    for profile in profiles:
+        result = classify(table, profile)
+        predicted = result["place_type"]
+        correct = sum(p == row["label"] for p, row in zip(predicted, rows))
+        print(f"  {profile:10s} {correct}/{len(rows)} ({correct / len(rows) * 100:.0f}%)")
+
+        for p, reason, row in zip(predicted, result["reason"], rows):
+            expected = row.get("expected", {}).get(profile)
+            if expected is not None and p != expected:
+                regressions += 1
+                print(f"    ❌ 회귀: {row['name']} → {p} ({reason}), 기대 {expected}")
+            elif p != row["label"]:
+                print(f"    · 오분류: {row['name']} → {p} ({reason}) - {row.get('note', '')}")
+
+    return regressions
+
+
+def check_phone_text():
+    """번호 찾기 회귀 → 회귀 건수"""
+    regressions = 0
+    print(f"\n📞 번호 찾기 ({len(PHONE_TEXT_CASES)}건)")
+    for text, expected in PHONE_TEXT_CASES:
+        found = [phone.canonical for phone in find_phones(text)]
+        if found != expected:
+            regressions += 1
+            print(f"    ❌ 회귀: {text!r} → {found}, 기대 {expected}")
+    if not regressions:
+        print("  모두 일치")
+    return regressions
+
+
+# ========== 속도 ==========
+
+def timed(fn, repeat):
+    runs = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        runs.append(time.perf_counter() - started)
+    return statistics.median(runs)
+
+
+def benchmark(rows, profiles, size, repeat):
+    table = to_table(rows, size)
+    records = [dict(zip(table, values)) for values in zip(*table.values())]
+    try:
+        import pandas as pd
+        frame = pd.DataFrame(table)
+    except ImportError:
+        frame = None
+
+    print(f"\n⏱️ 속도 ({size:,}행, {repeat}회 중앙값)")
+    for profile in profiles:
+        paths = {
+            "batch(dict)": lambda: classify(table, profile),
+            "per_row": lambda: [
+                classify_place(profile, r["name"], r["address"], r["phone"], r["rating"], r["reviews"], r["keyword"],
+                               r["latitude"], r["longitude"])
+                for r in records
+            ],
+        }
+        if frame is not None:
+            paths["batch(DataFrame)"] = lambda: classify(frame, profile)
+
+        baseline = None
+        for label, fn in paths.items():
+            seconds = timed(fn, repeat)
+            baseline = baseline or seconds
+            print(f"  {profile:10s} {label:17s} {seconds * 1000:8.1f}ms  "
+                  f"{size / seconds:12,.0f}행/s  x{baseline / seconds:.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="타지역업체 판정 벤치마크/정확도")
+    parser.add_argument("--fixture", default=DEFAULT_FIXTURE)
+    parser.add_argument("--profile", action="append", choices=list(PROFILES), help="기본: 전체")
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--skip-bench", action="store_true", help="정확도/회귀만 확인")
+    args = parser.parse_args()
+
+    rows = load_fixture(args.fixture)
+    profiles = args.profile or list(PROFILES)
+
+    regressions = check_accuracy(rows, profiles) + check_phone_text()
+    if not args.skip_bench:
+        benchmark(rows, profiles, args.rows, args.repeat)
+
+    if regressions:
+        print(f"\n❌ 기대 판정과 다른 결과 {regressions}건")
+        sys.exit(1)
+    print("\n✅ 기대 판정과 모두 일치")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+오프라인 추출 벤치마크
+저장된 모바일 검색 페이지(mobile_debug_*.html)를 page.route로 headless Chromium에
+제공하고 (외부 요청은 모두 차단) 크롤러별 추출 경로의 속도와 정확도를 측정
+
+측정 항목: 전체 시간, 단계별 시간(load/extract), Playwright 호출 수(≈CDP 왕복),
+최대 RSS(파이썬/브라우저), 필드별 채움 비율 → JSON 저장, --compare로 이전 결과와 비교
+
+사용 예:
+    python benchmark_extraction.py --repeat 5 --output bench.json
+    python benchmark_extraction.py --compare bench_prev.json
+"""
+
+import argparse
+import glob
+import json
+import os
+import platform
+import re
+import resource
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+from urllib.parse import quote
+
+from playwright.sync_api import sync_playwright
+
+from apollo_state import extract_places, extract_places_from_html
+from metrics import child_processes_rss
+from mobile_list import LIST_FIELDS, LIST_ITEM_SELECTORS, extract_list_records, rows_to_records
+from naver_crawler_streamlit import APOLLO_STATE_SCRIPT
+
+
+FIXTURE_PATTERN = "mobile_debug_*.html"
+MOBILE_SEARCH_URL = "https://m.search.naver.com/search.naver?where=m&query={query}"
+
+# 채움 비율을 계산할 필드 (값이 비었거나 자리표시 문자열이면 미수집)
+COVERAGE_FIELDS = ['name', 'category', 'address', 'phone', 'rating', 'reviews', 'image_url', 'place_id']
+MISSING_VALUES = (None, "", "-", "주소 정보 없음")
+
+
+# ========== 추출 경로 ==========
+
+def path_apollo(page, max_results):
+    """NaverPlaceCrawlerReal 1순위 - HTML 안의 __APOLLO_STATE__ 디코딩"""
+    return extract_places_from_html(page.content(), max_results)
+
+
+def path_dom_batch(page, max_results):
+    """NaverPlaceCrawlerReal 대체 경로 - 셀렉터 설정을 evaluate 1회로 추출"""
+    records, _, _ = extract_list_records(page, max_results, verbose=False)
+    return records
+
+
+def path_dom_per_item(page, max_results):
+    """비교 기준 - 아이템·셀렉터마다 query_selector/inner_text 왕복 (일괄 추출 이전 방식)"""
+    items = []
+    for selector in LIST_ITEM_SELECTORS:
+        items = page.query_selector_all(selector)
+        if items:
+            break
+
+    rows = []
+    for item in items[:max_results]:
+        row = {}
+        for name, spec in LIST_FIELDS.items():
+            row[name] = ""
+            for sel in spec['selectors']:
+                el = item.query_selector(sel)
+                if not el:
+                    continue
+                if spec.get('attrs'):
+                    row[name] = next((v for v in (el.get_attribute(a) for a in spec['attrs']) if v), "")
+                    break
+                text = el.inner_text().strip()
+                if text and len(text) >= spec.get('min_length', 0) and text not in spec.get('reject', ()):
+                    row[name] = text
+                    break
+        row['html'] = item.inner_html()
+        rows.append(row)
+    return rows_to_records(rows, verbose=False)
+
+
+def path_streamlit_apollo(page, max_results):
+    """NaverPlaceCrawler 1순위 - window.__APOLLO_STATE__ evaluate, 없으면 HTML 정규식"""
+    state = page.evaluate(APOLLO_STATE_SCRIPT)
+    records = extract_places([state], max_results) if state else []
+    return records or extract_places_from_html(page.content(), max_results)
+
+
+PATHS = {
+    'apollo': path_apollo,
+    'dom_batch': path_dom_batch,
+    'dom_per_item': path_dom_per_item,
+    'streamlit_apollo': path_streamlit_apollo,
+}
+
+
+# ========== 측정 도구 ==========
+
+class CallCounter:
+    """page/element 메서드 호출 수 집계 (Playwright 드라이버 왕복 ≈ CDP 호출)"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def wrap(self, target):
+        return _Counted(target, self)
+
+    def wrap_result(self, result):
+        if isinstance(result, list):
+            return [self.wrap_result(r) for r in result]
+        if hasattr(result, 'query_selector'):
+            return self.wrap(result)
+        return result
+
+
+class _Counted:
+    def __init__(self, target, counter):
+        self._target = target
+        self._counter = counter
+
+    def __getattr__(self, name):
+        attr = getattr(self._target, name)
+        if not callable(attr):
+            return attr
+
+        def call(*args, **kwargs):
+            self._counter.calls += 1
+            return self._counter.wrap_result(attr(*args, **kwargs))
+        return call
+
+
+def _python_peak_rss_mb():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux는 KB, macOS는 바이트 단위
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def coverage(records):
+    if not records:
+        return {field: 0.0 for field in COVERAGE_FIELDS}
+    return {
+        field: round(sum(1 for r in records if r.get(field) not in MISSING_VALUES) / len(records), 3)
+        for field in COVERAGE_FIELDS
+    }
+
+
+def _summary(values):
+    return {
+        'median': round(statistics.median(values), 2),
+        'min': round(min(values), 2),
+        'max': round(max(values), 2),
+    }
+
+
+def _git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except Exception:
+        return ""
+
+
+# ========== 실행 ==========
+
+def load_fixtures(pattern):
+    fixtures = []
+    for path in sorted(glob.glob(pattern)):
+        keyword = re.sub(r'^mobile_debug_|\.html$', '', os.path.basename(path))
+        with open(path, encoding='utf-8') as f:
+            fixtures.append({
+                'name': os.path.basename(path),
+                'keyword': keyword,
+                'url': MOBILE_SEARCH_URL.format(query=quote(keyword)),
+                'html': f.read(),
+            })
+    return fixtures
+
+
+def serve_fixture(context, fixture):
+    """fixture URL만 응답하고 나머지 요청은 모두 차단 (네트워크 미사용)"""
+    def handle(route):
+        if route.request.url == fixture['url']:
+            return route.fulfill(status=200, content_type='text/html; charset=utf-8', body=fixture['html'])
+        return route.abort()
+    context.unroute('**/*')
+    context.route('**/*', handle)
+
+
+def run_benchmark(fixtures, paths, repeat, max_results):
+    results = []
+    browser_peak = 0.0
+
+    with sync_playwright() as p:
+        browser = p.chromium.launch(headless=True)
+        context = browser.new_context(locale='ko-KR', java_script_enabled=True)
+
+        for fixture in fixtures:
+            serve_fixture(context, fixture)
+            for path_name in paths:
+                extract = PATHS[path_name]
+                walls, loads, extracts = [], [], []
+                calls, records = 0, []
+
+                for _ in range(repeat):
+                    page = context.new_page()
+                    try:
+                        started = time.perf_counter()
+                        page.goto(fixture['url'], wait_until='domcontentloaded', timeout=30000)
+                        loaded = time.perf_counter()
+
+                        counter = CallCounter()
+                        records = extract(counter.wrap(page), max_results)
+                        finished = time.perf_counter()
+                    finally:
+                        browser_peak = max(browser_peak, child_processes_rss()[1] / (1024 * 1024))
+                        page.close()
+
+                    calls = counter.calls
+                    loads.append((loaded - started) * 1000)
+                    extracts.append((finished - loaded) * 1000)
+                    walls.append((finished - started) * 1000)
+
+                entry = {
+                    'fixture': fixture['name'],
+                    'path': path_name,
+                    'wall_ms': _summary(walls),
+                    'phases_ms': {'load': _summary(loads), 'extract': _summary(extracts)},
+                    'cdp_calls': calls,
+                    'records': len(records),
+                    'coverage': coverage(records),
+                }
+                results.append(entry)
+                print(f"  {fixture['name'][:30]:30} {path_name:17} "
+                      f"extract {entry['phases_ms']['extract']['median']:8.1f}ms  "
+                      f"calls {calls:5}  records {len(records):3}")
+
+        browser.close()
+
+    return {
+        'commit': _git_commit(),
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'repeat': repeat,
+        'max_results': max_results,
+        'peak_rss_mb': {'python': round(_python_peak_rss_mb(), 1), 'browser': round(browser_peak, 1)},
+        'results': results,
+    }
+
+
+def compare(current, previous):
+    """이전 결과 대비 추출 시간/호출 수/레코드 수 변화 출력"""
+    before = {(r['fixture'], r['path']): r for r in previous.get('results', [])}
+    print(f"\n📊 비교: {previous.get('commit') or '이전'} → {current.get('commit') or '현재'}")
+    for r in current['results']:
+        old = before.get((r['fixture'], r['path']))
+        if not old:
+            continue
+        now_ms = r['phases_ms']['extract']['median']
+        old_ms = old['phases_ms']['extract']['median']
+        change = (now_ms - old_ms) / old_ms * 100 if old_ms else 0.0
+        flag = "⚠️" if change > 10 or r['records'] < old['records'] else "  "
+        print(f"  {flag} {r['fixture'][:30]:30} {r['path']:17} "
+              f"{old_ms:8.1f} → {now_ms:8.1f}ms ({change:+.0f}%)  "
+              f"calls {old['cdp_calls']} → {r['cdp_calls']}  records {old['records']} → {r['records']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="저장된 페이지로 추출 경로 벤치마크 (네트워크 미사용)")
+    parser.add_argument('--fixtures', default=FIXTURE_PATTERN, help="fixture HTML glob")
+    parser.add_argument('--paths', default=",".join(PATHS), help="측정할 추출 경로 (쉼표 구분)")
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--max-results', type=int, default=50)
+    parser.add_argument('--output', default="benchmark_results.json")
+    parser.add_argument('--compare', help="비교할 이전 결과 JSON")
+    args = parser.parse_args()
+
+    fixtures = load_fixtures(args.fixtures)
+    if not fixtures:
+        print(f"❌ fixture 없음: {args.fixtures}")
+        return 1
+    paths = [p.strip() for p in args.paths.split(",") if p.strip() in PATHS]
+
+    print(f"🔬 fixture {len(fixtures)}개 × 경로 {len(paths)}개 × {args.repeat}회")
+    report = run_benchmark(fixtures, paths, args.repeat, args.max_results)
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"\n✅ 결과 저장: {args.output} (최대 RSS: 파이썬 {report['peak_rss_mb']['python']}MB, "
+          f"브라우저 {report['peak_rss_mb']['browser']}MB)")
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            compare(report, json.load(f))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,249 @@
+"""
+Playwright 브라우저 서비스
+전용 스레드가 sync Playwright 인스턴스를 소유하고 명령 큐로 작업을 받아 처리
+"""
+
+import queue
+import threading
+from concurrent.futures import Future
+
+from playwright.sync_api import sync_playwright
+
+
+# Chromium 실행 옵션 (봇 감지 우회)
+LAUNCH_ARGS = [
+    '--no-sandbox',
+    '--disable-setuid-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-blink-features=AutomationControlled',  # 자동화 감지 차단
+    '--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+]
+
+# 모바일 디바이스 시뮬레이션 (iPhone 13)
+IPHONE_DEVICE = {
+    'viewport': {'width': 390, 'height': 844},
+    'user_agent': 'Mozilla/5.0 (iPhone; CPU iPhone OS 17_0 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.0 Mobile/15E148 Safari/604.1',
+    'device_scale_factor': 3,
+    'is_mobile': True,
+    'has_touch': True,
+    'locale': 'ko-KR',
+    'timezone_id': 'Asia/Seoul'
+}
+
+# JavaScript 스크립트로 봇 판별 방지
+STEALTH_SCRIPT = """
+    Object.defineProperty(navigator, 'webdriver', {get: () => undefined});
+    Object.defineProperty(navigator, 'plugins', {get: () => [1, 2, 3, 4, 5]});
+    Object.defineProperty(navigator, 'languages', {get: () => ['ko-KR', 'ko', 'en-US', 'en']});
+    window.chrome = {runtime: {}};
+"""
+
+_STOP = object()
+
+
+class BrowserService:
+    """장수명 브라우저 서비스
+
+    sync Playwright 객체는 생성한 스레드 밖에서 사용할 수 없으므로
+    Flask(threaded=True) 요청 스레드는 브라우저를 직접 만지지 않고
+    submit()/run()으로 작업 함수를 큐에 넣는다. 작업 함수는 워커 스레드에서
+    `fn(context, *args, **kwargs)` 형태로 실행되며, context는 봇 우회 스크립트와
+    iPhone 프로필이 미리 적용된 재사용 컨텍스트이다.
+
+    workers > 1이면 워커마다 자체 Playwright/Chromium을 소유하고
+    같은 큐에서 작업을 가져가므로 키워드 N개를 동시에 처리할 수 있다.
+    """
+
+    def __init__(self, pool_size=2, headless=True, device=None, init_script=STEALTH_SCRIPT,
+                 launch_args=None, max_context_uses=50, workers=1):
+        self.pool_size = max(1, pool_size)
+        self.headless = headless
+        self.device = device or IPHONE_DEVICE
+        self.init_script = init_script
+        self.launch_args = launch_args or LAUNCH_ARGS
+        self.max_context_uses = max_context_uses
+        self.workers = max(1, workers)
+
+        self._commands = queue.Queue()
+        self._lock = threading.Lock()
+        self._threads = []
+        self._busy = 0
+
+    # ========== 외부(요청 스레드) API ==========
+
+    def start(self, timeout=60):
+        """워커 스레드 시작 (이미 실행 중이면 무시)"""
+        with self._lock:
+            self._threads = [t for t in self._threads if t.is_alive()]
+            missing = self.workers - len(self._threads)
+            if missing <= 0:
+                return
+            workers = [_BrowserWorker(self) for _ in range(missing)]
+            for worker in workers:
+                thread = threading.Thread(target=worker.serve, name="browser-service", daemon=True)
+                thread.start()
+                self._threads.append(thread)
+
+        errors = []
+        for worker in workers:
+            if not worker.ready.wait(timeout):
+                errors.append("시작 시간 초과")
+            elif worker.startup_error:
+                errors.append(str(worker.startup_error))
+        if len(errors) == len(workers):
+            raise RuntimeError(f"브라우저 서비스 시작 실패: {errors[0]}")
+        if errors:
+            print(f"⚠️ 브라우저 워커 {len(errors)}개 시작 실패: {errors[0]}")
+
+    def submit(self, fn, *args, **kwargs):
+        """작업을 큐에 넣고 Future 반환 - fn(context, *args, **kwargs)"""
+        self.start()
+        future = Future()
+        self._commands.put((fn, args, kwargs, future))
+        return future
+
+    def run(self, fn, *args, timeout=None, **kwargs):
+        """작업을 실행하고 결과를 기다림"""
+        return self.submit(fn, *args, **kwargs).result(timeout)
+
+    def stop(self, timeout=30):
+        """남은 작업을 처리한 뒤 모든 워커의 브라우저 종료"""
+        with self._lock:
+            threads = [t for t in self._threads if t.is_alive()]
+            self._threads = []
+        for _ in threads:
+            self._commands.put(_STOP)
+        for thread in threads:
+            thread.join(timeout)
+
+    @property
+    def queue_depth(self):
+        """대기 중인 작업 수"""
+        return self._commands.qsize()
+
+    @property
+    def busy_workers(self):
+        """작업 실행 중인 워커 수"""
+        return self._busy
+
+    def _mark_busy(self, delta):
+        with self._lock:
+            self._busy += delta
+
+
+class _BrowserWorker:
+    """워커 스레드 1개 - Playwright/Chromium/컨텍스트 풀을 소유 (해당 스레드에서만 접근)"""
+
+    def __init__(self, service):
+        self.service = service
+        self.ready = threading.Event()
+        self.startup_error = None
+
+        self._playwright = None
+        self._browser = None
+        self._idle_contexts = []
+        self._context_uses = {}
+
+    def serve(self):
+        service = self.service
+        try:
+            self._playwright = sync_playwright().start()
+            self._launch_browser()
+            for _ in range(service.pool_size):
+                self._idle_contexts.append(self._new_context())
+            print(f"✅ 브라우저 워커 시작 (컨텍스트 {service.pool_size}개 준비)")
+        except Exception as e:
+            self.startup_error = e
+            self._shutdown()
+            self.ready.set()
+            return
+
+        self.ready.set()
+
+        try:
+            while True:
+                command = service._commands.get()
+                if command is _STOP:
+                    break
+                self._execute(*command)
+        finally:
+            self._shutdown()
+
+    def _execute(self, fn, args, kwargs, future):
+        if not future.set_running_or_notify_cancel():
+            return
+
+        context = None
+        self.service._mark_busy(1)
+        try:
+            context = self._acquire_context()
+            future.set_result(fn(context, *args, **kwargs))
+        except BaseException as e:
+            future.set_exception(e)
+        finally:
+            if context is not None:
+                self._release_context(context)
+            self.service._mark_busy(-1)
+
+    def _launch_browser(self):
+        self._browser = self._playwright.chromium.launch(
+            headless=self.service.headless,
+            args=self.service.launch_args
+        )
+
+    def _new_context(self):
+        context = self._browser.new_context(**self.service.device)
+        if self.service.init_script:
+            context.add_init_script(self.service.init_script)
+        self._context_uses[context] = 0
+        return context
+
+    def _acquire_context(self):
+        # 브라우저 크래시 시 재시작 (기존 컨텍스트는 모두 무효)
+        if not self._browser.is_connected():
+            print("⚠️ 브라우저 연결 끊김 - 재시작")
+            self._idle_contexts.clear()
+            self._context_uses.clear()
+            self._launch_browser()
+
+        if self._idle_contexts:
+            return self._idle_contexts.pop()
+        return self._new_context()
+
+    def _release_context(self, context):
+        # 작업이 닫지 않은 페이지 정리
+        try:
+            for page in list(context.pages):
+                page.close()
+        except Exception:
+            pass
+
+        uses = self._context_uses.get(context, 0) + 1
+        self._context_uses[context] = uses
+
+        # 오래 쓴 컨텍스트는 메모리 정리를 위해 교체
+        if uses >= self.service.max_context_uses or len(self._idle_contexts) >= self.service.pool_size:
+            self._close_context(context)
+            return
+        self._idle_contexts.append(context)
+
+    def _close_context(self, context):
+        self._context_uses.pop(context, None)
+        try:
+            context.close()
+        except Exception:
+            pass
+
+    def _shutdown(self):
+        for context in self._idle_contexts:
+            self._close_context(context)
+        self._idle_contexts = []
+        try:
+            if self._browser:
+                self._browser.close()
+            if self._playwright:
+                self._playwright.stop()
+        except Exception:
+            pass
+        self._browser = None
+        self._playwright = None
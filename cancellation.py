@@ -0,0 +1,112 @@
+"""
+크롤링 취소 토큰 + 시간 예산
+요청(탭/SSE 연결/작업)마다 토큰 1개를 만들어 크롤러에 넘기면, 크롤러가 단계 사이와
+상세 페이지 방문 사이에 확인해 남은 작업을 건너뛰고 그때까지의 결과를 partial로 반환한다
+
+- cancel(): 클라이언트 연결 끊김, 작업 취소 등 외부에서 중단
+- budget: 토큰 생성 시점부터의 시간 예산(초) - 다 쓰면 자동으로 취소 상태
+- child(): 키워드 1개용 하위 토큰 - 예산은 키워드마다 따로 (크롤링 시작 시 start()부터), 취소는 상위 토큰을 따름
+"""
+
+import os
+import threading
+import time
+from typing import Optional
+
+
+class CrawlCancelled(Exception):
+    """취소/시간 초과로 남은 단계를 건너뛸 때 (크롤러 내부에서 잡아 partial 결과로 변환)"""
+
+
+class CancelToken:
+    """협력적 취소 토큰 (스레드 안전, 여러 키워드가 같은 토큰을 공유해도 됨)"""
+
+    def __init__(self, budget: Optional[float] = None, start: bool = True):
+        self.budget = budget if budget and budget > 0 else None
+        self.deadline = None
+        self._event = threading.Event()
+        self._reason = None
+        self._parent: Optional["CancelToken"] = None
+        self._children = []
+        self._lock = threading.Lock()
+        if start:
+            self.start()
+
+    @classmethod
+    def from_env(cls, budget: Optional[float] = None):
+        """CRAWL_TIME_BUDGET(초, 0이면 무제한) 기본값 - budget을 주면 그 값 우선"""
+        if budget is None:
+            budget = float(os.getenv("CRAWL_TIME_BUDGET", "120"))
+        return cls(budget)
+
+    def child(self, budget: Optional[float] = None) -> "CancelToken":
+        """키워드 1개용 하위 토큰 - budget(기본 CRAWL_TIME_BUDGET)은 start()부터 따로 재고, 이 토큰이 취소되면 같이 취소
+
+        큐에서 기다리는 시간은 예산에 들어가지 않는다 (크롤러가 작업을 시작할 때 start())
+        """
+        if budget is None:
+            budget = float(os.getenv("CRAWL_TIME_BUDGET", "120"))
+        child = CancelToken(budget, start=False)
+        child._parent = self
+        with self._lock:
+            self._children.append(child)
+        if self._event.is_set():
+            child.cancel(self._reason)
+        return child
+
+    def start(self):
+        """예산 시계 시작 (이미 시작했으면 그대로)"""
+        if self.budget and self.deadline is None:
+            self.deadline = time.monotonic() + self.budget
+
+    def cancel(self, reason: str = "cancelled"):
+        if not self._event.is_set():
+            self._reason = reason
+            self._event.set()
+            with self._lock:
+                children, self._children = self._children, []
+            for child in children:
+                child.cancel(reason)
+
+    @property
+    def cancelled(self) -> bool:
+        if self._event.is_set():
+            return True
+        if self._parent is not None and self._parent.cancelled:
+            self.cancel(self._parent._reason)
+            return True
+        if self.deadline is not None and time.monotonic() >= self.deadline:
+            self.cancel("deadline")
+            return True
+        return False
+
+    @property
+    def reason(self) -> Optional[str]:
+        """취소 사유 (cancelled/deadline/client_disconnected 등, 취소 전이면 None)"""
+        return self._reason if self.cancelled else None
+
+    def check(self):
+        """취소됐으면 CrawlCancelled"""
+        if self.cancelled:
+            raise CrawlCancelled(self._reason)
+
+    def wait(self, seconds: float) -> bool:
+        """최대 seconds초 대기 (time.sleep 대신) → 도중에 취소되면 바로 True"""
+        remaining = self.remaining()
+        if remaining is not None and remaining < seconds:
+            self._event.wait(remaining)
+            return self.cancelled
+        return self._event.wait(seconds) or self.cancelled
+
+    def remaining(self) -> Optional[float]:
+        """남은 시간(초) - 예산이 없으면 None"""
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - time.monotonic())
+
+    def timeout_ms(self, default_ms: float) -> float:
+        """대기 timeout을 남은 예산으로 제한 (Playwright의 0은 무제한이므로 최소 1ms)"""
+        remaining = self.remaining()
+        if remaining is None:
+            return default_ms
+        return max(1.0, min(default_ms, remaining * 1000))
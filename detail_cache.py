@@ -0,0 +1,170 @@
+"""
+플레이스 상세 정보 캐시 (플레이스 ID 기준)
+상세 페이지 방문으로 얻은 전화번호 후보와 전체 주소를 필드별 TTL로 보관해
+여러 키워드/여러 날에 걸쳐 같은 업체의 상세 페이지를 다시 열지 않도록 한다
+
+메모리 LRU → SQLite 순서로 조회하며, 필드마다 fetched_at을 따로 기록한다
+"""
+
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+
+DEFAULT_DETAIL_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "naver_place", "details.sqlite3")
+
+# 상세/목록 링크에서 플레이스 ID 추출 (m.place / pcmap.place / map.naver.com 공통)
+PLACE_ID_PATTERN = re.compile(r'/(?:place|restaurant|hospital|hairshop|nailshop|accommodation)/(\d+)')
+
+DAY = 86400
+
+
+def place_id_from_url(url: str) -> str:
+    m = PLACE_ID_PATTERN.search(url or "")
+    return m.group(1) if m else ""
+
+
+class DetailCache:
+    """플레이스 ID → {'phones': [...], 'address': str}
+
+    phones는 선택된 번호가 맨 앞에 오는 후보 목록이다.
+    get()은 TTL이 지난 필드를 None으로 돌려준다.
+    """
+
+    def __init__(self, path: str = DEFAULT_DETAIL_CACHE_PATH, phone_ttl: float = 7 * DAY,
+                 address_ttl: float = 30 * DAY, memory_size: int = 2000, enabled: bool = True):
+        self.path = path
+        self.phone_ttl = phone_ttl
+        self.address_ttl = address_ttl
+        self.memory_size = memory_size
+        self.enabled = enabled
+
+        self._lock = threading.Lock()
+        self._memory: "OrderedDict[str, Dict]" = OrderedDict()
+        self._stats = {"hits": 0, "partial_hits": 0, "misses": 0, "stores": 0}
+        if self.enabled:
+            self._init_db()
+
+    @classmethod
+    def from_env(cls):
+        """환경변수 설정 (DETAIL_CACHE=0이면 비활성화, TTL 단위는 일)"""
+        return cls(
+            path=os.getenv("DETAIL_CACHE_PATH", DEFAULT_DETAIL_CACHE_PATH),
+            phone_ttl=float(os.getenv("DETAIL_CACHE_PHONE_TTL_DAYS", "7")) * DAY,
+            address_ttl=float(os.getenv("DETAIL_CACHE_ADDRESS_TTL_DAYS", "30")) * DAY,
+            memory_size=int(os.getenv("DETAIL_CACHE_MEMORY_SIZE", "2000")),
+            enabled=os.getenv("DETAIL_CACHE", "1") != "0",
+        )
+
+    def get(self, place_id: str) -> Optional[Dict]:
+        """유효한 필드만 담은 dict ({'phones': [...] 또는 None, 'address': str 또는 None}) 또는 None"""
+        if not self.enabled or not place_id:
+            return None
+
+        row = self._read(place_id)
+        now = time.time()
+        phones = row["phones"] if row and row["phones"] and now - row["phones_at"] < self.phone_ttl else None
+        address = row["address"] if row and row["address"] and now - row["address_at"] < self.address_ttl else None
+
+        with self._lock:
+            if phones and address:
+                self._stats["hits"] += 1
+            elif phones or address:
+                self._stats["partial_hits"] += 1
+            else:
+                self._stats["misses"] += 1
+        if not (phones or address):
+            return None
+        return {"phones": phones, "address": address}
+
+    def put(self, place_id: str, phones: Optional[List[str]] = None, address: Optional[str] = None):
+        """상세 페이지에서 얻은 필드만 갱신 (빈 값은 기존 값을 유지)"""
+        if not self.enabled or not place_id:
+            return
+        phones = [p for p in (phones or []) if p]
+        if not phones and not address:
+            return
+
+        now = time.time()
+        row = dict(self._read(place_id) or {"phones": None, "phones_at": 0, "address": None, "address_at": 0})
+        if phones:
+            row["phones"], row["phones_at"] = phones, now
+        if address:
+            row["address"], row["address_at"] = address, now
+
+        with self._lock:
+            with self._connect() as db:
+                db.execute(
+                    "INSERT OR REPLACE INTO details (place_id, phones, phones_at, address, address_at)"
+                    " VALUES (?, ?, ?, ?, ?)",
+                    (place_id, json.dumps(row["phones"], ensure_ascii=False) if row["phones"] else None,
+                     row["phones_at"], row["address"], row["address_at"])
+                )
+            self._remember(place_id, row)
+            self._stats["stores"] += 1
+
+    def stats(self) -> Dict:
+        with self._lock:
+            stats = dict(self._stats)
+            stats["memory_entries"] = len(self._memory)
+        stats["enabled"] = self.enabled
+        return stats
+
+    # ========== 내부 ==========
+
+    def _read(self, place_id: str) -> Optional[Dict]:
+        with self._lock:
+            row = self._memory.get(place_id)
+            if row is not None:
+                self._memory.move_to_end(place_id)
+                return row
+
+            with self._connect() as db:
+                found = db.execute(
+                    "SELECT phones, phones_at, address, address_at FROM details WHERE place_id = ?",
+                    (place_id,)
+                ).fetchone()
+            if found is None:
+                return None
+            phones, phones_at, address, address_at = found
+            row = {
+                "phones": json.loads(phones) if phones else None,
+                "phones_at": phones_at or 0,
+                "address": address,
+                "address_at": address_at or 0,
+            }
+            self._remember(place_id, row)
+            return row
+
+    def _remember(self, place_id: str, row: Dict):
+        # self._lock 안에서 호출
+        self._memory[place_id] = row
+        self._memory.move_to_end(place_id)
+        while len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
+
+    def _init_db(self):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as db:
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS details ("
+                " place_id TEXT PRIMARY KEY, phones TEXT, phones_at REAL,"
+                " address TEXT, address_at REAL)"
+            )
+
+    @contextmanager
+    def _connect(self):
+        db = sqlite3.connect(self.path, timeout=10)
+        try:
+            with db:
+                yield db
+        finally:
+            db.close()
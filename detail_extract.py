@@ -0,0 +1,182 @@
+"""
+상세 페이지 필드 추출 (페이지 안에서 evaluate 1회)
+상세 페이지/frame의 HTML 전체(업체당 ~1MB)를 content()로 CDP 너머 파이썬에 넘겨 정규식으로 훑는 대신
+tel: 링크, 전화번호/주소 셀렉터, __APOLLO_STATE__, HTML 속 번호 후보를 페이지 안에서 읽고
+작은 dict 하나만 돌려받는다 (HTML 전체 전송은 DETAIL_DEBUG_HTML=1일 때만)
+
+결과 예:
+    {
+        'tels': ['tel:070-1234-5678'],       # a[href^="tel:"] href (등장 순, 중복 제거)
+        'phone_texts': ['전화', '070-...'],   # 전화번호 셀렉터별 첫 요소 텍스트 (빈 값 제외)
+        'address': '서울 강남구 ...',          # 주소 셀렉터 첫 텍스트
+        'apollo_phones': ['0507-...'],       # Apollo 상태의 phone/virtualPhone
+        'apollo_address': '서울 강남구 ...',
+        'html_phones': [],                   # 위에서 번호를 못 찾았을 때만 - HTML 속 번호 모양 후보
+        'html_length': 0,                    # HTML을 훑었을 때만 그 길이 (HTML은 전송하지 않음)
+    }
+"""
+
+import os
+from typing import Dict, List, Optional
+
+from phone_numbers import PHONE_CANDIDATE_RE, PhoneNumber, best_phone, find_phones, parse_phone
+
+
+# 1이면 HTML 전체를 받아 점검 - 상세: 파이썬 훑기 결과(html_phones)로 덮어씀, streamlit 목록 frame: 샘플 출력/파일 저장
+DETAIL_DEBUG_HTML = os.getenv("DETAIL_DEBUG_HTML", "0") == "1"
+
+# HTML 속 번호 후보 최대 개수 (대표번호/광고 번호가 수십 개 나오는 페이지 대비)
+MAX_HTML_PHONES = 20
+
+DETAIL_PHONE_SELECTORS = [
+    'a[href^="tel:"]',
+    '.dry6Z',
+    'span.xlx7Q',
+    'span[class*="phone"]',
+    'span[class*="tel"]',
+    'div[class*="phone"]',
+    'div[class*="tel"]',
+    'a.phone',
+    '.contact_number',
+    '[data-phone]',
+    '.phone_number',
+    '.tel_number',
+]
+DETAIL_ADDRESS_SELECTORS = [
+    'span.LDgIH',
+    '.Pb4bU',
+    'div.O8qbU span',
+    '[class*="addr"]',
+    '[class*="address"]',
+]
+
+DETAIL_EXTRACT_SCRIPT = """
+({phoneSelectors, addressSelectors, placeId, phonePattern, maxHtmlPhones}) => {
+    const textOf = (sel) => {
+        let el = null;
+        try { el = document.querySelector(sel); } catch (e) { return ''; }
+        return el ? (el.innerText || el.textContent || '').trim() : '';
+    };
+    const unique = (values) => Array.from(new Set(values.filter(Boolean)));
+
+    const tels = unique(Array.from(document.querySelectorAll('a[href^="tel:"]'), a => a.getAttribute('href')));
+    const phoneTexts = phoneSelectors.map(textOf).filter(Boolean);
+    let address = '';
+    for (const sel of addressSelectors) {
+        address = textOf(sel);
+        if (address) break;
+    }
+
+    // Apollo 상태 - 플레이스 ID를 알면 그 업체 항목만 (없으면 비워 둠 - 다른 업체 번호를 섞지 않음), 모르면 모든 항목
+    const apolloPhones = [];
+    let apolloAddress = '';
+    const state = window.__APOLLO_STATE__ || {};
+    const entries = Object.values(state).filter(v => v && typeof v === 'object');
+    const own = placeId ? entries.filter(v => String(v.id) === String(placeId)) : entries;
+    for (const value of own) {
+        for (const key of ['phone', 'virtualPhone']) {
+            if (typeof value[key] === 'string' && value[key]) apolloPhones.push(value[key]);
+        }
+        apolloAddress = apolloAddress || value.roadAddress || value.fullAddress || value.address || '';
+    }
+
+    // 위에서 번호를 하나도 못 찾았을 때만 HTML을 만들어 페이지 안에서 훑는다 (전송하지 않음)
+    let htmlPhones = [];
+    let htmlLength = 0;
+    if (!tels.length && !phoneTexts.length && !apolloPhones.length) {
+        const html = document.documentElement ? document.documentElement.outerHTML : '';
+        htmlLength = html.length;
+        htmlPhones = unique((html.match(new RegExp(phonePattern, 'g')) || [])).slice(0, maxHtmlPhones);
+    }
+
+    return {
+        tels, phone_texts: phoneTexts, address,
+        apollo_phones: unique(apolloPhones), apollo_address: String(apolloAddress || ''),
+        html_phones: htmlPhones, html_length: htmlLength,
+    };
+}
+"""
+
+
+def build_args(phone_selectors: List[str], address_selectors: List[str], place_id: Optional[str] = None) -> Dict:
+    """evaluate 인자 구성"""
+    return {
+        'phoneSelectors': list(phone_selectors),
+        'addressSelectors': list(address_selectors),
+        'placeId': place_id or None,
+        'phonePattern': PHONE_CANDIDATE_RE.pattern,
+        'maxHtmlPhones': MAX_HTML_PHONES,
+    }
+
+
+def read_detail(page, phone_selectors: List[str] = DETAIL_PHONE_SELECTORS,
+                address_selectors: List[str] = DETAIL_ADDRESS_SELECTORS,
+                place_id: Optional[str] = None, debug: bool = DETAIL_DEBUG_HTML) -> Dict:
+    """sync page/frame → 상세 필드 dict"""
+    detail = _unpack(page.evaluate(DETAIL_EXTRACT_SCRIPT, build_args(phone_selectors, address_selectors, place_id)))
+    if debug:
+        _attach_html(detail, page.content())
+    return detail
+
+
+async def read_detail_async(page, phone_selectors: List[str] = DETAIL_PHONE_SELECTORS,
+                            address_selectors: List[str] = DETAIL_ADDRESS_SELECTORS,
+                            place_id: Optional[str] = None, debug: bool = DETAIL_DEBUG_HTML) -> Dict:
+    """async page/frame 버전"""
+    detail = _unpack(await page.evaluate(DETAIL_EXTRACT_SCRIPT, build_args(phone_selectors, address_selectors, place_id)))
+    if debug:
+        _attach_html(detail, await page.content())
+    return detail
+
+
+def detail_phones(detail: Dict) -> List[PhoneNumber]:
+    """모든 출처의 유효 번호 (tel: 링크 → 셀렉터 → Apollo → HTML 순, 표준 형식 기준 중복 제거)"""
+    found = {}
+    for raw in detail['tels'] + detail['phone_texts'] + detail['apollo_phones'] + detail['html_phones']:
+        phone = parse_phone(raw)
+        if phone is not None and phone.canonical not in found:
+            found[phone.canonical] = phone
+    return list(found.values())
+
+
+def detail_phone(detail: Dict) -> Optional[PhoneNumber]:
+    """출처 순으로 고른 번호 - tel: 링크(첫 유효 번호) → 셀렉터 텍스트 → Apollo/HTML 후보 중 070 우선
+
+    업체 자신의 tel: 링크가 있으면 Apollo/HTML의 070보다 우선 (출처가 확실한 쪽부터)
+    """
+    for raw in detail['tels'] + detail['phone_texts']:
+        phone = parse_phone(raw)
+        if phone is not None:
+            return phone
+    return best_phone(filter(None, map(parse_phone, detail['apollo_phones'] + detail['html_phones'])))
+
+
+def ranked_candidates(detail: Dict) -> List[str]:
+    """고른 번호(detail_phone)를 맨 앞에 둔 표준 형식 후보 목록 (상세 캐시 저장용)"""
+    best = detail_phone(detail)
+    if best is None:
+        return []
+    return [best.canonical] + [p.canonical for p in detail_phones(detail) if p.canonical != best.canonical]
+
+
+def _attach_html(detail: Dict, html: str):
+    """디버그 - HTML 전체를 파이썬에서 훑은 번호로 html_phones를 덮어쓰고 페이지 안 결과와 비교 출력"""
+    scanned = [phone.canonical for phone in find_phones(html)]
+    in_page = {phone.canonical for phone in detail_phones(detail)}
+    missing = [phone for phone in scanned if phone not in in_page]
+    print(f"    📝 상세 HTML {len(html):,}자 (디버그) - 번호 후보 {scanned}"
+          + (f", 페이지 안 추출에 없음: {missing}" if missing else ""))
+    detail['html_phones'] = scanned
+
+
+def _unpack(result: Optional[Dict]) -> Dict:
+    result = result or {}
+    return {
+        'tels': result.get('tels') or [],
+        'phone_texts': result.get('phone_texts') or [],
+        'address': result.get('address') or "",
+        'apollo_phones': result.get('apollo_phones') or [],
+        'apollo_address': result.get('apollo_address') or "",
+        'html_phones': result.get('html_phones') or [],
+        'html_length': result.get('html_length') or 0,
+    }
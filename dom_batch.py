@@ -0,0 +1,93 @@
+"""
+일괄 DOM 추출
+셀렉터 설정을 page.evaluate 1회로 보내 모든 아이템의 필드를 페이지 안에서 읽고
+파이썬 dict 목록으로 돌려받는다 (아이템·셀렉터마다 query_selector/inner_text를
+왕복하지 않음)
+
+필드 설정 예:
+    {
+        'name': {'selectors': ['.YwYLL', 'strong']},                  # 첫 번째 비어있지 않은 innerText
+        'address': {'selectors': ['.addr'], 'min_length': 6, 'reject': ['-']},
+        'image_url': {'selectors': ['img'], 'attrs': ['src', 'data-src']},  # 첫 요소의 속성
+    }
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+
+BATCH_EXTRACT_SCRIPT = """
+({itemSelectors, fields, limit, includeHtml}) => {
+    let items = [];
+    let used = '';
+    for (const sel of itemSelectors) {
+        let found = [];
+        try { found = Array.from(document.querySelectorAll(sel)); } catch (e) { continue; }
+        if (found.length) { items = found; used = sel; break; }
+    }
+
+    const readField = (root, spec) => {
+        for (const sel of spec.selectors) {
+            let el = null;
+            try { el = root.querySelector(sel); } catch (e) { continue; }
+            if (!el) continue;
+            if (spec.attrs) {
+                // 속성 모드: 첫 번째로 찾은 요소의 속성만 확인
+                for (const attr of spec.attrs) {
+                    const value = el.getAttribute(attr);
+                    if (value) return value;
+                }
+                return '';
+            }
+            const text = (el.innerText || '').trim();
+            if (text && text.length >= spec.minLength && !spec.reject.includes(text)) return text;
+        }
+        return '';
+    };
+
+    const rows = items.slice(0, limit).map(item => {
+        const row = {};
+        for (const [name, spec] of Object.entries(fields)) row[name] = readField(item, spec);
+        if (includeHtml) row.html = item.innerHTML;
+        return row;
+    });
+    return {selector: used, count: items.length, items: rows};
+}
+"""
+
+
+def build_args(item_selectors: List[str], fields: Dict[str, Dict], limit: int,
+               include_html: bool = False) -> Dict:
+    """evaluate 인자 구성 (필드 설정 기본값 채움)"""
+    return {
+        'itemSelectors': list(item_selectors),
+        'fields': {
+            name: {
+                'selectors': list(spec['selectors']),
+                'attrs': list(spec['attrs']) if spec.get('attrs') else None,
+                'minLength': spec.get('min_length', 0),
+                'reject': list(spec.get('reject', ())),
+            }
+            for name, spec in fields.items()
+        },
+        'limit': limit,
+        'includeHtml': include_html,
+    }
+
+
+def extract_items(page, item_selectors: List[str], fields: Dict[str, Dict], limit: int,
+                  include_html: bool = False) -> Tuple[str, int, List[Dict]]:
+    """sync page/frame → (사용된 아이템 셀렉터, 전체 아이템 수, 필드 dict 목록)"""
+    result = page.evaluate(BATCH_EXTRACT_SCRIPT, build_args(item_selectors, fields, limit, include_html))
+    return _unpack(result)
+
+
+async def extract_items_async(page, item_selectors: List[str], fields: Dict[str, Dict], limit: int,
+                              include_html: bool = False) -> Tuple[str, int, List[Dict]]:
+    """async page/frame 버전"""
+    result = await page.evaluate(BATCH_EXTRACT_SCRIPT, build_args(item_selectors, fields, limit, include_html))
+    return _unpack(result)
+
+
+def _unpack(result: Optional[Dict]) -> Tuple[str, int, List[Dict]]:
+    result = result or {}
+    return result.get('selector', ""), result.get('count', 0), result.get('items') or []
@@ -0,0 +1,418 @@
+"""
+비동기 크롤링 작업(Job) 큐
+POST 요청은 작업 ID만 바로 돌려주고, 고정 개수의 워커 스레드가 키워드 단위로 처리한다
+
+- 스케줄링: 우선순위(high > normal > batch) → 같은 우선순위 안에서는 사용자별 라운드로빈
+  (한 사용자의 대량 작업이 다른 사용자의 키워드를 뒤로 밀지 않음)
+- 저장: 작업/키워드별 결과를 SQLite에 기록 → 클라이언트 재접속, 서버 재시작 후 이어서 처리
+- 조회: 결과는 키워드 순서로 이어 붙여 offset/limit 페이지 단위로 반환
+- 취소: 대기 중인 키워드는 건너뛰고, 실행 중인 키워드는 취소 토큰으로 중단 (부분 결과는 partial)
+"""
+
+import json
+import os
+import queue
+import sqlite3
+import threading
+import time
+import uuid
+from collections import OrderedDict, deque
+from concurrent.futures import Future
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional
+
+from cancellation import CancelToken
+
+
+DEFAULT_JOB_DB_PATH = os.path.join(os.path.expanduser("~"), ".cache", "naver_place", "jobs.sqlite3")
+
+# 숫자가 작을수록 먼저 처리
+PRIORITIES = {"high": 0, "normal": 1, "batch": 2}
+
+DAY = 86400
+
+
+class FairScheduler:
+    """우선순위별 → 사용자별 라운드로빈 → 사용자 안에서는 FIFO"""
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._queues = {level: OrderedDict() for level in sorted(PRIORITIES.values())}
+        self._size = 0
+
+    def put(self, priority: str, user: str, task):
+        level = PRIORITIES.get(priority, PRIORITIES["normal"])
+        with self._cond:
+            self._queues[level].setdefault(user, deque()).append(task)
+            self._size += 1
+            self._cond.notify()
+
+    def get(self, timeout: Optional[float] = None):
+        """다음 작업 (timeout 동안 없으면 queue.Empty)"""
+        with self._cond:
+            if not self._cond.wait_for(lambda: self._size > 0, timeout):
+                raise queue.Empty
+            for users in self._queues.values():
+                if not users:
+                    continue
+                user, tasks = next(iter(users.items()))
+                task = tasks.popleft()
+                # 방금 처리한 사용자는 맨 뒤로 (남은 작업이 없으면 제거)
+                del users[user]
+                if tasks:
+                    users[user] = tasks
+                self._size -= 1
+                return task
+        raise queue.Empty
+
+    def __len__(self):
+        with self._cond:
+            return self._size
+
+
+class JobStore:
+    """작업 상태/결과 저장 (SQLite, 작업마다 새 연결)"""
+
+    def __init__(self, path: str = DEFAULT_JOB_DB_PATH, retention: float = 7 * DAY):
+        self.path = path
+        self.retention = retention
+        self._lock = threading.Lock()
+        self._init_db()
+
+    def create(self, job_id: str, keywords: List[str], max_results: int, user: str,
+               priority: str, bypass_cache: bool):
+        now = time.time()
+        with self._lock, self._connect() as db:
+            db.execute(
+                "INSERT INTO jobs (id, user, priority, status, total, max_results, bypass_cache, created_at)"
+                " VALUES (?, ?, ?, 'queued', ?, ?, ?, ?)",
+                (job_id, user, priority, len(keywords), max_results, int(bypass_cache), now)
+            )
+            db.executemany(
+                "INSERT INTO job_keywords (job_id, idx, keyword, status) VALUES (?, ?, ?, 'queued')",
+                [(job_id, idx, keyword) for idx, keyword in enumerate(keywords)]
+            )
+
+    def start_keyword(self, job_id: str, idx: int) -> bool:
+        """키워드 실행 시작 표시 → 취소 등으로 더 이상 대기 상태가 아니면 False"""
+        now = time.time()
+        with self._lock, self._connect() as db:
+            started = db.execute(
+                "UPDATE job_keywords SET status = 'running' WHERE job_id = ? AND idx = ? AND status = 'queued'",
+                (job_id, idx)
+            ).rowcount
+            if started:
+                db.execute(
+                    "UPDATE jobs SET status = 'running', started_at = COALESCE(started_at, ?)"
+                    " WHERE id = ? AND status = 'queued'",
+                    (now, job_id)
+                )
+            return bool(started)
+
+    def finish_keyword(self, job_id: str, idx: int, results: Optional[List[Dict]] = None,
+                       timing: Optional[Dict] = None, error: Optional[str] = None,
+                       partial: bool = False) -> Optional[str]:
+        """키워드 결과 기록 → 작업의 마지막 키워드였으면 작업 최종 상태('done'/'cancelled'), 아니면 None"""
+        now = time.time()
+        status = "error" if error else "partial" if partial else "done"
+        with self._lock, self._connect() as db:
+            db.execute(
+                "UPDATE job_keywords SET status = ?, result_count = ?, results = ?, timing = ?, error = ?,"
+                " finished_at = ? WHERE job_id = ? AND idx = ?",
+                (status, len(results or []),
+                 json.dumps(results or [], ensure_ascii=False),
+                 json.dumps(timing, ensure_ascii=False) if timing else None,
+                 error, now, job_id, idx)
+            )
+            remaining = db.execute(
+                "SELECT COUNT(*) FROM job_keywords WHERE job_id = ? AND status IN ('queued', 'running')", (job_id,)
+            ).fetchone()[0]
+            if remaining:
+                return None
+            done = db.execute(
+                "UPDATE jobs SET status = 'done', finished_at = ? WHERE id = ? AND status != 'cancelled'",
+                (now, job_id)
+            ).rowcount
+            return "done" if done else "cancelled"
+
+    def cancel(self, job_id: str) -> bool:
+        """대기 중인 키워드 취소 → 진행 중이던 작업이면 True (실행 중인 키워드는 호출자가 중단)"""
+        now = time.time()
+        with self._lock, self._connect() as db:
+            db.execute(
+                "UPDATE job_keywords SET status = 'cancelled', finished_at = ? WHERE job_id = ? AND status = 'queued'",
+                (now, job_id)
+            )
+            return bool(db.execute(
+                "UPDATE jobs SET status = 'cancelled', finished_at = ? WHERE id = ? AND status IN ('queued', 'running')",
+                (now, job_id)
+            ).rowcount)
+
+    def get(self, job_id: str, offset: int = 0, limit: int = 100) -> Optional[Dict]:
+        """작업 상태 + 결과 페이지 (키워드 순서로 이어 붙인 행 기준 offset/limit)"""
+        with self._connect() as db:
+            job = db.execute(
+                "SELECT id, user, priority, status, total, max_results, created_at, started_at, finished_at"
+                " FROM jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+            if job is None:
+                return None
+            keywords = db.execute(
+                "SELECT idx, keyword, status, result_count, error, timing FROM job_keywords"
+                " WHERE job_id = ? ORDER BY idx", (job_id,)
+            ).fetchall()
+
+            # 페이지에 걸치는 키워드 행만 결과 JSON을 읽음
+            page, position = [], 0
+            for idx, keyword, status, count, _, _ in keywords:
+                count = count or 0
+                if count and position + count > offset and len(page) < limit:
+                    rows = json.loads(db.execute(
+                        "SELECT results FROM job_keywords WHERE job_id = ? AND idx = ?", (job_id, idx)
+                    ).fetchone()[0] or "[]")
+                    start = max(0, offset - position)
+                    page.extend(rows[start:start + limit - len(page)])
+                position += count
+
+        (job_id, user, priority, status, total, max_results, created_at, started_at, finished_at) = job
+        finished = [k for k in keywords if k[2] not in ("queued", "running")]
+        next_offset = offset + len(page)
+        return {
+            "job_id": job_id,
+            "user": user,
+            "priority": priority,
+            "status": status,
+            "max_results": max_results,
+            "created_at": created_at,
+            "started_at": started_at,
+            "finished_at": finished_at,
+            "progress": {
+                "total": total,
+                "finished": len(finished),
+                "failed": sum(1 for k in keywords if k[2] == "error"),
+                "partial": sum(1 for k in keywords if k[2] == "partial"),
+                "cancelled": sum(1 for k in keywords if k[2] == "cancelled"),
+            },
+            "keywords": [
+                {
+                    "keyword": keyword,
+                    "status": kw_status,
+                    "count": count or 0,
+                    **({"error": error} if error else {}),
+                    **({"timing": json.loads(timing)} if timing else {}),
+                }
+                for _, keyword, kw_status, count, error, timing in keywords
+            ],
+            "total_count": position,
+            "offset": offset,
+            "results": page,
+            "next_offset": next_offset if next_offset < position else None,
+        }
+
+    def list_jobs(self, user: Optional[str] = None, limit: int = 20) -> List[Dict]:
+        """최근 작업 목록 (재접속용)"""
+        query = "SELECT id, user, priority, status, total, created_at, finished_at FROM jobs"
+        args = ()
+        if user is not None:
+            query += " WHERE user = ?"
+            args = (user,)
+        with self._connect() as db:
+            rows = db.execute(query + " ORDER BY created_at DESC LIMIT ?", args + (limit,)).fetchall()
+        return [
+            dict(zip(("job_id", "user", "priority", "status", "total", "created_at", "finished_at"), row))
+            for row in rows
+        ]
+
+    def unfinished(self) -> List[Dict]:
+        """재시작 시 이어서 처리할 키워드 (작업 생성 순서)"""
+        with self._connect() as db:
+            rows = db.execute(
+                "SELECT j.id, j.user, j.priority, j.max_results, j.bypass_cache, k.idx, k.keyword"
+                " FROM jobs j JOIN job_keywords k ON k.job_id = j.id"
+                " WHERE k.status = 'queued' ORDER BY j.created_at, k.idx"
+            ).fetchall()
+        return [
+            dict(zip(("job_id", "user", "priority", "max_results", "bypass_cache", "idx", "keyword"), row))
+            for row in rows
+        ]
+
+    # ========== 내부 ==========
+
+    def _init_db(self):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as db:
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS jobs ("
+                " id TEXT PRIMARY KEY, user TEXT NOT NULL, priority TEXT NOT NULL, status TEXT NOT NULL,"
+                " total INTEGER NOT NULL, max_results INTEGER NOT NULL, bypass_cache INTEGER NOT NULL,"
+                " created_at REAL NOT NULL, started_at REAL, finished_at REAL)"
+            )
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS job_keywords ("
+                " job_id TEXT NOT NULL, idx INTEGER NOT NULL, keyword TEXT NOT NULL, status TEXT NOT NULL,"
+                " result_count INTEGER, results TEXT, timing TEXT, error TEXT, finished_at REAL,"
+                " PRIMARY KEY (job_id, idx))"
+            )
+            db.execute("CREATE INDEX IF NOT EXISTS jobs_user ON jobs (user, created_at)")
+            # 이전 실행이 처리 도중 종료된 키워드는 다시 대기 상태로
+            db.execute("UPDATE job_keywords SET status = 'queued' WHERE status = 'running'")
+            # 보관 기간이 지난 완료/취소 작업 정리
+            cutoff = time.time() - self.retention
+            db.execute(
+                "DELETE FROM job_keywords WHERE job_id IN"
+                " (SELECT id FROM jobs WHERE status IN ('done', 'cancelled') AND finished_at < ?)", (cutoff,)
+            )
+            db.execute("DELETE FROM jobs WHERE status IN ('done', 'cancelled') AND finished_at < ?", (cutoff,))
+
+    @contextmanager
+    def _connect(self):
+        db = sqlite3.connect(self.path, timeout=10)
+        try:
+            with db:
+                yield db
+        finally:
+            db.close()
+
+
+class JobManager:
+    """작업 접수 + 워커 스레드 풀
+
+    crawl(keyword, max_results, bypass_cache, token)은 결과 목록 Future를 반환하는 함수
+    (Flask 서버에서는 결과 캐시 → 브라우저 서비스 경로). 워커 수만큼만 동시에
+    브라우저 서비스에 넣으므로 대기 순서는 이 스케줄러가 정한다.
+    키워드마다 keyword_budget(초) 시간 예산의 취소 토큰을 새로 만든다.
+    """
+
+    def __init__(self, crawl: Callable[[str, int, bool, CancelToken], Future], store: Optional[JobStore] = None,
+                 workers: int = 3, max_keywords: int = 500, keyword_budget: Optional[float] = None):
+        self.crawl = crawl
+        self.store = store or JobStore()
+        self.workers = max(1, workers)
+        self.max_keywords = max_keywords
+        self.keyword_budget = keyword_budget
+
+        self._scheduler = FairScheduler()
+        self._lock = threading.Lock()
+        self._threads = []
+        self._running = 0
+        self._tokens: Dict[str, Dict[int, CancelToken]] = {}  # 작업별 실행 중인 키워드 토큰
+
+    @classmethod
+    def from_env(cls, crawl: Callable[[str, int, bool, CancelToken], Future], workers: int = 3):
+        """환경변수 설정 (JOB_DB_PATH, JOB_WORKERS, JOB_MAX_KEYWORDS, JOB_RETENTION_DAYS, CRAWL_TIME_BUDGET)"""
+        store = JobStore(
+            path=os.getenv("JOB_DB_PATH", DEFAULT_JOB_DB_PATH),
+            retention=float(os.getenv("JOB_RETENTION_DAYS", "7")) * DAY,
+        )
+        return cls(
+            crawl, store,
+            workers=int(os.getenv("JOB_WORKERS", str(workers))),
+            max_keywords=int(os.getenv("JOB_MAX_KEYWORDS", "500")),
+            keyword_budget=float(os.getenv("CRAWL_TIME_BUDGET", "120")),
+        )
+
+    def start(self):
+        """워커 시작 + 이전 실행에서 끝나지 않은 키워드 다시 대기열에 넣기 (한 번만)"""
+        with self._lock:
+            if self._threads:
+                return
+            for i in range(self.workers):
+                thread = threading.Thread(target=self._serve, name=f"job-worker-{i}", daemon=True)
+                thread.start()
+                self._threads.append(thread)
+
+        pending = self.store.unfinished()
+        for task in pending:
+            self._scheduler.put(task["priority"], task["user"], task)
+        if pending:
+            print(f"♻️ 미완료 작업 키워드 {len(pending)}개 재개")
+
+    def submit(self, keywords: List[str], max_results: int, user: str = "anonymous",
+               priority: Optional[str] = None, bypass_cache: bool = False) -> str:
+        """작업 등록 → 작업 ID (우선순위 미지정 시 대량 작업은 batch)"""
+        if not keywords:
+            raise ValueError("키워드를 입력해주세요.")
+        if len(keywords) > self.max_keywords:
+            raise ValueError(f"키워드가 너무 많습니다. ({len(keywords)}개) 최대 {self.max_keywords}개까지 가능합니다.")
+        if priority is None:
+            priority = "normal" if len(keywords) <= 10 else "batch"
+        if priority not in PRIORITIES:
+            raise ValueError(f"알 수 없는 우선순위: {priority} ({', '.join(PRIORITIES)})")
+
+        self.start()
+        job_id = uuid.uuid4().hex
+        self.store.create(job_id, keywords, max_results, user, priority, bypass_cache)
+        for idx, keyword in enumerate(keywords):
+            self._scheduler.put(priority, user, {
+                "job_id": job_id, "idx": idx, "keyword": keyword,
+                "max_results": max_results, "bypass_cache": bypass_cache,
+            })
+        return job_id
+
+    def get(self, job_id: str, offset: int = 0, limit: int = 100) -> Optional[Dict]:
+        return self.store.get(job_id, offset, limit)
+
+    def cancel(self, job_id: str) -> bool:
+        """작업 취소 - 대기 키워드는 건너뛰고 실행 중인 키워드는 부분 결과로 마무리"""
+        cancelled = self.store.cancel(job_id)
+        with self._lock:
+            tokens = list(self._tokens.get(job_id, {}).values())
+        for token in tokens:
+            token.cancel("job_cancelled")
+        if cancelled:
+            print(f"⏹ 작업 {job_id[:8]} 취소 (실행 중 키워드 {len(tokens)}개 중단)")
+        return cancelled
+
+    def list_jobs(self, user: Optional[str] = None, limit: int = 20) -> List[Dict]:
+        return self.store.list_jobs(user, limit)
+
+    def stats(self) -> Dict:
+        with self._lock:
+            running = self._running
+        return {"workers": self.workers, "running": running, "queued": len(self._scheduler)}
+
+    # ========== 워커 ==========
+
+    def _serve(self):
+        while True:
+            try:
+                task = self._scheduler.get(timeout=5)
+            except queue.Empty:
+                continue
+            with self._lock:
+                self._running += 1
+            try:
+                self._run(task)
+            finally:
+                with self._lock:
+                    self._running -= 1
+
+    def _run(self, task: Dict):
+        job_id, idx, keyword = task["job_id"], task["idx"], task["keyword"]
+        if not self.store.start_keyword(job_id, idx):
+            return  # 취소된 작업
+
+        token = CancelToken(self.keyword_budget)
+        with self._lock:
+            self._tokens.setdefault(job_id, {})[idx] = token
+        try:
+            results = self.crawl(keyword, task["max_results"], bool(task["bypass_cache"]), token).result()
+            rows = [dict(r, keyword=keyword) for r in results]
+            partial = getattr(results, "partial", False)
+            finished = self.store.finish_keyword(job_id, idx, rows, getattr(results, "timing", None), partial=partial)
+            print(f"✅ 작업 {job_id[:8]} '{keyword}' 완료: {len(rows)}개" + (" (부분 결과)" if partial else ""))
+        except Exception as e:
+            finished = self.store.finish_keyword(job_id, idx, error=str(e))
+            print(f"❌ 작업 {job_id[:8]} '{keyword}' 실패: {e}")
+        finally:
+            with self._lock:
+                tokens = self._tokens.get(job_id, {})
+                tokens.pop(idx, None)
+                if not tokens:
+                    self._tokens.pop(job_id, None)
+        if finished == "done":
+            print(f"🎉 작업 {job_id[:8]} 전체 완료")
+        elif finished == "cancelled":
+            print(f"⏹ 작업 {job_id[:8]} 취소됨 - 실행 중이던 키워드까지 정리 완료")
@@ -0,0 +1,360 @@
+"""
+키워드 지역 ↔ 업체 좌표 일치 확인
+역/상권/구/시 중심 좌표 사전(오프라인)에서 키워드 속 지명을 찾고, Apollo 상태에 이미 들어 있는
+업체 좌표(x/y, Panorama lat/lon)와의 거리를 계산해 멀리 떨어진 업체를 타지역업체로 표시한다
+
+- 지명 찾기: 이름/약칭 전체를 긴 이름 우선 정규식 1개로 컴파일 (강남역 > 강남)
+  단어 첫머리에서만 ("모유수유" ≠ 수유), 뒤는 붙여 쓴 키워드도 허용 ("강남맛집") - 지명으로 시작하는 흔한 낱말은 예외 목록으로 ("상수도" ≠ 상수)
+- 격자 색인: 위경도 격자(기본 0.02° ≈ 2km)별 지명 목록 - 업체 좌표에서 가장 가까운 지명 조회
+- 반경: 지명 종류별 (역/상권 3km, 역 약칭·구 5km, 시 15km) × LANDMARK_FAR_FACTOR(기본 1.0)
+  "강남"처럼 역 이름에서 "역"을 뗀 약칭은 역 앞이 아니라 동네 전체를 가리키므로 구 수준 반경
+"""
+
+import math
+import os
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+
+EARTH_RADIUS_KM = 6371.0088
+
+# 종류별 "키워드 지역" 반경 (km) - 이보다 멀면 타지역
+KIND_RADIUS_KM = {
+    "station": 3.0,    # 역/상권
+    "area": 5.0,       # 역/상권 약칭 (강남, 홍대 - 동네 전체)
+    "district": 5.0,   # 자치구/행정구
+    "city": 15.0,      # 시
+}
+
+KIND_ORDER = ("station", "area", "district", "city")
+
+# 지명 앞 경계 - 한글/영숫자가 아닌 글자 또는 문자열 시작 (뒤는 붙여 쓴 키워드가 흔해서 경계 없음)
+NAME_START = r"(?<![가-힣A-Za-z0-9])"
+
+# 약칭 뒤에 이어지면 지명이 아닌 낱말이 되는 글자 (상수도, 수유실, 교대근무, 성수기 ...)
+NOT_A_PLACE_AFTER = {
+    "상수": ("도",),
+    "수유": ("실", "등", "쿠션", "브라", "패드", "시트"),
+    "교대": ("근무", "제"),
+    "시청": ("률", "자"),
+    "성수": ("기",),
+    "미사": ("용",),
+    "가산": ("점", "세"),
+    "대구": ("탕", "뽈"),
+    "일산": ("화",),
+}
+
+# 종류별 "이름|약칭 위도 경도" (약칭은 키워드에서 흔히 쓰는 형태)
+LANDMARK_TABLE = {
+    "station": """
+        강남역|강남 37.4979 127.0276
+        역삼역|역삼 37.5007 127.0365
+        선릉역|선릉 37.5045 127.0490
+        삼성역|코엑스 37.5088 127.0631
+        신논현역|신논현 37.5045 127.0250
+        논현역|논현 37.5110 127.0214
+        신사역|가로수길 37.5163 127.0203
+        압구정역|압구정 37.5270 127.0284
+        압구정로데오 37.5273 127.0405
+        청담역|청담 37.5193 127.0537
+        교대역|교대 37.4934 127.0140
+        서초역 37.4918 127.0076
+        양재역|양재 37.4846 127.0343
+        사당역|사당 37.4765 126.9816
+        방배역|방배 37.4815 126.9976
+        고속터미널|반포 37.5049 127.0049
+        잠실역|잠실 37.5133 127.1001
+        석촌역|석촌 37.5054 127.1069
+        문정역|문정 37.4858 127.1225
+        가락시장 37.4925 127.1182
+        천호역|천호 37.5386 127.1236
+        건대입구역|건대입구|건대 37.5404 127.0692
+        성수역|성수 37.5446 127.0557
+        서울숲 37.5444 127.0374
+        왕십리역|왕십리 37.5612 127.0371
+        혜화역|대학로|혜화 37.5822 127.0019
+        동대문역사문화공원|동대문 37.5656 127.0079
+        을지로입구|을지로 37.5660 126.9826
+        종각역|종로|종각 37.5702 126.9830
+        광화문역|광화문 37.5714 126.9768
+        시청역|시청 37.5657 126.9769
+        명동역|명동 37.5609 126.9863
+        남대문시장|남대문 37.5592 126.9776
+        서울역 37.5547 126.9707
+        용산역|용산 37.5299 126.9648
+        이태원역|이태원 37.5345 126.9946
+        한남동|한남 37.5294 127.0093
+        공덕역|공덕 37.5443 126.9517
+        홍대입구역|홍대입구|홍대 37.5572 126.9245
+        합정역|합정 37.5495 126.9139
+        상수역|상수 37.5477 126.9229
+        망원역|망원 37.5561 126.9102
+        연남동|연남 37.5620 126.9230
+        신촌역|신촌 37.5552 126.9368
+        이대역|이대 37.5568 126.9463
+        여의도역|여의도 37.5216 126.9242
+        영등포역|영등포 37.5157 126.9076
+        당산역|당산 37.5343 126.9024
+        목동역|목동 37.5262 126.8750
+        마곡역|마곡 37.5601 126.8254
+        김포공항 37.5624 126.8013
+        신림역|신림 37.4842 126.9297
+        서울대입구역|서울대입구 37.4812 126.9527
+        노량진역|노량진 37.5133 126.9424
+        구로디지털단지역|구로디지털단지|구디 37.4852 126.9015
+        가산디지털단지역|가산디지털단지|가산 37.4816 126.8827
+        신도림역|신도림 37.5089 126.8913
+        노원역 37.6551 127.0613
+        수유역|수유 37.6380 127.0257
+        성신여대입구역|성신여대 37.5926 127.0164
+        연신내역|연신내 37.6190 126.9210
+        청량리역|청량리 37.5800 127.0473
+        상봉역|상봉 37.5967 127.0853
+        판교역|판교 37.3947 127.1112
+        서현역|서현 37.3850 127.1234
+        정자역|정자동 37.3670 127.1085
+        수원역 37.2664 126.9998
+        인계동 37.2660 127.0311
+        광교 37.2886 127.0513
+        동탄역|동탄 37.2005 127.0955
+        정발산역|일산 37.6584 126.7700
+        킨텍스 37.6688 126.7454
+        범계역|범계 37.3899 126.9507
+        평촌역|평촌 37.3943 126.9639
+        미사역|미사 37.5633 127.1929
+        부평역|부평 37.4895 126.7245
+        구월동 37.4486 126.7052
+        송도 37.3894 126.6477
+        주안역|주안 37.4648 126.6803
+        인천공항 37.4602 126.4407
+        서면역|서면 35.1578 129.0600
+        해운대역|해운대 35.1631 129.1635
+        광안리 35.1532 129.1186
+        남포동 35.0978 129.0323
+        부산역 35.1151 129.0422
+        동성로 35.8690 128.5960
+        반월당 35.8657 128.5934
+        둔산동|둔산 36.3515 127.3785
+        대전역 36.3324 127.4344
+        상무지구 35.1524 126.8533
+        충장로 35.1485 126.9150
+        삼산동 35.5388 129.3395
+        전주한옥마을 35.8150 127.1530
+        상남동 35.2225 128.6810
+    """,
+    "district": """
+        강남구 37.5172 127.0473
+        서초구 37.4837 127.0324
+        송파구 37.5145 127.1059
+        강동구 37.5301 127.1238
+        마포구 37.5663 126.9019
+        용산구 37.5326 126.9905
+        종로구 37.5735 126.9790
+        성동구 37.5634 127.0369
+        광진구 37.5385 127.0823
+        영등포구 37.5264 126.8962
+        관악구 37.4784 126.9516
+        동작구 37.5124 126.9393
+        구로구 37.4955 126.8875
+        금천구 37.4569 126.8955
+        양천구 37.5170 126.8665
+        은평구 37.6027 126.9291
+        서대문구 37.5791 126.9368
+        성북구 37.5894 127.0167
+        동대문구 37.5744 127.0400
+        중랑구 37.6066 127.0925
+        노원구 37.6542 127.0568
+        도봉구 37.6688 127.0471
+        강북구 37.6396 127.0257
+        분당구|분당 37.3827 127.1189
+        수지구|수지 37.3222 127.0975
+        기흥구|기흥 37.2751 127.1159
+        일산동구 37.6585 126.7750
+        일산서구 37.6752 126.7507
+        해운대구 35.1631 129.1635
+        수성구 35.8582 128.6306
+        유성구 36.3624 127.3562
+        미추홀구 37.4636 126.6502
+        연수구 37.4101 126.6783
+        남동구 37.4470 126.7313
+    """,
+    "city": """
+        서울 37.5665 126.9780
+        수원시|수원 37.2636 127.0286
+        성남시|성남 37.4200 127.1265
+        용인시|용인 37.2411 127.1776
+        고양시|고양 37.6584 126.8320
+        부천시|부천 37.5034 126.7660
+        안산시|안산 37.3219 126.8309
+        안양시|안양 37.3943 126.9568
+        화성시|화성 37.1996 126.8312
+        평택시|평택 36.9921 127.1129
+        남양주시|남양주 37.6360 127.2165
+        파주시|파주 37.7600 126.7800
+        김포시|김포 37.6153 126.7156
+        의정부시|의정부 37.7380 127.0337
+        시흥시|시흥 37.3800 126.8029
+        광명시|광명 37.4786 126.8646
+        하남시|하남 37.5393 127.2149
+        구리시|구리 37.5943 127.1296
+        오산시|오산 37.1498 127.0772
+        이천시|이천 37.2720 127.4350
+        인천 37.4563 126.7052
+        부산 35.1796 129.0756
+        대구 35.8714 128.6014
+        대전 36.3504 127.3845
+        광주광역시 35.1595 126.8526
+        울산 35.5384 129.3114
+        세종시|세종 36.4800 127.2890
+        청주시|청주 36.6424 127.4890
+        천안시|천안 36.8151 127.1139
+        전주시|전주 35.8242 127.1480
+        창원시|창원 35.2280 128.6811
+        김해시|김해 35.2285 128.8894
+        포항시|포항 36.0190 129.3435
+        제주시|제주 33.4996 126.5312
+        서귀포시|서귀포 33.2541 126.5600
+    """,
+}
+
+
+@dataclass(frozen=True)
+class Landmark:
+    name: str
+    latitude: float
+    longitude: float
+    kind: str
+
+    @property
+    def radius_km(self) -> float:
+        return KIND_RADIUS_KM.get(self.kind, KIND_RADIUS_KM["station"])
+
+
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    p1, p2 = math.radians(lat1), math.radians(lat2)
+    dp, dl = p2 - p1, math.radians(lon2 - lon1)
+    a = math.sin(dp / 2) ** 2 + math.cos(p1) * math.cos(p2) * math.sin(dl / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
+
+def parse_table(table: Dict[str, str]) -> Tuple[List[Landmark], Dict[str, Landmark]]:
+    """LANDMARK_TABLE 형식 → (지명 목록, 이름/약칭 → 지명)"""
+    landmarks, names = [], {}
+    for kind, text in table.items():
+        for line in text.strip().splitlines():
+            label, lat, lon = line.split()
+            aliases = label.split("|")
+            landmark = Landmark(aliases[0], float(lat), float(lon), kind)
+            landmarks.append(landmark)
+            # 역 약칭은 동네 전체 - 같은 좌표, 구 수준 반경 (격자 색인에는 넣지 않음)
+            area = Landmark(aliases[0], landmark.latitude, landmark.longitude, "area") if kind == "station" else landmark
+            for i, alias in enumerate(aliases):
+                # 같은 약칭이 여러 번 나오면 먼저 나온 (더 좁은) 지명 우선
+                names.setdefault(alias, landmark if i == 0 else area)
+    return landmarks, names
+
+
+class LandmarkIndex:
+    """지명 사전 + 위경도 격자 색인"""
+
+    def __init__(self, table: Dict[str, str] = LANDMARK_TABLE, cell_deg: float = 0.02, far_factor: float = 1.0):
+        self.cell_deg = cell_deg
+        self.far_factor = far_factor
+        self.landmarks, self._names = parse_table(table)
+        # 긴 이름 우선 - 같은 위치에서 시작하면 "강남역"이 "강남"보다 먼저 맞음
+        # 예외 목록의 글자가 뒤따르면 그 약칭은 건너뜀 ("상수도 공사" → 없음, "상수동 카페" → 상수역)
+        self._pattern = re.compile(NAME_START + "(?:" + "|".join(
+            re.escape(name) + _not_followed_by(NOT_A_PLACE_AFTER.get(name, ()))
+            for name in sorted(self._names, key=len, reverse=True)
+        ) + ")")
+        self._grid: Dict[Tuple[int, int], List[Landmark]] = {}
+        for landmark in self.landmarks:
+            self._grid.setdefault(self._cell(landmark.latitude, landmark.longitude), []).append(landmark)
+        self._find = lru_cache(maxsize=1024)(self._find_uncached)
+
+    @classmethod
+    def from_env(cls):
+        """환경변수 설정 (LANDMARK_FAR_FACTOR=반경 배율)"""
+        return cls(far_factor=float(os.getenv("LANDMARK_FAR_FACTOR", "1.0")))
+
+    # ========== 키워드 → 지명 ==========
+
+    def find_in_keyword(self, keyword: str) -> Optional[Landmark]:
+        """키워드 속 지명 - 여러 개면 가장 좁은 종류 ("서울 강남역 맛집" → 강남역), 없으면 None"""
+        return self._find(keyword or "")
+
+    def _find_uncached(self, keyword: str) -> Optional[Landmark]:
+        found = [self._names[match.group()] for match in self._pattern.finditer(keyword)]
+        if not found:
+            return None
+        return min(found, key=lambda landmark: KIND_ORDER.index(landmark.kind))
+
+    # ========== 좌표 → 지명 (격자 색인) ==========
+
+    def nearest(self, latitude: float, longitude: float, max_km: float = 5.0) -> Optional[Tuple[Landmark, float]]:
+        """max_km 안에서 가장 가까운 지명 → (지명, 거리 km), 없으면 None"""
+        # 위도 1° ≈ 111km - max_km를 덮는 만큼 주변 격자만 확인
+        reach = int(max_km / (111.0 * self.cell_deg)) + 1
+        row, col = self._cell(latitude, longitude)
+        best = None
+        for r in range(row - reach, row + reach + 1):
+            for c in range(col - reach, col + reach + 1):
+                for landmark in self._grid.get((r, c), ()):
+                    distance = haversine_km(latitude, longitude, landmark.latitude, landmark.longitude)
+                    if distance <= max_km and (best is None or distance < best[1]):
+                        best = (landmark, distance)
+        return best
+
+    def _cell(self, latitude: float, longitude: float) -> Tuple[int, int]:
+        return int(math.floor(latitude / self.cell_deg)), int(math.floor(longitude / self.cell_deg))
+
+    # ========== 일괄 계산 ==========
+
+    def distances(self, keywords: Sequence[str], latitudes: Sequence[Optional[float]],
+                  longitudes: Sequence[Optional[float]]) -> List[Optional[float]]:
+        """행마다 키워드 지명과 업체 좌표 사이 거리(km) - 지명이나 좌표가 없으면 None"""
+        result = []
+        for keyword, latitude, longitude in zip(keywords, latitudes, longitudes):
+            landmark = self.find_in_keyword(keyword)
+            if landmark is None or latitude is None or longitude is None:
+                result.append(None)
+            else:
+                result.append(haversine_km(latitude, longitude, landmark.latitude, landmark.longitude))
+        return result
+
+    def is_far(self, keyword: str, distance_km: Optional[float]) -> bool:
+        """키워드 지명 반경 밖인지 (거리를 모르면 False)"""
+        if distance_km is None:
+            return False
+        landmark = self.find_in_keyword(keyword)
+        return landmark is not None and distance_km > landmark.radius_km * self.far_factor
+
+    def annotate(self, records: Iterable[Dict], keyword: str) -> List[Dict]:
+        """결과에 distance_km(키워드 지명까지 거리, km) 추가 - 좌표는 latitude/longitude 키"""
+        records = list(records)
+        distances = self.distances(
+            [keyword] * len(records),
+            [_to_float(r.get("latitude")) for r in records],
+            [_to_float(r.get("longitude")) for r in records],
+        )
+        for record, distance in zip(records, distances):
+            record["distance_km"] = round(distance, 2) if distance is not None else None
+        return records
+
+
+def _not_followed_by(words: Sequence[str]) -> str:
+    return f"(?!{'|'.join(map(re.escape, words))})" if words else ""
+
+
+def _to_float(value) -> Optional[float]:
+    try:
+        value = float(value)
+    except (TypeError, ValueError):
+        return None
+    return None if math.isnan(value) else value
+
+
+# 프로세스 공용 색인
+landmark_index = LandmarkIndex.from_env()
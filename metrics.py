@@ -0,0 +1,166 @@
+"""
+운영 지표 (Prometheus 텍스트 형식)
+크롤러 누적 카운터, Chromium 하위 프로세스 메모리 측정, /metrics 응답 작성 도구
+"""
+
+import os
+import re
+import threading
+from collections import Counter
+from typing import Dict, Iterable, Optional, Tuple
+
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class CrawlCounters:
+    """프로세스 누적 카운터/게이지 (스레드 안전)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.keywords = Counter()       # 결과 종류별 키워드 수 (ok/no_place/error)
+        self.detail_page_visits = 0
+        self.blocked_requests = Counter()  # 리소스 타입별
+        self.allowed_requests = 0
+        self.blocked_bytes = 0          # TYPICAL_BYTES 기준 추정치
+
+    def keyword_started(self):
+        with self._lock:
+            self.in_flight += 1
+
+    def keyword_finished(self, outcome: str):
+        with self._lock:
+            self.in_flight -= 1
+            self.keywords[outcome] += 1
+
+    def detail_visit(self, count: int = 1):
+        with self._lock:
+            self.detail_page_visits += count
+
+    def add_block_stats(self, stats):
+        """request_blocking.BlockStats (키워드 1회분) 누적"""
+        with self._lock:
+            self.blocked_requests.update(stats.by_type)
+            self.allowed_requests += stats.allowed
+            self.blocked_bytes += stats.bytes_saved
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            return {
+                "in_flight": self.in_flight,
+                "keywords": dict(self.keywords),
+                "detail_page_visits": self.detail_page_visits,
+                "blocked_requests": dict(self.blocked_requests),
+                "allowed_requests": self.allowed_requests,
+                "blocked_bytes": self.blocked_bytes,
+            }
+
+
+# 프로세스 공용 카운터
+crawl_counters = CrawlCounters()
+
+
+# ========== 프로세스 메모리 ==========
+
+def _read_status(pid) -> Optional[str]:
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def process_rss_bytes(pid="self") -> int:
+    """프로세스 RSS (Linux /proc 기준, 그 외 OS는 0)"""
+    status = _read_status(pid)
+    m = re.search(r"^VmRSS:\s+(\d+)", status or "", re.M)
+    return int(m.group(1)) * 1024 if m else 0
+
+
+def child_processes_rss(root_pid: Optional[int] = None) -> Tuple[int, int]:
+    """root_pid 하위 프로세스 전체 (Chromium/드라이버 등) → (프로세스 수, RSS 합계 바이트)"""
+    if not os.path.isdir("/proc"):
+        return 0, 0
+    root_pid = root_pid or os.getpid()
+    children, rss = {}, {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        status = _read_status(entry)
+        if status is None:
+            continue
+        ppid = re.search(r"^PPid:\s+(\d+)", status, re.M)
+        vmrss = re.search(r"^VmRSS:\s+(\d+)", status, re.M)
+        if ppid:
+            children.setdefault(int(ppid.group(1)), []).append(int(entry))
+        rss[int(entry)] = int(vmrss.group(1)) * 1024 if vmrss else 0
+
+    count, total, stack = 0, 0, list(children.get(root_pid, []))
+    while stack:
+        pid = stack.pop()
+        count += 1
+        total += rss.get(pid, 0)
+        stack.extend(children.get(pid, []))
+    return count, total
+
+
+# ========== Prometheus 텍스트 ==========
+
+class PrometheusText:
+    """Prometheus 텍스트 형식 작성기 (이름마다 HELP/TYPE 1회)"""
+
+    def __init__(self):
+        self._lines = []
+        self._declared = set()
+
+    def gauge(self, name: str, help_text: str, value, labels: Optional[Dict] = None):
+        self._declare(name, "gauge", help_text)
+        self._sample(name, value, labels)
+
+    def counter(self, name: str, help_text: str, value, labels: Optional[Dict] = None):
+        self._declare(name, "counter", help_text)
+        self._sample(name, value, labels)
+
+    def histogram(self, name: str, help_text: str, bounds: Iterable[float], counts: Iterable[int],
+                  total: float, labels: Optional[Dict] = None, scale: float = 1.0):
+        """버킷별 개수(마지막 +Inf 포함) → 누적 _bucket/_sum/_count (scale로 단위 변환)"""
+        self._declare(name, "histogram", help_text)
+        labels = labels or {}
+        bounds, counts = list(bounds), list(counts)
+        cumulative = 0
+        for bound, n in zip(bounds, counts):
+            cumulative += n
+            self._sample(f"{name}_bucket", cumulative, {**labels, "le": _number(round(bound * scale, 6))})
+        cumulative += sum(counts[len(bounds):])
+        self._sample(f"{name}_bucket", cumulative, {**labels, "le": "+Inf"})
+        self._sample(f"{name}_sum", total * scale, labels)
+        self._sample(f"{name}_count", cumulative, labels)
+
+    def render(self) -> str:
+        return "\n".join(self._lines) + "\n"
+
+    def _declare(self, name, kind, help_text):
+        if name in self._declared:
+            return
+        self._declared.add(name)
+        self._lines.append(f"# HELP {name} {help_text}")
+        self._lines.append(f"# TYPE {name} {kind}")
+
+    def _sample(self, name, value, labels):
+        label_text = ""
+        if labels:
+            label_text = "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items()) + "}"
+        self._lines.append(f"{name}{label_text} {_number(value)}")
+
+
+def _number(value) -> str:
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if isinstance(value, int):
+        return str(value)
+    return repr(float(value))
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
@@ -0,0 +1,158 @@
+"""
+모바일 통합검색 플레이스 목록 - 셀렉터 설정과 행 후처리
+NaverPlaceCrawlerReal의 셀렉터 대체 경로와 오프라인 벤치마크가 함께 사용
+"""
+
+import re
+from typing import Dict, List
+
+from detail_cache import place_id_from_url
+from dom_batch import extract_items
+from phone_numbers import best_phone, find_phones, normalize_phone
+
+
+# 목록 아이템 후보 셀렉터 (처음으로 아이템이 있는 셀렉터 사용)
+LIST_ITEM_SELECTORS = [
+    ".place_section ul li",  # 플레이스 섹션 내부
+    "li.UEzoS",  # 모바일 추천
+    "ul li",  # 모든 리스트
+    "li.place_item",
+    "li[class]"  # 클래스 있는 li
+]
+
+# 목록 아이템 필드별 셀렉터 캐스케이드 (dom_batch 설정 형식)
+LIST_FIELDS = {
+    'name': {'selectors': [
+        '.YwYLL',  # 모바일 플레이스 섹션
+        '.TYaxT',  # 모바일 추천 (맛집 등)
+        'a.BwZrK',
+        '.place_bluelink',
+        'span.place_name',
+        'a[href*="place"]',
+        'h2',
+        'strong'
+    ]},
+    'place_link': {'selectors': ['a[href*="place"]'], 'attrs': ['href']},
+    'address': {'selectors': [
+        ".Pb4bU", ".LDgIH", "span.LDgIH", ".addr", "span.place_addr", ".Osdwn",
+        "[class*='addr']", "[class*='address']", "div[class*='Addr']", "span[class*='place']"
+    ], 'min_length': 6, 'reject': ['-']},
+    'phone': {'selectors': [
+        'a[href^="tel:"]',  # 전화 링크
+        '.dry6Z',           # 네이버 모바일 전화
+        'span.xlx7Q',       # 상세 전화
+        '.tel',
+        'span.place_tel',
+        '[class*="tel"]',
+        '[class*="phone"]',
+        'span[class*="Tel"]',
+        'div[class*="tel"]',
+        'a[class*="tel"]'
+    ], 'reject': ['-']},
+    'rating': {'selectors': ['.h69bs', 'em.score', '.score', 'span.rating', '.star_score', '[class*="rating"]']},
+    'reviews': {'selectors': ['.Tvqnp', 'em.Tvqnp', '.cnt', 'span.review_cnt', '.review_count', '[class*="review"]']},
+    'category': {'selectors': ['.YzBgS', 'span.YzBgS', '.category', 'span.place_category', '.type', '[class*="category"]']},
+    'image_url': {'selectors': ['img'], 'attrs': ['src', 'data-src', 'data-lazy-src']},
+}
+
+# 셀렉터로 못 찾았을 때 아이템 HTML에서 찾는 패턴 (순서대로 검색, 첫 매칭 사용)
+ADDRESS_HTML_PATTERNS = [
+    re.compile(r"([가-힣]+시\s+[가-힣]+구\s+[가-힣]+동[^<]*)"),  # 시 구 동
+    re.compile(r"([가-힣]+[로길]\s+\d+[^<]*)"),  # XX로 123
+    re.compile(r"([가-힣]+동\s+\d+-\d+)"),  # XX동 123-45
+]
+
+
+def extract_list_records(page, max_results: int, verbose: bool = True):
+    """셀렉터 방식 목록 추출 → (records, 발견 아이템 수, 사용된 셀렉터)
+
+    셀렉터 설정 전체를 page.evaluate 1회로 보내 모든 아이템 필드를 받아온 뒤
+    파이썬에서는 정규식 보정과 유효성 검사만 한다
+    """
+    used_selector, item_count, rows = extract_items(
+        page, LIST_ITEM_SELECTORS, LIST_FIELDS, max_results, include_html=True
+    )
+    return rows_to_records(rows, verbose), item_count, used_selector
+
+
+def rows_to_records(rows: List[Dict], verbose: bool = True) -> List[Dict]:
+    """일괄 추출한 행 → 크롤러 record (링크 보정, HTML 정규식 대체, 전화번호 정규화)"""
+    records = []
+    for idx, row in enumerate(rows):
+        name = row['name']
+        if not name:
+            continue
+        html = row.get('html', "")
+        
+        # === 디버깅: 첫 번째 아이템 HTML 구조 확인 ===
+        if idx == 0 and verbose:
+            debug_item_html(html)
+        
+        # 플레이스 상세 링크
+        place_link = row['place_link']
+        if place_link and not place_link.startswith('http') and place_link.startswith('/'):
+            place_link = 'https://m.place.naver.com' + place_link
+        
+        # 주소 - 셀렉터 실패 시 HTML 정규식 (첫 매칭에서 멈춤)
+        addr = row['address']
+        if addr and idx == 0 and verbose:
+            print(f"  ✓ 주소 발견: {addr[:50]}")
+        if not addr:
+            for p in ADDRESS_HTML_PATTERNS:
+                m = p.search(html)
+                if m:
+                    addr = m.group(1).strip()
+                    break
+        if not addr:
+            addr = "주소 정보 없음"
+        
+        # 전화번호 - 표준 형식으로 정규화 ("전화" 버튼 텍스트 등은 무효), 실패 시 HTML에서 우선순위 번호
+        phone = normalize_phone(row['phone'])
+        if row['phone'] and not phone and idx == 0 and verbose:
+            print(f"  ⚠️ 무효한 전화번호 발견: '{row['phone']}' → HTML/상세 페이지에서 재시도")
+        if not phone:
+            best = best_phone(find_phones(html))
+            phone = best.canonical if best else ""
+        if phone and idx == 0 and verbose:
+            print(f"  ✓ 전화번호 발견: {phone}")
+        
+        reviews = re.sub(r'[^0-9]', '', row['reviews']) if row['reviews'] else "0"
+        
+        # 상세 페이지 보강은 목록 추출이 끝난 뒤 한 번에 처리
+        records.append({
+            'idx': idx,
+            'name': name,
+            'category': row['category'],
+            'address': addr,
+            'phone': phone,
+            'rating': row['rating'],
+            'reviews': reviews,
+            'image_url': row['image_url'],
+            'place_link': place_link,
+            'place_id': place_id_from_url(place_link)
+        })
+    
+    return records
+
+
+def debug_item_html(item_html: str):
+    """첫 번째 아이템 HTML 구조 출력 (셀렉터 점검용)"""
+    print(f"\n{'='*60}")
+    print("📋 첫 번째 아이템 HTML 구조 분석 (처음 2000자)")
+    print(f"{'='*60}")
+    print(item_html[:2000])
+    print(f"\n{'='*60}")
+    print("📋 전화번호 관련 텍스트 검색:")
+    print(f"{'='*60}")
+    phones_found = [p.canonical for p in find_phones(item_html)]
+    if phones_found:
+        print(f"✓ 발견된 전화번호: {phones_found}")
+    else:
+        print("❌ 전화번호 패턴 없음")
+    
+    addrs_found = re.findall(r'([가-힣]+[시도]\s+[가-힣]+[구군]\s+[가-힣]+[동읍면로길].*?(?:<|\n|$))', item_html)
+    if addrs_found:
+        print(f"✓ 발견된 주소 패턴: {addrs_found[:3]}")
+    else:
+        print("❌ 주소 패턴 없음")
+    print(f"{'='*60}\n")
@@ -0,0 +1,443 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+로컬 네이버 목 서버 (부하 테스트/오프라인 실행용)
+실제 네이버 대신 모바일 통합검색, 지도 검색(searchIframe 리스트), 플레이스 상세 페이지를 제공
+
+- 저장된 mobile_debug_<키워드>.html이 있으면 그 페이지(외부 스크립트 제거)를 그대로 제공
+- 그 외 키워드는 --places개의 합성 업체로 페이지를 만든다 (키워드별로 항상 같은 결과)
+- 응답 지연(--latency/--jitter), 오류율(--error-rate), 봇 차단 응답(--block-rate) 설정 가능
+
+크롤러는 NAVER_BASE_URL 환경변수로 연결:
+    python mock_naver_server.py --port 8765 --places 50 --latency 300 --jitter 150
+    NAVER_BASE_URL=http://127.0.0.1:8765 python naver_crawler_core.py
+
+URL 형식: {base}/{네이버 호스트}/경로 (naver_endpoints.NaverEndpoints 참고)
+통계: {base}/__mock__/stats (경로별 요청 수, 응답 결과, 최대 동시 요청 수)
+"""
+
+import argparse
+import glob
+import html
+import json
+import os
+import random
+import re
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, quote, unquote, urlsplit
+
+from apollo_state import extract_places_from_html
+
+
+DEFAULT_PORT = 8765
+FIXTURE_PATTERN = "mobile_debug_*.html"
+
+# 합성 업체용 지역 (시, 시 약칭, 구, 동, 위도, 경도)
+DISTRICTS = [
+    ("서울특별시", "서울", "강남구", "역삼동", 37.5006, 127.0364),
+    ("서울특별시", "서울", "서초구", "서초동", 37.4918, 127.0076),
+    ("서울특별시", "서울", "중구", "명동", 37.5609, 126.9863),
+    ("서울특별시", "서울", "마포구", "서교동", 37.5551, 126.9195),
+    ("서울특별시", "서울", "송파구", "잠실동", 37.5080, 127.0823),
+    ("경기도", "경기", "성남시 분당구", "정자동", 37.3670, 127.1085),
+    ("경기도", "경기", "수원시 팔달구", "인계동", 37.2660, 127.0311),
+    ("인천광역시", "인천", "남동구", "구월동", 37.4486, 126.7052),
+    ("부산광역시", "부산", "해운대구", "우동", 35.1631, 129.1635),
+    ("대구광역시", "대구", "중구", "동성로1가", 35.8690, 128.5960),
+]
+ROADS = ["테헤란로", "강남대로", "서초대로", "을지로", "양화로", "올림픽로", "정자일로", "중앙로", "해운대로", "동성로"]
+BRAND_WORDS = ["행복한", "으뜸", "바른", "정성", "하늘", "든든", "새봄", "한결", "온누리", "푸른"]
+CATEGORIES = ["한식", "카페", "이사", "치과", "미용실", "일식", "중식", "피부과", "헬스장", "공인중개사"]
+
+BLOCK_PAGE = """<!DOCTYPE html>
+<html lang="ko"><head><meta charset="utf-8"><title>네이버 : 보안 확인</title></head>
+<body><div id="captcha"><h2>자동입력 방지</h2>
+<p>비정상적인 접근이 감지되어 서비스 이용이 일시적으로 제한되었습니다.</p></div></body></html>
+"""
+
+_SCRIPT_SRC_PATTERN = re.compile(r'<script\b[^>]*\bsrc=[^>]*>\s*</script>', re.I)
+_DETAIL_PATH_PATTERN = re.compile(r'^/place/(\d+)(?:/.*)?$')
+
+
+class MockNaver:
+    """목 서버 상태 - 설정, 업체 레지스트리, 요청 통계"""
+
+    def __init__(self, places=30, latency_ms=0, jitter_ms=0, error_rate=0.0, block_rate=0.0,
+                 block_status=403, seed=0, fixtures=FIXTURE_PATTERN, empty_rate=0.0):
+        self.places = places
+        self.empty_rate = empty_rate
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.block_rate = block_rate
+        self.block_status = block_status
+        self.seed = seed
+
+        self._lock = threading.Lock()
+        self._random = random.Random(seed)
+        self._registry = {}        # place_id → 업체 dict
+        self._keyword_places = {}  # 키워드 → 업체 목록
+        self._fixture_pages = {}   # 키워드 → 저장된 모바일 검색 HTML
+        self._requests = Counter()
+        self._outcomes = Counter()
+        self._in_flight = 0
+        self._peak_in_flight = 0
+
+        if fixtures:
+            self._load_fixtures(fixtures)
+
+    # ========== 업체 데이터 ==========
+
+    def _load_fixtures(self, pattern):
+        for path in sorted(glob.glob(pattern)):
+            keyword = re.sub(r'^mobile_debug_|\.html$', '', os.path.basename(path))
+            with open(path, encoding='utf-8') as f:
+                page = f.read()
+            places = []
+            for record in extract_places_from_html(page):
+                place = self._synthetic_place(keyword, random.Random(record['place_id']))
+                place.update({k: v for k, v in record.items() if v not in (None, "")})
+                places.append(place)
+            # 외부 스크립트는 실제 네이버 정적 서버로 나가므로 제거 (SSR 마크업과 Apollo 상태만 사용)
+            self._fixture_pages[keyword] = _SCRIPT_SRC_PATTERN.sub('', page)
+            self._keyword_places[keyword] = places
+            self._register(places)
+            print(f"📁 fixture: {os.path.basename(path)} ({len(places)}개 업체)")
+
+    def places_for(self, keyword):
+        """키워드의 업체 목록 (처음 요청 시 생성, 이후 같은 결과)"""
+        with self._lock:
+            places = self._keyword_places.get(keyword)
+        if places is not None:
+            return places
+
+        rng = random.Random(f"{self.seed}:{keyword}")
+        # empty_rate 비율의 키워드는 플레이스 없음 (키워드마다 고정)
+        empty = random.Random(f"{self.seed}:empty:{keyword}").random() < self.empty_rate
+        count = 0 if empty else self.places
+        places = [self._synthetic_place(keyword, rng, _home_district(keyword)) for _ in range(count)]
+        with self._lock:
+            places = self._keyword_places.setdefault(keyword, places)
+        self._register(places)
+        return places
+
+    def fixture_page(self, keyword):
+        return self._fixture_pages.get(keyword)
+
+    def place(self, place_id):
+        with self._lock:
+            found = self._registry.get(place_id)
+        if found:
+            return found
+        # 목록 없이 상세 페이지를 직접 요청한 경우 - ID 기준 합성
+        found = self._synthetic_place("", random.Random(place_id))
+        found['place_id'] = place_id
+        return found
+
+    def _register(self, places):
+        with self._lock:
+            for place in places:
+                self._registry[place['place_id']] = place
+
+    @staticmethod
+    def _synthetic_place(keyword, rng, home=None):
+        # 키워드에 지역명이 있으면 대부분 그 지역, 일부는 타지역 업체
+        city, short_city, gu, dong, lat, lon = home if home and rng.random() < 0.8 else rng.choice(DISTRICTS)
+        road = rng.choice(ROADS)
+        number, lot = rng.randint(1, 300), f"{rng.randint(1, 999)}-{rng.randint(1, 40)}"
+        phone = rng.choice([
+            f"02-{rng.randint(200, 999)}-{rng.randint(1000, 9999)}",
+            f"0507-{rng.randint(1000, 1999)}-{rng.randint(1000, 9999)}",
+            f"070-{rng.randint(4000, 8999)}-{rng.randint(1000, 9999)}",
+            f"1588-{rng.randint(1000, 9999)}",
+        ])
+        dong_name = dong[:-1] if dong.endswith("동") else dong
+        return {
+            'place_id': str(rng.randint(1_000_000_000, 1_999_999_999)),
+            'name': f"{rng.choice(BRAND_WORDS)} {keyword or rng.choice(CATEGORIES)} {dong_name}점".replace("  ", " "),
+            'category': rng.choice(CATEGORIES),
+            'address': f"{city} {gu} {dong} {lot}",
+            'common_address': f"{short_city} {gu} {dong}",
+            'road_address': f"{road} {number}",
+            'phone': phone,
+            # 목록에는 일부 업체만 전화번호 노출 → 나머지는 상세 페이지 보강 경로를 거침
+            'list_phone': rng.random() < 0.5,
+            'rating': f"{rng.uniform(3.5, 5.0):.2f}",
+            'reviews': str(rng.randint(0, 5000)),
+            'image_url': "",
+            'latitude': round(lat + rng.uniform(-0.01, 0.01), 7),
+            'longitude': round(lon + rng.uniform(-0.01, 0.01), 7),
+        }
+
+    # ========== 응답 제어 ==========
+
+    def begin(self, route):
+        """요청 시작 - 지연 적용 후 결과 결정 ('ok' | 'error' | 'blocked')"""
+        with self._lock:
+            self._requests[route] += 1
+            self._in_flight += 1
+            self._peak_in_flight = max(self._peak_in_flight, self._in_flight)
+            delay = max(0.0, self.latency_ms + self._random.uniform(-self.jitter_ms, self.jitter_ms))
+            roll = self._random.random()
+        if delay:
+            time.sleep(delay / 1000)
+        if roll < self.block_rate:
+            return 'blocked'
+        if roll < self.block_rate + self.error_rate:
+            return 'error'
+        return 'ok'
+
+    def end(self, outcome):
+        with self._lock:
+            self._in_flight -= 1
+            self._outcomes[outcome] += 1
+
+    def stats(self):
+        with self._lock:
+            return {
+                'requests': dict(self._requests),
+                'outcomes': dict(self._outcomes),
+                'in_flight': self._in_flight,
+                'peak_in_flight': self._peak_in_flight,
+                'keywords': len(self._keyword_places),
+                'places': len(self._registry),
+            }
+
+
+def _home_district(keyword):
+    """키워드에 들어 있는 지역 (구/동 이름은 '구'/'동'을 뗀 두 글자 이상으로 비교)"""
+    for district in DISTRICTS:
+        names = [district[1], district[2].split()[-1][:-1], district[3][:-1]]
+        if any(len(name) >= 2 and name in keyword for name in names):
+            return district
+    return None
+
+
+# ========== 페이지 템플릿 ==========
+
+def _apollo_state(places, query_field):
+    """목록 Apollo 상태 - 실제 페이지와 같은 ROOT_QUERY → items(__ref) 구조"""
+    state = {'ROOT_QUERY': {'__typename': 'Query', query_field: {'items': []}}}
+    for place in places:
+        ref = f"PlaceSummary:{place['place_id']}"
+        state['ROOT_QUERY'][query_field]['items'].append({'__ref': ref})
+        state[ref] = {
+            '__typename': 'PlaceSummary',
+            'id': place['place_id'],
+            'name': place['name'],
+            'category': place['category'],
+            'fullAddress': place['address'],
+            'commonAddress': place.get('common_address', ""),
+            'roadAddress': place.get('road_address', ""),
+            'phone': place['phone'] if place.get('list_phone') else None,
+            'visitorReviewScore': place['rating'],
+            'visitorReviewCount': place['reviews'],
+            'imageUrl': place.get('image_url', ""),
+            'x': str(place['longitude'] or ""),
+            'y': str(place['latitude'] or ""),
+        }
+    # </script> 조기 종료 방지
+    return json.dumps(state, ensure_ascii=False).replace('</', '<\\/')
+
+
+def _list_item(place, link):
+    e = html.escape
+    phone = f'<a href="tel:{e(place["phone"])}" class="dry6Z">{e(place["phone"])}</a>' if place.get('list_phone') else ""
+    return (
+        f'<li class="UEzoS VLTHu" role="listitem" data-id="{e(place["place_id"])}"><div class="qbGlu">'
+        f'<a class="place_bluelink" href="{e(link)}"><span class="YwYLL">{e(place["name"])}</span></a>'
+        f'<span class="YzBgS KCMnt">{e(place["category"])}</span>'
+        f'<span class="h69bs">{e(place["rating"])}</span><span class="Tvqnp AQ85">리뷰 {e(place["reviews"])}</span>'
+        f'<span class="Pb4bU LDgIH">{e(place["address"])}</span>{phone}'
+        f'</div></li>'
+    )
+
+
+def render_mobile_search(keyword, places):
+    items = "".join(_list_item(p, f"https://m.place.naver.com/place/{p['place_id']}/home") for p in places)
+    # 플레이스가 없는 키워드는 섹션 자체가 없음 (웹 문서 결과만)
+    section = (f'<section class="place_section"><ul class="place_section_content">{items}</ul></section>'
+               if places else '<section class="sp_nweb"><p>웹문서 검색 결과</p></section>')
+    state = _apollo_state(places, f'nxPlaces({{"input":{{"query":{json.dumps(keyword, ensure_ascii=False)}}}}})')
+    return f"""<!DOCTYPE html>
+<html lang="ko"><head><meta charset="utf-8"><title>{html.escape(keyword)} : 네이버 통합검색</title>
+<script>window.naver = {{search: {{ext: {{nop: {{salt: {{}}}}}}}}}};
+naver.search.ext.nop.salt.__APOLLO_STATE__ = {state};</script></head>
+<body>{section}</body></html>
+"""
+
+
+def render_search(keyword):
+    link = f"https://m.search.naver.com/search.naver?where=m&query={quote(keyword)}"
+    return f"""<!DOCTYPE html>
+<html lang="ko"><head><meta charset="utf-8"><title>{html.escape(keyword)} : 네이버 통합검색</title></head>
+<body><div class="api_subject_bx"><a class="tab" data-tab="place" href="{html.escape(link)}&amp;tab=place">플레이스</a></div></body></html>
+"""
+
+
+def render_map(keyword):
+    src = f"/pcmap.place.naver.com/place/list?query={quote(keyword)}"
+    return f"""<!DOCTYPE html>
+<html lang="ko"><head><meta charset="utf-8"><title>{html.escape(keyword)} - 네이버 지도</title></head>
+<body><div id="app-root"><iframe id="searchIframe" name="searchIframe" title="Naver Place Search" src="{src}"></iframe></div></body></html>
+"""
+
+
+def render_place_list(keyword, places):
+    items = "".join(_list_item(p, "#") for p in places)
+    body = f"<ul>{items}</ul>" if places else '<div class="FYvSc">조건에 맞는 업체가 없습니다.</div>'
+    state = _apollo_state(places, f'places({{"input":{{"query":{json.dumps(keyword, ensure_ascii=False)}}}}})')
+    return f"""<!DOCTYPE html>
+<html lang="ko"><head><meta charset="utf-8"><title>네이버 지도</title>
+<script>window.__APOLLO_STATE__ = {state};</script></head>
+<body><div class="Ryr1F" style="height:800px;overflow:auto">{body}</div></body></html>
+"""
+
+
+def render_detail(place):
+    e = html.escape
+    return f"""<!DOCTYPE html>
+<html lang="ko"><head><meta charset="utf-8"><title>{e(place['name'])} : 네이버</title></head>
+<body><div class="place_section">
+<span class="GHAhO">{e(place['name'])}</span><span class="lnJFt">{e(place['category'])}</span>
+<div class="O8qbU tQY7D"><span class="LDgIH">{e(place['address'])}</span></div>
+<div class="O8qbU nbXkr"><span class="xlx7Q">{e(place['phone'])}</span><a href="tel:{e(place['phone'])}">전화</a></div>
+</div></body></html>
+"""
+
+
+# ========== HTTP 서버 ==========
+
+class MockNaverHandler(BaseHTTPRequestHandler):
+    server_version = "MockNaver/1.0"
+
+    def do_GET(self):
+        mock = self.server.mock
+        parts = urlsplit(self.path)
+        query = parse_qs(parts.query)
+
+        if parts.path == "/__mock__/stats":
+            self._send(200, json.dumps(mock.stats(), ensure_ascii=False), "application/json; charset=utf-8")
+            return
+
+        # /{호스트}/경로 → (호스트, 경로)
+        host, _, path = parts.path.lstrip("/").partition("/")
+        path = "/" + path
+        route = self._route(host, path)
+        if route is None:
+            self._send(404, "not found", "text/plain; charset=utf-8")
+            return
+
+        outcome = mock.begin(route)
+        try:
+            if outcome == 'blocked':
+                self._send(mock.block_status, BLOCK_PAGE)
+            elif outcome == 'error':
+                self._send(503, "<html><body>일시적인 오류가 발생했습니다.</body></html>")
+            else:
+                self._send(200, self._render(mock, route, path, query))
+        finally:
+            mock.end(outcome)
+
+    @staticmethod
+    def _route(host, path):
+        if host == "m.search.naver.com" and path == "/search.naver":
+            return "mobile_search"
+        if host == "search.naver.com" and path == "/search.naver":
+            return "search"
+        if host == "map.naver.com" and path.startswith("/p/search/"):
+            return "map"
+        if host == "pcmap.place.naver.com" and path == "/place/list":
+            return "place_list"
+        if host in ("pcmap.place.naver.com", "m.place.naver.com") and _DETAIL_PATH_PATTERN.match(path):
+            return "detail"
+        return None
+
+    @staticmethod
+    def _render(mock, route, path, query):
+        keyword = (query.get('query') or [""])[0]
+        if route == "mobile_search":
+            fixture = mock.fixture_page(keyword)
+            return fixture if fixture is not None else render_mobile_search(keyword, mock.places_for(keyword))
+        if route == "search":
+            return render_search(keyword)
+        if route == "map":
+            return render_map(unquote(path[len("/p/search/"):]))
+        if route == "place_list":
+            return render_place_list(keyword, mock.places_for(keyword))
+        return render_detail(mock.place(_DETAIL_PATH_PATTERN.match(path).group(1)))
+
+    def _send(self, status, body, content_type="text/html; charset=utf-8"):
+        data = body.encode("utf-8")
+        try:
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(data)))
+            self.send_header("Cache-Control", "no-store")
+            self.end_headers()
+            self.wfile.write(data)
+        except (BrokenPipeError, ConnectionResetError):
+            # 크롤러가 타임아웃/취소로 먼저 연결을 끊은 경우
+            pass
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+def create_server(mock, host="127.0.0.1", port=DEFAULT_PORT, verbose=False):
+    """목 서버 생성 (port=0이면 빈 포트 자동 선택, server.base_url로 주소 확인)"""
+    server = ThreadingHTTPServer((host, port), MockNaverHandler)
+    server.daemon_threads = True
+    server.mock = mock
+    server.verbose = verbose
+    server.base_url = f"http://{host}:{server.server_address[1]}"
+    return server
+
+
+def serve_in_background(mock, host="127.0.0.1", port=0, verbose=False):
+    """백그라운드 스레드에서 실행 → server (종료: server.shutdown())"""
+    server = create_server(mock, host, port, verbose)
+    threading.Thread(target=server.serve_forever, name="mock-naver", daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="로컬 네이버 목 서버 (크롤러는 NAVER_BASE_URL로 연결)")
+    parser.add_argument('--host', default="127.0.0.1")
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--places', type=int, default=30, help="키워드당 합성 업체 수")
+    parser.add_argument('--latency', type=float, default=0, help="응답 지연 (ms)")
+    parser.add_argument('--jitter', type=float, default=0, help="지연 편차 ± (ms)")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="503 응답 비율 (0~1)")
+    parser.add_argument('--block-rate', type=float, default=0.0, help="봇 차단 페이지 응답 비율 (0~1)")
+    parser.add_argument('--block-status', type=int, default=403, help="봇 차단 응답 상태 코드")
+    parser.add_argument('--empty-rate', type=float, default=0.0, help="플레이스 없음 키워드 비율 (0~1)")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--fixtures', default=FIXTURE_PATTERN, help="저장된 모바일 검색 페이지 glob (빈 값이면 사용 안 함)")
+    parser.add_argument('--verbose', action='store_true', help="요청 로그 출력")
+    args = parser.parse_args()
+
+    mock = MockNaver(
+        places=args.places, latency_ms=args.latency, jitter_ms=args.jitter,
+        error_rate=args.error_rate, block_rate=args.block_rate, block_status=args.block_status,
+        seed=args.seed, fixtures=args.fixtures, empty_rate=args.empty_rate,
+    )
+    server = create_server(mock, args.host, args.port, args.verbose)
+    print(f"🧪 네이버 목 서버 실행: {server.base_url}")
+    print(f"   크롤러 연결: NAVER_BASE_URL={server.base_url}")
+    print(f"   지연 {args.latency}±{args.jitter}ms, 오류율 {args.error_rate:.0%}, 차단율 {args.block_rate:.0%}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(f"\n📊 {json.dumps(mock.stats(), ensure_ascii=False)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -74,96 +74,151 @@ except Exception as e:
     print("💡 해결: 런타임 재시작 후 다시 실행하세요\n")
 
 # ========== 크롤러 클래스 (Playwright 실제 크롤링) ==========
-from playwright.sync_api import sync_playwright
 import re
-from urllib.parse import quote
+from browser_service import BrowserService
+from cancellation import CancelToken, CrawlCancelled
+from wait_engine import Waiter
+from request_blocking import BlockingProfile, RequestBlocker
+from apollo_state import extract_places_from_html
+from mobile_list import extract_list_records
+from result_cache import ResultCache
+from detail_cache import DetailCache, place_id_from_url
+from naver_endpoints import NaverEndpoints
+from phase_timing import CrawlResults, PhaseTimer, latency_recorder
+from rate_limiter import rate_limiter
+from page_classifier import BLOCKED, NO_PLACE, RESULTS, UNKNOWN, PageClassifier
+from region_classifier import classify_records
+from landmarks import landmark_index
+from detail_extract import ranked_candidates, read_detail
+from job_queue import JobManager
+from metrics import CONTENT_TYPE, PrometheusText, child_processes_rss, crawl_counters, process_rss_bytes
+
+# 스크롤/더보기 후 로딩 완료 판단에 쓰는 리스트 아이템 셀렉터
+LIST_ITEM_SELECTOR = 'li.UEzoS, li[class*="place"], ul li'
+
+# 모바일 검색 결과 판정 (플레이스 섹션 유무, 차단/캡차 페이지)
+PLACE_SECTION_CLASSIFIER = PageClassifier('.place_section')
+
+# 상세 페이지 동시 로드 수 (컨텍스트당 재사용 페이지 수)
+DETAIL_CONCURRENCY = int(os.getenv('DETAIL_CONCURRENCY', '4'))
+
+# 플레이스 섹션이 없는 키워드의 결과 (1행)
+NO_PLACE_RECORD = {
+    "name": "플레이스섹션없음",
+    "category": "-",
+    "address": "-",
+    "phone": "-",
+    "rating": "-",
+    "reviews": "0",
+    "place_type": "검색결과없음"
+}
 
 class NaverPlaceCrawlerReal:
     """v4.9.9 - Playwright로 실제 네이버 크롤링"""
     
+    def __init__(self, service=None, blocking=None, detail_cache=None, endpoints=None, recorder=None, limiter=None):
+        # 키워드마다 Chromium을 띄우지 않도록 장수명 브라우저 서비스 공유
+        self.service = service or BrowserService()
+        # 지도 타일/이미지/폰트/광고 요청 차단 규칙
+        self.blocking = blocking or BlockingProfile.from_env()
+        # 플레이스 ID별 전화번호/주소 캐시 - 상세 페이지 재방문 방지
+        self.detail_cache = detail_cache or DetailCache.from_env()
+        # 네이버 주소 (NAVER_BASE_URL 지정 시 로컬 목 서버)
+        self.endpoints = endpoints or NaverEndpoints.from_env()
+        # 단계별 소요 시간 히스토그램 (p50/p95/p99)
+        self.recorder = recorder or latency_recorder
+        # 호스트별 요청 속도 제한 (모든 워커 공유, 차단 응답 시 자동 감속)
+        self.limiter = limiter or rate_limiter
+    
     def search_places(self, keyword, max_results=20):
         """Playwright로 실제 네이버 플레이스 크롤링 (봇 우회)"""
-        playwright = None
-        browser = None
-        context = None
+        try:
+            return self.submit_search(keyword, max_results).result()
+        except Exception as e:
+            print(f"❌ 크롤링 오류: {e}")
+            return []
+    
+    def submit_search(self, keyword, max_results=20, token=None):
+        """크롤링 작업을 브라우저 서비스 큐에 넣고 Future 반환 (여러 키워드 동시 처리용)
+        
+        결과는 CrawlResults (list + 단계별 시간 .timing, 취소/시간 초과 시 .partial)
+        token(CancelToken)이 취소되면 남은 단계를 건너뛰고 그때까지의 결과를 반환
+        """
+        return self.service.submit(self._search_in_context, keyword, max_results, time.perf_counter(), token)
+    
+    def _search_in_context(self, context, keyword, max_results, queued_at=None, token=None):
+        """브라우저 서비스 스레드에서 실행 - 봇 우회/모바일 설정이 적용된 컨텍스트 사용"""
+        page = None
+        token = token or CancelToken()
+        # 키워드별 예산은 큐 대기가 끝나고 작업을 시작할 때부터
+        token.start()
+        # 큐 대기 + 컨텍스트 준비 시간이 acquire 단계
+        timer = PhaseTimer(keyword, started=queued_at)
+        timer.lap("acquire")
+        # 컨텍스트 단위로 연결 - 검색 페이지와 상세 페이지 모두 적용, 키워드 종료 시 해제
+        blocker = RequestBlocker(self.blocking)
+        blocker.attach(context)
+        watcher = self.limiter.watch(context)
+        crawl_counters.keyword_started()
+        outcome = "error"
         
         try:
+            # 대기열에 있는 동안 취소된 키워드는 접속하지 않음
+            token.check()
             print(f"\n🔍 '{keyword}' 실제 크롤링 시작...")
             
-            playwright = sync_playwright().start()
-            
-            # 🔒 봇 감지 우회 설정
-            browser = playwright.chromium.launch(
-                headless=True,
-                args=[
-                    '--no-sandbox',
-                    '--disable-setuid-sandbox',
-                    '--disable-dev-shm-usage',
-                    '--disable-blink-features=AutomationControlled',  # 자동화 감지 차단
-                    '--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-                ]
-            )
-            
-            # 모바일 디바이스 시뮬레이션 (iPhone 13)
-            iphone_device = {
-                'viewport': {'width': 390, 'height': 844},
-                'user_agent': 'Mozilla/5.0 (iPhone; CPU iPhone OS 17_0 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.0 Mobile/15E148 Safari/604.1',
-                'device_scale_factor': 3,
-                'is_mobile': True,
-                'has_touch': True,
-                'locale': 'ko-KR',
-                'timezone_id': 'Asia/Seoul'
-            }
-            context = browser.new_context(**iphone_device)
-            
             page = context.new_page()
-            
-            # JavaScript 스크립트로 봇 판별 방지
-            page.add_init_script("""
-                Object.defineProperty(navigator, 'webdriver', {get: () => undefined});
-                Object.defineProperty(navigator, 'plugins', {get: () => [1, 2, 3, 4, 5]});
-                Object.defineProperty(navigator, 'languages', {get: () => ['ko-KR', 'ko', 'en-US', 'en']});
-                window.chrome = {runtime: {}};
-            """)
-            
-            print("  ✓ 봇 우회 + 모바일 시뮬레이션 완료")
+            waiter = Waiter(page)
             
             # 네이버 모바일 검색 접근
-            url = f"https://m.search.naver.com/search.naver?where=m&sm=mtb_jum&query={quote(keyword)}"
+            url = self.endpoints.mobile_search(keyword)
             print(f"  → 모바일 검색 접속: {url[:60]}...")
-            page.goto(url, timeout=30000, wait_until="domcontentloaded")
-            time.sleep(1.5)
+            timer.add("rate_wait", self.limiter.wait(url, token) * 1000)
+            token.check()
+            response = page.goto(url, timeout=token.timeout_ms(30000), wait_until="domcontentloaded")
+            timer.lap("navigate")
+            token.check()
             
             print("  ✓ 페이지 로드 완료 (플레이스 섹션 확인 중...)")
             
-            # 플레이스 섹션 대기 (최대 10초)
-            try:
-                page.wait_for_selector('.place_section', timeout=10000)
-                print("  ✓ 플레이스 섹션 발견")
-            except:
-                print("  ⚠ 플레이스 섹션 대기 시간 초과 (계속 진행)")
+            # 응답/DOM 스냅샷으로 조기 판정 (결과 있음/플레이스 없음/차단/오류)
+            verdict = PLACE_SECTION_CLASSIFIER.classify(page, timeout=token.timeout_ms(10000), response=response)
+            print(f"  ✓ 페이지 판정: {verdict.summary()}")
+            if verdict.state == RESULTS:
+                waiter.settled(LIST_ITEM_SELECTOR, quiet_ms=300, timeout=token.timeout_ms(3000))
+            timer.lap("section_wait")
             
-            time.sleep(0.7)
+            if verdict.state not in (RESULTS, UNKNOWN):
+                # 셀렉터만 바뀌었을 수도 있으므로 Apollo 상태를 한 번 확인 (수 ms), 없으면 바로 종료
+                if verdict.state == NO_PLACE and extract_places_from_html(page.content(), 1):
+                    print("  ⚠ 플레이스 섹션 셀렉터 없음 - Apollo 상태에 업체 있음 (계속 진행)")
+                else:
+                    if verdict.state == BLOCKED and response is not None and response.status < 400:
+                        self.limiter.report_blocked(url)
+                    outcome = verdict.state
+                    return self._dead_keyword_results(keyword, verdict, timer)
             
             # 🔄 강화된 스크롤 로직 (더 많은 아이템 로드)
             print("  → 페이지 스크롤 중...")
             
-            # 여러 번 스크롤하여 더 많은 아이템 로드
+            # 여러 번 스크롤하여 더 많은 아이템 로드 (취소/시간 초과 시 지금까지 로드된 목록으로 진행)
             for scroll_attempt in range(3):
+                if token.cancelled:
+                    break
                 # 현재 아이템 수 확인
-                current_items = len(page.query_selector_all('li.UEzoS, li[class*="place"], ul li'))
+                current_items = len(page.query_selector_all(LIST_ITEM_SELECTOR))
                 
-                # 스크롤
+                # 스크롤 후 새 아이템 로딩이 멈출 때까지 대기
                 page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                time.sleep(0.5)
+                waiter.settled(LIST_ITEM_SELECTOR, quiet_ms=300, timeout=token.timeout_ms(2000))
                 
                 # 새로운 아이템 수 확인
-                new_items = len(page.query_selector_all('li.UEzoS, li[class*="place"], ul li'))
+                new_items = len(page.query_selector_all(LIST_ITEM_SELECTOR))
                 
                 print(f"    스크롤 {scroll_attempt+1}/3: {new_items}개 아이템")
                 
                 # 더 이상 아이템이 증가하지 않으면 중단
-                if new_items == current_items and scroll_attempt > 2:
+                if new_items == current_items:
                     break
             
             # 더보기 버튼 찾기 및 클릭 (2페이지 로드)
@@ -178,495 +233,351 @@ class NaverPlaceCrawlerReal:
             
             page_2_loaded = False
             for selector in more_button_selectors:
+                if token.cancelled:
+                    break
                 try:
                     more_btn = page.query_selector(selector)
                     if more_btn and more_btn.is_visible():
                         more_btn.click()
-                        time.sleep(0.7)
+                        waiter.settled(LIST_ITEM_SELECTOR, quiet_ms=300, timeout=token.timeout_ms(3000))
                         print(f"  ✓ 2페이지 로드 성공 (버튼: {selector})")
                         page_2_loaded = True
                         
                         # 2페이지 스크롤
                         for i in range(2):
+                            if token.cancelled:
+                                break
                             page.evaluate('window.scrollTo(0, document.body.scrollHeight)')
-                            time.sleep(0.7)
+                            waiter.settled(LIST_ITEM_SELECTOR, quiet_ms=300, timeout=token.timeout_ms(2000))
                         break
                 except:
                     continue
             
             if not page_2_loaded:
                 print("  ⚠ 2페이지 로드 실패 (더보기 버튼 없음 또는 1페이지만 존재)")
+            timer.lap("scroll")
             
-            # 플레이스 섹션 내 아이템 찾기 (모바일 셀렉터)
-            items = []
-            
-            # 플레이스 아이템 찾기 (강화)
-            items = []
+            print(f"  ⏱ {waiter.summary()}")
             
-            # 다양한 셀렉터 시도
-            selectors = [
-                ".place_section ul li",  # 플레이스 섹션 내부
-                "li.UEzoS",  # 모바일 추천
-                "ul li",  # 모든 리스트
-                "li.place_item",
-                "li[class]"  # 클래스 있는 li
-            ]
+            # 1순위: 페이지에 포함된 Apollo 상태 - JSON 1회 디코딩으로 목록 전체 추출
+            records = extract_places_from_html(page.content(), max_results)
+            if records:
+                print(f"  ✓ Apollo 상태에서 {len(records)}개 추출 (셀렉터 생략)")
+            else:
+                # 2순위: 셀렉터 방식 (아이템마다 query_selector 반복)
+                records = self._extract_list_dom(page, max_results)
+            timer.lap("list_extract")
             
-            for selector in selectors:
-                items = page.query_selector_all(selector)
-                if items and len(items) > 0:
-                    print(f"  ✓ {len(items)}개 발견 ({selector})")
-                    break
-
-            if not items:
-                print("❌ 검색 결과를 찾을 수 없습니다")
+            if not records:
                 print("⚠️  플레이스 섹션 없음 - 검색 결과 없음")
-                return [{
-                    "name": "플레이스섹션없음",
-                    "category": "-",
-                    "address": "-",
-                    "phone": "-",
-                    "rating": "-",
-                    "reviews": "0",
-                    "place_type": "검색결과없음"
-                }]
+                outcome = "no_place"
+                return CrawlResults([dict(NO_PLACE_RECORD)], timer.finish().as_dict(), status=NO_PLACE, reason='no_items')
+            for idx, record in enumerate(records):
+                record['idx'] = idx
             
-            # 데이터 추출
             results = []
-            
-            print(f"\n📊 총 {len(items)}개 아이템 발견")
-            print(f"  → 최대 {min(len(items), max_results)}개 처리 예정\n")
             addr_count = 0
             
-            print(f"  → 데이터 추출 중 (최대 {max_results}개)...")
+            # 상세 페이지 보강 단계 - 전화번호(메인 판정의 핵심!) 또는 주소가 없는 업체만
+            # 상세 캐시로 먼저 채우고, 그래도 비어 있는 업체만 상세 페이지 방문
+            pending = self._apply_detail_cache([r for r in records if self._needs_detail(r)])
+            if pending and not token.cancelled:
+                self._enrich_details(context, pending, timer=timer, token=token)
+            timer.lap("detail")
             
-            for idx, item in enumerate(items[:max_results]):
-                try:
-                    # 업체명 (모바일 셀렉터)
-                    name = self._get_text(item, [
-                        '.YwYLL',  # 모바일 플레이스 섹션
-                        '.TYaxT',  # 모바일 추천 (맛집 등)
-                        'a.BwZrK',
-                        '.place_bluelink',
-                        'span.place_name',
-                        'a[href*="place"]',
-                        'h2',
-                        'strong'
-                    ])
-                    
-                    if not name:
-                        continue
-                    
-                    # === 디버깅: HTML 구조 확인 ===
-                    if idx == 0:  # 첫 번째 아이템만 상세히 출력
-                        try:
-                            item_html = item.inner_html()
-                            print(f"\n{'='*60}")
-                            print(f"📋 첫 번째 아이템 HTML 구조 분석 (처음 2000자)")
-                            print(f"{'='*60}")
-                            print(item_html[:2000])
-                            print(f"\n{'='*60}")
-                            print(f"📋 전화번호 관련 텍스트 검색:")
-                            print(f"{'='*60}")
-                            # 전화번호 패턴 찾기
-                            import re
-                            phones_found = re.findall(r'(070[-\s]?\d{3,4}[-\s]?\d{4}|0\d{1,2}[-\s]?\d{3,4}[-\s]?\d{4})', item_html)
-                            if phones_found:
-                                print(f"✓ 발견된 전화번호: {phones_found}")
-                            else:
-                                print(f"❌ 전화번호 패턴 없음")
-                            
-                            # 주소 패턴 찾기
-                            addrs_found = re.findall(r'([가-힣]+[시도]\s+[가-힣]+[구군]\s+[가-힣]+[동읍면로길].*?(?:<|\n|$))', item_html)
-                            if addrs_found:
-                                print(f"✓ 발견된 주소 패턴: {addrs_found[:3]}")
-                            else:
-                                print(f"❌ 주소 패턴 없음")
-                            print(f"{'='*60}\n")
-                        except Exception as e:
-                            print(f"⚠️ 디버깅 오류: {e}")
-                    
-                    # 플레이스 상세 링크 찾기
-                    place_link = ""
-                    try:
-                        link_elem = item.query_selector('a[href*="place"]')
-                        if link_elem:
-                            place_link = link_elem.get_attribute('href') or ""
-                            if place_link and not place_link.startswith('http'):
-                                if place_link.startswith('/'):
-                                    place_link = 'https://m.place.naver.com' + place_link
-                    except: pass
-                    
-                    # 주소 추출 (다양한 방법 시도) + 디버깅
-                    addr = ""
-                    
-                    # 방법 1: 텍스트 셀렉터 (모든 가능한 셀렉터)
-                    addr_selectors = [".Pb4bU", ".LDgIH", "span.LDgIH", ".addr", "span.place_addr", ".Osdwn", "[class*='addr']", "[class*='address']", "div[class*='Addr']", "span[class*='place']"]
-                    for sel in addr_selectors:
-                        try:
-                            el = item.query_selector(sel)
-                            if el:
-                                text = el.inner_text().strip()
-                                if text and text != "-" and len(text) > 5:
-                                    addr = text
-                                    if idx == 0:
-                                        print(f"  ✓ 주소 발견 (셀렉터: {sel}): {addr[:50]}")
-                                    break
-                        except: pass
-                    
-                    # 방법 2: HTML에서 정규식 추출
-                    if not addr:
-                        try:
-                            html = item.inner_html()
-                            import re
-                            patterns = [
-                                r"([가-힣]+시\s+[가-힣]+구\s+[가-힣]+동[^<]*)",  # 시 구 동
-                                r"([가-힣]+[로길]\s+\d+[^<]*)",  # XX로 123
-                                r"([가-힣]+동\s+\d+-\d+)",  # XX동 123-45
-                            ]
-                            for p in patterns:
-                                m = re.search(p, html)
-                                if m:
-                                    addr = m.group(1).strip()
-                                    break
-                        except: pass
-                    
-                    if not addr:
-                        addr = "주소 정보 없음"
-
-                    # 전화번호 추출 (적극적으로) + 디버깅
-                    phone = ""
-                    
-                    # 방법 1: 텍스트 셀렉터 (모든 가능한 셀렉터 시도)
-                    phone_selectors = [
-                        'a[href^="tel:"]',  # 전화 링크
-                        '.dry6Z',           # 네이버 모바일 전화
-                        'span.xlx7Q',       # 상세 전화
-                        '.tel',
-                        'span.place_tel',
-                        '[class*="tel"]',
-                        '[class*="phone"]',
-                        'span[class*="Tel"]',
-                        'div[class*="tel"]',
-                        'a[class*="tel"]'
-                    ]
-                    
-                    for sel in phone_selectors:
-                        try:
-                            el = item.query_selector(sel)
-                            if el:
-                                text = el.inner_text().strip()
-                                if text and text != "-":
-                                    phone = text
-                                    if idx == 0:
-                                        print(f"  ✓ 전화번호 발견 (셀렉터: {sel}): {phone}")
-                                    break
-                        except: pass
-                    
-                    if not phone:
-                        phone = self._get_text(item, phone_selectors)
-                    
-                    # 방법 2: HTML에서 전화번호 추출 (더 강력한 패턴)
-                    if not phone:
-                        try:
-                            html = item.inner_html()
-                            phone_patterns = [
-                                r'tel:([0-9\-]+)',                           # tel: 링크
-                                r'(070[-\s]?\d{3,4}[-\s]?\d{4})',         # 070 번호
-                                r'(0\d{1,2}[-\s]?\d{3,4}[-\s]?\d{4})',   # 지역번호
-                                r'(\d{2,4}[-\s]?\d{3,4}[-\s]?\d{4})',    # 일반 패턴
-                            ]
-                            for p in phone_patterns:
-                                m = re.search(p, html)
-                                if m:
-                                    phone = m.group(1).replace('tel:', '').strip()
-                                    # 전화번호 정규화
-                                    phone = re.sub(r'\s+', '-', phone)
-                                    break
-                        except: pass
-                    
-                    # 전화번호 유효성 검사 - "전화"나 짧은 텍스트는 무효 처리
-                    if phone and (phone == "전화" or phone == "tel" or len(phone) < 8 or not re.search(r'\d', phone)):
-                        if idx == 0:
-                            print(f"  ⚠️ 무효한 전화번호 발견: '{phone}' → 상세 페이지에서 재시도")
-                        phone = ""  # 무효 처리
-                    
-                    # 상세 페이지에서 전화번호 우선 추출 (메인 판정의 핵심!)
-                    import re
-                    # 전화번호가 없거나 무효하면 무조건 상세 페이지 열기
-                    if (not phone or phone == "-" or phone == "전화") and place_link:
-                        try:
-                            print(f"    → {name[:20]} 상세 페이지 확인 중...")
-                            detail_page = context.new_page()
-                            detail_page.goto(place_link, timeout=10000, wait_until="domcontentloaded")
-                            time.sleep(0.5)
-                            
-                            # 전화번호 셀렉터 (상세 페이지) - 강화
-                            if not phone or phone == "-" or phone == "전화":
-                                phone_detail = self._get_text_from_page(detail_page, [
-                                    'a[href^="tel:"]',
-                                    '.dry6Z',
-                                    'span.xlx7Q',
-                                    'span[class*="phone"]',
-                                    'span[class*="tel"]',
-                                    'div[class*="phone"]',
-                                    'div[class*="tel"]',
-                                    '.phone_number',
-                                    '.tel_number'
-                                ])
-                                
-                                # HTML에서도 추출 시도 (tel: 링크에서 우선 추출)
-                                if not phone_detail or phone_detail == "전화":
-                                    try:
-                                        html = detail_page.content()
-                                        
-                                        # 1. tel: 링크에서 먼저 추출 - 모든 번호 찾아서 070 우선
-                                        tel_matches = re.findall(r'href="tel:([0-9\-]+)"', html)
-                                        if tel_matches:
-                                            print(f"    → 발견된 모든 tel: 링크: {tel_matches}")
-                                            # 070 번호 우선 선택
-                                            phone_detail = None
-                                            for tel_num in tel_matches:
-                                                if '070' in tel_num:
-                                                    phone_detail = tel_num
-                                                    print(f"    ✓ 070 번호 우선 선택: {phone_detail}")
-                                                    break
-                                            # 070이 없으면 첫 번째 번호 사용
-                                            if not phone_detail:
-                                                phone_detail = tel_matches[0]
-                                                print(f"    ✓ 첫 번째 번호 사용: {phone_detail}").strip()
-                                            print(f"      ✓ tel: 링크에서 발견: {phone_detail}")
-                                        else:
-                                            # 2. 전화번호 패턴 검색 (070 우선)
-                                            phone_patterns = [
-                                                r'(070[-\s]?\d{3,4}[-\s]?\d{4})',      # 070 최우선
-                                                r'(0507[-\s]?\d{4}[-\s]?\d{4})',      # 0507
-                                                r'(1[5-9]\d{2}[-\s]?\d{4})',           # 1509, 1688 등
-                                                r'(0\d{1,2}[-\s]?\d{3,4}[-\s]?\d{4})'  # 일반 지역번호
-                                            ]
-                                            for p in phone_patterns:
-                                                m = re.search(p, html)
-                                                if m:
-                                                    phone_detail = m.group(1).strip()
-                                                    print(f"      ✓ 패턴 매칭: {phone_detail}")
-                                                    break
-                                    except Exception as e:
-                                        print(f"      ⚠ HTML 추출 오류: {str(e)[:30]}")
-                                
-                                if phone_detail and phone_detail != "전화":
-                                    phone = phone_detail
-                                    print(f"      ✓ 전화: {phone}")
-                                else:
-                                    print(f"      ⚠️ 상세 페이지에서도 전화번호 없음")
-                            
-                            # 주소 셀렉터 (상세 페이지) - 상세 주소 가져오기
-                            if not addr or addr == "주소 정보 없음":
-                                addr_detail = self._get_text_from_page(detail_page, [
-                                    'span.LDgIH',
-                                    '.Pb4bU',
-                                    'div.O8qbU span',
-                                    '[class*="addr"]',
-                                    '[class*="address"]'
-                                ])
-                                
-                                if addr_detail and len(addr_detail) > len(addr):
-                                    addr = addr_detail
-                                    print(f"      ✓ 주소: {addr[:50]}")
-                            
-                            detail_page.close()
-                        except Exception as e:
-                            print(f"      ⚠ 상세 페이지 오류: {str(e)[:30]}")
-                            pass
-                    
-                    if not phone:
-                        phone = "-"
-
-                    # 평점 (모바일 셀렉터)
-                    rating = self._get_text(item, [
-                        '.h69bs',  # 모바일 최신
-                        'em.score',
-                        '.score',
-                        'span.rating',
-                        '.star_score',
-                        '[class*="rating"]'
-                    ])
-                    
-                    # 리뷰 수 (모바일 셀렉터)
-                    reviews = self._get_text(item, [
-                        '.Tvqnp',  # 모바일 최신
-                        'em.Tvqnp',
-                        '.cnt',
-                        'span.review_cnt',
-                        '.review_count',
-                        '[class*="review"]'
-                    ])
-                    reviews = re.sub(r'[^0-9]', '', reviews) if reviews else "0"
-                    
-                    # 카테고리 (모바일 셀렉터)
-                    category = self._get_text(item, [
-                        '.YzBgS',  # 모바일 최신
-                        'span.YzBgS',
-                        '.category',
-                        'span.place_category',
-                        '.type',
-                        '[class*="category"]'
-                    ])
-                    
-                    # 이미지 URL (썸네일) - 다양한 셀렉터 시도
-                    image_url = ""
-                    try:
-                        # 1. img 태그 찾기
-                        img_elem = item.query_selector('img')
-                        if img_elem:
-                            image_url = img_elem.get_attribute('src') or ""
-                            if not image_url:
-                                image_url = img_elem.get_attribute('data-src') or ""
-                            if not image_url:
-                                image_url = img_elem.get_attribute('data-lazy-src') or ""
-                        
-                        # 2. 배경 이미지는 체크하지 않음 (정규식 에러 방지)
-                    except Exception as e:
-                        pass
-                    
-                    # 디버깅: 이미지 URL 상태 로그
-                    has_img = "📸" if image_url else "❌"
-                    
-                    # 타지역업체 판단 (사진 유무 최우선 체크)
-                    is_other = self._is_other_region(name, addr, phone, rating, keyword, image_url)
-                    
-                    results.append({
-                        'name': name,
-                        'category': category or "미분류",
-                        'address': addr or "주소 정보 없음",
-                        'phone': phone or "전화번호 없음",
-                        'rating': rating or "",
-                        'reviews': reviews,
-                        'image_url': image_url,
-                        'is_other_region': is_other,
-                        'place_type': '타지역업체' if is_other else '주업체'
-                    })
-                    
-                    icon = "🟠" if is_other else "🟢"
-                    print(f"  {icon} [{idx+1}] {name[:30]} {has_img}")
-                    
-                except Exception as e:
-                    print(f"  ⚠️ [{idx+1}] 추출 실패: {str(e)[:50]}")
-                    continue
+            # 타지역업체 판정 - 키워드 지명까지 거리(distance_km) 추가 후 전체 업체를 열 단위로 한 번에
+            landmark_index.annotate(records, keyword)
+            other_flags, _ = classify_records(records, "core", keyword)
+            
+            for record, is_other in zip(records, other_flags):
+                name = record['name']
+                phone = record['phone'] or "-"
+                
+                # 디버깅: 이미지 URL 상태 로그
+                has_img = "📸" if record['image_url'] else "❌"
+                
+                if record['address'] and record['address'] != "주소 정보 없음":
+                    addr_count += 1
+                
+                results.append({
+                    'name': name,
+                    'category': record['category'] or "미분류",
+                    'address': record['address'] or "주소 정보 없음",
+                    'phone': phone or "전화번호 없음",
+                    'rating': record['rating'] or "",
+                    'reviews': record['reviews'],
+                    'image_url': record['image_url'],
+                    'place_id': record.get('place_id', ""),
+                    'latitude': record.get('latitude'),
+                    'longitude': record.get('longitude'),
+                    'distance_km': record.get('distance_km'),
+                    'is_other_region': is_other,
+                    'place_type': '타지역업체' if is_other else '주업체'
+                })
+                
+                icon = "🟠" if is_other else "🟢"
+                print(f"  {icon} [{record['idx']+1}] {name[:30]} {has_img}")
+            
+            timer.lap("classify")
             
             total = len(results)
             addr_rate = (addr_count / total * 100) if total > 0 else 0
             
-            print(f"\n✅ 완료: {total}개 | 주소: {addr_count}/{total} ({addr_rate:.0f}%)\n")
+            print(f"\n✅ 완료: {total}개 | 주소: {addr_count}/{total} ({addr_rate:.0f}%)")
+            print(f"  🚫 {blocker.stats.summary()}")
+            print(f"  ⏱ {timer.finish().summary()}\n")
             
-            return results
+            if token.cancelled:
+                print(f"  ⏹ 일부 단계 생략 ({token.reason}) - 부분 결과 반환")
+                outcome = "partial"
+                return CrawlResults(results, timer.as_dict(), partial=True, status=RESULTS)
+            outcome = "ok"
+            return CrawlResults(results, timer.as_dict(), status=RESULTS)
             
+        except CrawlCancelled as e:
+            print(f"⏹ '{keyword}' 크롤링 중단 ({e})")
+            outcome = "cancelled"
+            return CrawlResults([], timer.finish().as_dict(), partial=True)
+        
         except Exception as e:
             print(f"❌ 크롤링 오류: {e}")
-            return []
+            if token.cancelled:
+                # 남은 예산으로 줄인 대기 timeout이 먼저 터진 경우
+                outcome = "cancelled"
+                return CrawlResults([], timer.finish().as_dict(), partial=True)
+            return CrawlResults([], timer.finish().as_dict())
         
         finally:
-            # 리소스 정리
-            try:
-                if context:
-                    context.close()
-                if browser:
-                    browser.close()
-                if playwright:
-                    playwright.stop()
-            except:
-                pass
-    
-    def _get_text(self, parent, selectors):
-        """Playwright 요소에서 텍스트 추출"""
-        for sel in selectors:
+            self.recorder.record(timer.finish())
+            # 페이지만 정리 (컨텍스트는 서비스 풀로 반환)
             try:
-                el = parent.query_selector(sel)
-                if el:
-                    text = el.inner_text().strip()
-                    if text:
-                        return text
+                if page:
+                    page.close()
             except:
                 pass
-        return ""
+            blocker.detach(context)
+            self.limiter.unwatch(context, watcher)
+            crawl_counters.add_block_stats(blocker.stats)
+            crawl_counters.keyword_finished(outcome)
     
-    def _get_text_from_page(self, page, selectors):
-        """Playwright 페이지에서 텍스트 추출"""
-        for sel in selectors:
-            try:
-                el = page.query_selector(sel)
-                if el:
-                    text = el.inner_text().strip()
-                    if text:
-                        return text
-            except:
-                pass
-        return ""
+    @staticmethod
+    def _dead_keyword_results(keyword, verdict, timer):
+        """플레이스 없음/차단/오류 판정 → 스크롤·추출 없이 바로 반환할 결과"""
+        if verdict.state == NO_PLACE:
+            print(f"⚠️  '{keyword}' 플레이스 섹션 없음 ({verdict.reason}) - 스크롤/추출 생략")
+            results = [dict(NO_PLACE_RECORD)]
+        else:
+            print(f"⛔ '{keyword}' {'차단/캡차 페이지' if verdict.state == BLOCKED else '오류 응답'} ({verdict.reason}) - 크롤링 중단")
+            results = []
+        return CrawlResults(results, timer.finish().as_dict(), status=verdict.state, reason=verdict.reason)
     
-    def _is_other_region(self, name, addr, phone, rating, keyword, image_url=""):
-        """타지역 업체 판단 - 상호명 → 전화번호 순서"""
-        import re
+    def _extract_list_dom(self, page, max_results):
+        """셀렉터 방식 목록 추출 (Apollo 상태가 없을 때의 대체 경로) → records, 아이템이 없으면 None"""
+        records, item_count, used_selector = extract_list_records(page, max_results)
+        if not item_count:
+            print("❌ 검색 결과를 찾을 수 없습니다")
+            return None
         
-        # 1순위: 상호명 기반 필터링 (법적 사업자 등록 불가 업종)
-        if name and name.strip() == "흥신소":
-            return True  # 흥신소(3글자) = 무조건 타지역
+        print(f"  ✓ {item_count}개 발견 ({used_selector})")
+        print(f"\n📊 총 {item_count}개 아이템 발견 → {len(records)}개 추출 (evaluate 1회)")
+        return records
+    
+    @staticmethod
+    def _needs_detail(record):
+        return bool(record['place_link']) and (
+            not record['phone'] or record['phone'] in ("-", "전화") or record['address'] == "주소 정보 없음"
+        )
+    
+    def _apply_detail_cache(self, pending):
+        """상세 캐시에 있는 전화번호/주소로 record 보강 → 여전히 상세 페이지가 필요한 record 목록"""
+        remaining = []
+        for record in pending:
+            cached = self.detail_cache.get(record.get('place_id') or place_id_from_url(record['place_link']))
+            if cached:
+                if cached['phones'] and (not record['phone'] or record['phone'] in ("-", "전화")):
+                    record['phone'] = cached['phones'][0]
+                if cached['address'] and record['address'] == "주소 정보 없음":
+                    record['address'] = cached['address']
+            if self._needs_detail(record):
+                remaining.append(record)
         
-        # 2순위: 전화번호 기반 판정 - 070만 타지역, 나머지는 모두 메인!
-        if phone and phone != "-":
-            # 070 번호 = 인터넷 전화 = 타지역 (유일한 타지역 기준!)
-            if '070' in phone or phone.startswith('070'):
-                return True  # 타지역
-            
-            # 그 외 모든 전화번호 = 메인
-            # 0507 (네이버 메인플레이스)
-            # 1509, 1688, 1588, 1577 (대표전화/고객센터)
-            # 02, 031 등 (지역번호)
-            # → 모두 메인으로 처리
-            if re.search(r'\d', phone):  # 숫자가 하나라도 있으면
-                return False  # 메인
+        if len(remaining) < len(pending):
+            print(f"  → 상세 캐시 적중: {len(pending) - len(remaining)}개 (상세 페이지 생략)")
+        return remaining
+    
+    def _enrich_details(self, context, pending, concurrency=DETAIL_CONCURRENCY, timer=None, token=None):
+        """상세 페이지 보강 단계 - 재사용 페이지 풀에서 여러 상세 페이지를 동시에 로드
         
-        # 1. 주소에 번지수가 있는지 체크 (메인 판별)
-        if addr and addr != "주소 정보 없음":
-            # 강력한 번지수 패턴
-            detailed_patterns = [
-                r'\d+-\d+',              # 123-45
-                r'\d+\s*-\s*\d+',        # 123 - 45
-                r'[동가]\s+\d+-\d+',      # 신사동 638-2, 저동2가 35-4
-                r'[로길]\s+\d+',          # 압구정로 306
-                r'\d+\s*[층호]',          # 165호, 1층
-                r'[가]\s+\d+',           # 저동2가 35
-            ]
-            
-            for pattern in detailed_patterns:
-                if re.search(pattern, addr):
-                    return False  # 번지수 있음 = 메인
+        sync Playwright는 goto가 끝날 때까지 스레드를 막으므로, 배치의 모든 페이지에
+        네비게이션을 먼저 걸어 두고 이후 페이지별로 로드 완료를 기다려 추출한다.
+        token이 취소되면 남은 배치/대기를 건너뛴다 (이미 읽은 업체는 그대로 반영).
+        """
+        token = token or CancelToken()
+        print(f"  → 상세 페이지 보강: {len(pending)}개 (동시 {concurrency}개)")
+        pages = []
+        try:
+            pages = [context.new_page() for _ in range(min(concurrency, len(pending)))]
             
-            # "~동/가"로만 끝나면 타지역
-            if re.search(r'[동가로길]$', addr):
-                return True
-        
-        # 2. "서울 XX구 XX동" 형태만 있으면 타지역
-        if addr and re.match(r'^[가-힣]+\s+[가-힣]+구\s+[가-힣]+[동가로길]$', addr):
-            return True
+            for start in range(0, len(pending), len(pages)):
+                if token.cancelled:
+                    print(f"      ⏹ 상세 페이지 {len(pending) - start}개 생략 ({token.reason})")
+                    break
+                batch = list(zip(pages, pending[start:start + len(pages)]))
+                
+                # 1) 네비게이션 동시 시작 (응답 대기 없음)
+                batch_started = time.perf_counter()
+                started = []
+                for page, record in batch:
+                    detail_url = self.endpoints.url(record['place_link'])
+                    waited = self.limiter.wait(detail_url, token)
+                    if timer:
+                        timer.add("rate_wait", waited * 1000)
+                    if token.cancelled:
+                        break
+                    try:
+                        previous_url = page.url
+                        page.evaluate("url => { setTimeout(() => { location.href = url; }, 0); }", detail_url)
+                        started.append((page, record, previous_url))
+                        crawl_counters.detail_visit()
+                    except Exception as e:
+                        print(f"      ⚠ 상세 페이지 오류: {str(e)[:30]}")
+                
+                # 2) 페이지별 로드 완료 대기 후 추출
+                for page, record, previous_url in started:
+                    if token.cancelled:
+                        break
+                    try:
+                        page.wait_for_url(lambda url, prev=previous_url: url != prev, wait_until="domcontentloaded", timeout=token.timeout_ms(10000))
+                        self._read_detail(page, record)
+                        self._store_detail(record)
+                        if timer:
+                            # 업체별 소요 시간 = 배치 네비게이션 시작 ~ 추출 완료
+                            timer.add("detail_item", (time.perf_counter() - batch_started) * 1000)
+                    except Exception as e:
+                        print(f"      ⚠ 상세 페이지 오류: {str(e)[:30]}")
+        finally:
+            for page in pages:
+                try:
+                    page.close()
+                except:
+                    pass
+    
+    def _store_detail(self, record):
+        """상세 페이지에서 얻은 전화번호 후보/주소를 상세 캐시에 저장"""
+        phone = record['phone'] if record['phone'] not in ("", "-", "전화") else ""
+        candidates = record.get('phone_candidates') or ([phone] if phone else [])
+        address = record['address'] if record['address'] != "주소 정보 없음" else ""
+        self.detail_cache.put(
+            record.get('place_id') or place_id_from_url(record['place_link']),
+            phones=candidates, address=address
+        )
+    
+    def _read_detail(self, detail_page, record):
+        """로드된 상세 페이지에서 전화번호/주소 추출 → record 갱신 (페이지 안에서 evaluate 1회, HTML 전체는 받지 않음)"""
+        name = record['name']
+        phone = record['phone']
+        addr = record['address']
+        print(f"    → {name[:20]} 상세 페이지 확인 중...")
+        detail = read_detail(detail_page, place_id=record.get('place_id'))
         
-        # 3. 추가 점수 기반 판단
-        score = 0
-        if not rating:
-            score += 1
-        if name and keyword:
-            words = [w for w in keyword.split() if len(w) > 1]
-            if any(w in name for w in words):
-                score += 2
+        # 전화번호 - 출처 순 (tel: 링크 → 셀렉터 → 이 업체의 Apollo 상태 → HTML), Apollo/HTML 중에서는 070 우선
+        if not phone or phone == "-" or phone == "전화":
+            # 선택된 번호를 맨 앞에 두고 나머지 후보 보관 (상세 캐시용)
+            record['phone_candidates'] = ranked_candidates(detail)
+            phone_detail = record['phone_candidates'][0] if record['phone_candidates'] else ""
+            if len(record['phone_candidates']) > 1:
+                print(f"    → 발견된 번호: {record['phone_candidates']}")
+
+            if phone_detail:
+                phone = phone_detail
+                print(f"      ✓ 전화: {phone}")
+            else:
+                print(f"      ⚠️ 상세 페이지에서도 전화번호 없음")
+
+        # 주소 - 상세 주소 셀렉터, 없으면 Apollo 상태
+        if not addr or addr == "주소 정보 없음":
+            addr_detail = detail['address'] or detail['apollo_address']
+            if addr_detail and len(addr_detail) > len(addr):
+                addr = addr_detail
+                print(f"      ✓ 주소: {addr[:50]}")
         
-        return score >= 3
+        record['phone'] = phone
+        record['address'] = addr
 
 # ========== Flask 웹 서버 ==========
 from flask import Flask, request, jsonify, Response
+from concurrent.futures import FIRST_COMPLETED, wait
 import threading
 import io
 import csv
+import json
+
+# 동시에 크롤링할 키워드 수 (워커마다 Chromium 1개 - 메모리에 맞춰 조정)
+CRAWL_WORKERS = int(os.getenv('CRAWL_WORKERS', '3'))
+
+# 결과 캐시 모드 (모바일 통합검색 크롤링 결과)
+CACHE_MODE = 'mobile_search'
 
 app = Flask(__name__)
-crawler = NaverPlaceCrawlerReal()
+browser_service = BrowserService(pool_size=1, workers=CRAWL_WORKERS)
+crawler = NaverPlaceCrawlerReal(browser_service)
+result_cache = ResultCache.from_env()
+
+def submit_keywords(keywords, max_results, bypass_cache=False, token=None, budget=None):
+    """키워드별 크롤링 작업 제출 - 캐시 적중은 즉시 완료, 나머지는 워커 수만큼 동시 실행
+    
+    Future 리스트 반환 (키워드 순서). token(CancelToken)을 취소하면 남은 키워드/단계를 건너뜀
+    시간 예산(budget, 기본 CRAWL_TIME_BUDGET)은 키워드마다 하위 토큰으로 따로 - 크롤링을 실제로 시작할 때마다 새로 잰다
+    (만료 후 백그라운드 갱신도 새 예산으로)
+    """
+    token = token or CancelToken()
+    return [
+        result_cache.submit(
+            keyword, CACHE_MODE, max_results,
+            lambda keyword=keyword: crawler.submit_search(keyword, max_results, token.child(budget)),
+            bypass=bypass_cache
+        )
+        for keyword in keywords
+    ]
+
+def request_budget(data):
+    """body의 time_budget(초, 키워드마다 따로) → 없으면 None (CRAWL_TIME_BUDGET), 숫자가 아니거나 음수면 ValueError"""
+    budget = data.get('time_budget')
+    if budget is None:
+        return None
+    if isinstance(budget, bool):
+        raise ValueError(budget)
+    budget = float(budget)
+    if not budget >= 0:
+        raise ValueError(budget)
+    return budget
+
+# 비동기 작업 API - 워커 수만큼만 브라우저 서비스에 넣고 나머지는 작업 큐에서 공정하게 대기
+job_manager = JobManager.from_env(
+    lambda keyword, max_results, bypass_cache, token: submit_keywords([keyword], max_results, bypass_cache, token, budget=0)[0],
+    workers=CRAWL_WORKERS
+)
+
+def is_partial(results):
+    """취소/시간 예산 초과로 일부 단계를 건너뛴 결과인지"""
+    return getattr(results, 'partial', False)
+
+def keyword_timing(keyword, results):
+    """키워드 결과의 단계별 시간 (캐시에서 바로 나온 결과는 cached 표시만)
+    
+    부분 결과는 partial, 페이지 판정이 있으면 status/reason(플레이스 없음/차단 사유)을 함께 표시
+    """
+    timing = dict(getattr(results, 'timing', None) or {'keyword': keyword, 'cached': True})
+    if is_partial(results):
+        timing['partial'] = True
+    if getattr(results, 'status', None):
+        timing['status'] = results.status
+        if results.reason:
+            timing['reason'] = results.reason
+    return timing
+
+# SSE 연결 끊김 감지 주기 (초) - 결과가 없을 때도 주석 줄을 보내야 끊긴 연결을 알 수 있음
+SSE_HEARTBEAT = 5
 
 @app.route('/')
 def index():
@@ -1002,54 +913,86 @@ def index():
 
 @app.route('/api/search-stream', methods=['POST'])
 def api_search_stream():
-    """실시간 스트리밍 검색 API"""
+    """실시간 스트리밍 검색 API - 키워드가 끝나는 순서대로 이벤트 전송
+    
+    클라이언트 연결이 끊기면 (탭 닫기 등) 남은 키워드/단계를 취소해 워커를 비움
+    """
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict):
+        return jsonify({'success': False, 'error': 'JSON 요청 본문이 필요합니다.'}), 400
+    try:
+        budget = request_budget(data)
+    except (TypeError, ValueError):
+        return jsonify({'success': False, 'error': 'time_budget은 0 이상의 숫자(초)여야 합니다.'}), 400
+    token = CancelToken()
+    
     def generate():
+        finished = False
         try:
-            data = request.json
             keywords_input = data.get('keyword', '')
             max_results = data.get('max_results', 20)
+            bypass_cache = bool(data.get('no_cache', False))
             
-            import re
             keywords = [k.strip() for k in re.split(r'[,\n]', keywords_input) if k.strip()]
             
             MAX_KEYWORDS = 10
             if len(keywords) > MAX_KEYWORDS:
-                yield "data: " + json.dumps({'error': f'키워드 {len(keywords)}개는 너무 많습니다. 최대 {MAX_KEYWORDS}개까지 가능합니다.'}) + "\n\n",
+                yield "data: " + json.dumps({'error': f'키워드 {len(keywords)}개는 너무 많습니다. 최대 {MAX_KEYWORDS}개까지 가능합니다.'}) + "\n\n"
                 return
             
             if not keywords:
-                yield "data: " + json.dumps({'error': '키워드를 입력해주세요.'}) + "\n\n",
+                yield "data: " + json.dumps({'error': '키워드를 입력해주세요.'}) + "\n\n"
                 return
             
-            all_results = []
-            
+            # 전체 키워드 제출 후 진행 상황 전송
+            futures = submit_keywords(keywords, max_results, bypass_cache, token, budget)
+            index_of = {future: idx for idx, future in enumerate(futures, 1)}
             for idx, keyword in enumerate(keywords, 1):
-                try:
-                    # 진행 상황 전송
-                    yield "data: " + json.dumps({'status': 'processing', 'keyword': keyword, 'index': idx, 'total': len(keywords)}) + "\n\n",
-                    
-                    results = crawler.search_places(keyword, max_results)
-                    
-                    for r in results:
-                        r['keyword'] = keyword
-                    
-                    all_results.extend(results)
-                    
-                    # 키워드별 결과 전송
-                    yield "data: " + json.dumps({'status': 'completed', 'keyword': keyword, 'results': results, 'count': len(results)}) + "\n\n",
-                    
-                    if idx < len(keywords):
-                        time.sleep(0.3)
-                    
-                except Exception as e:
-                    yield "data: " + json.dumps({'status': 'error', 'keyword': keyword, 'error': str(e)}) + "\n\n",
+                yield "data: " + json.dumps({'status': 'processing', 'keyword': keyword, 'index': idx, 'total': len(keywords)}) + "\n\n"
+            
+            total_count = 0
+            partial = False
+            pending = set(futures)
+            
+            while pending:
+                done, pending = wait(pending, timeout=SSE_HEARTBEAT, return_when=FIRST_COMPLETED)
+                if not done:
+                    # 연결이 끊겼으면 여기서 GeneratorExit
+                    yield ": keepalive\n\n"
                     continue
+                
+                for future in sorted(done, key=index_of.get):
+                    idx = index_of[future]
+                    keyword = keywords[idx - 1]
+                    try:
+                        results = future.result()
+                        
+                        for r in results:
+                            r['keyword'] = keyword
+                        
+                        total_count += len(results)
+                        partial = partial or is_partial(results)
+                        
+                        # 키워드별 결과 전송 (완료 순서) - 캐시 적중은 단계별 시간 없음
+                        with latency_recorder.measure('serialize'):
+                            event = json.dumps({'status': 'completed', 'keyword': keyword, 'index': idx, 'results': results, 'count': len(results), 'partial': is_partial(results), 'timing': keyword_timing(keyword, results)})
+                        yield "data: " + event + "\n\n"
+                        
+                    except Exception as e:
+                        yield "data: " + json.dumps({'status': 'error', 'keyword': keyword, 'index': idx, 'error': str(e)}) + "\n\n"
+                        continue
             
             # 전체 완료
-            yield "data: " + json.dumps({'status': 'done', 'total_count': len(all_results), 'keywords_count': len(keywords)}) + "\n\n",
+            finished = True
+            yield "data: " + json.dumps({'status': 'done', 'total_count': total_count, 'keywords_count': len(keywords), 'partial': partial}) + "\n\n"
             
         except Exception as e:
-            yield "data: " + json.dumps({'status': 'fatal_error', 'error': str(e)}) + "\n\n",
+            yield "data: " + json.dumps({'status': 'fatal_error', 'error': str(e)}) + "\n\n"
+        
+        finally:
+            if not finished:
+                token.cancel('client_disconnected')
+                print("⏹ 스트리밍 연결 종료 - 남은 크롤링 취소")
     
     return Response(generate(), mimetype='text/event-stream')
 
@@ -1058,12 +1001,19 @@ def api_search_stream():
 @app.route('/api/search', methods=['POST'])
 def api_search():
     try:
-        data = request.json
+        data = request.get_json(silent=True)
+        if not isinstance(data, dict):
+            return jsonify({'success': False, 'error': 'JSON 요청 본문이 필요합니다.', 'results': []}), 400
+        try:
+            budget = request_budget(data)
+        except (TypeError, ValueError):
+            return jsonify({'success': False, 'error': 'time_budget은 0 이상의 숫자(초)여야 합니다.', 'results': []}), 400
         keywords_input = data.get('keyword', '')
         max_results = data.get('max_results', 20)
+        bypass_cache = bool(data.get('no_cache', False))
+        token = CancelToken()
         
         # 다중 키워드 파싱
-        import re
         keywords = [k.strip() for k in re.split(r'[,\n]', keywords_input) if k.strip()]
         
         # 키워드 개수 제한
@@ -1082,25 +1032,28 @@ def api_search():
                 'results': []
             }), 400
         
+        print(f"\n{'='*70}")
+        print(f"🔍 키워드 {len(keywords)}개 동시 크롤링 (워커 {CRAWL_WORKERS}개): {', '.join(keywords)}")
+        print(f"{'='*70}")
+        
+        futures = submit_keywords(keywords, max_results, bypass_cache, token, budget)
         all_results = []
+        timings = []
+        partial = False
         
-        for idx, keyword in enumerate(keywords, 1):
+        # 키워드 순서대로 결과 병합
+        for keyword, future in zip(keywords, futures):
             try:
-                print(f"\n{'='*70}")
-                print(f"🔍 키워드 [{idx}/{len(keywords)}]: {keyword}")
-                print(f"{'='*70}")
-                
-                results = crawler.search_places(keyword, max_results)
+                results = future.result()
                 
                 for r in results:
                     r['keyword'] = keyword
                 
                 all_results.extend(results)
+                timings.append(keyword_timing(keyword, results))
+                partial = partial or is_partial(results)
                 print(f"✅ '{keyword}' 완료: {len(results)}개 수집")
                 
-                if idx < len(keywords):
-                    time.sleep(0.3)
-                
             except Exception as e:
                 error_msg = str(e)
                 print(f"❌ '{keyword}' 실패: {error_msg}")
@@ -1110,12 +1063,16 @@ def api_search():
         print(f"🎉 전체 완료: 총 {len(all_results)}개 수집")
         print(f"{'='*70}")
         
-        return jsonify({
-            'success': True, 
-            'results': all_results,
-            'keywords_count': len(keywords),
-            'total_count': len(all_results)
-        })
+        with latency_recorder.measure('serialize'):
+            response = jsonify({
+                'success': True, 
+                'results': all_results,
+                'keywords_count': len(keywords),
+                'total_count': len(all_results),
+                'partial': partial,
+                'timings': timings
+            })
+        return response
         
     except Exception as e:
         error_msg = str(e)
@@ -1129,19 +1086,149 @@ def api_search():
             'results': []
         }), 500
 
+@app.route('/api/jobs', methods=['POST'])
+def create_job():
+    """크롤링 작업 등록 - 작업 ID만 바로 반환 (결과는 GET /api/jobs/<id>로 조회)
+    
+    body: keyword (쉼표/줄바꿈 구분), max_results, no_cache, priority (high/normal/batch), user
+    """
+    data = request.json or {}
+    keywords = [k.strip() for k in re.split(r'[,\n]', data.get('keyword', '')) if k.strip()]
+    user = data.get('user') or request.headers.get('X-User') or request.remote_addr or 'anonymous'
+    try:
+        job_id = job_manager.submit(
+            keywords,
+            int(data.get('max_results', 20)),
+            user=user,
+            priority=data.get('priority'),
+            bypass_cache=bool(data.get('no_cache', False))
+        )
+    except ValueError as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
+    
+    print(f"📥 작업 {job_id[:8]} 등록 ({user}): 키워드 {len(keywords)}개")
+    return jsonify({
+        'success': True,
+        'job_id': job_id,
+        'status': 'queued',
+        'keywords_count': len(keywords),
+        'status_url': f'/api/jobs/{job_id}'
+    }), 202
+
+@app.route('/api/jobs/<job_id>')
+def get_job(job_id):
+    """작업 상태/진행률 + 결과 페이지 (?offset=0&limit=100, 키워드 순서)"""
+    offset = max(0, request.args.get('offset', 0, type=int))
+    limit = min(max(1, request.args.get('limit', 100, type=int)), 1000)
+    job = job_manager.get(job_id, offset, limit)
+    if job is None:
+        return jsonify({'success': False, 'error': '작업을 찾을 수 없습니다.'}), 404
+    return jsonify({'success': True, **job})
+
+@app.route('/api/jobs/<job_id>', methods=['DELETE'])
+def cancel_job(job_id):
+    """작업 취소 - 대기 키워드는 건너뛰고 실행 중인 키워드는 부분 결과로 마무리"""
+    if job_manager.get(job_id, limit=1) is None:
+        return jsonify({'success': False, 'error': '작업을 찾을 수 없습니다.'}), 404
+    return jsonify({'success': True, 'cancelled': job_manager.cancel(job_id)})
+
+@app.route('/api/jobs')
+def list_jobs():
+    """최근 작업 목록 (?user=, 재접속 시 작업 ID 찾기용)"""
+    user = request.args.get('user') or request.headers.get('X-User')
+    return jsonify({'success': True, 'jobs': job_manager.list_jobs(user), **job_manager.stats()})
+
+@app.route('/api/cache-stats')
+def cache_stats():
+    """결과 캐시 적중/미스 통계 (+ 상세 캐시 통계)"""
+    stats = result_cache.stats()
+    stats['detail_cache'] = crawler.detail_cache.stats()
+    return jsonify(stats)
+
+@app.route('/api/latency-stats')
+def latency_stats():
+    """단계별 소요 시간 p50/p95/p99 (프로세스 시작 이후 누적)"""
+    return jsonify(latency_recorder.snapshot())
+
+@app.route('/metrics')
+def metrics():
+    """Prometheus 텍스트 형식 운영 지표 - 워커 수를 컨테이너 CPU/메모리 한도에 맞추는 용도"""
+    out = PrometheusText()
+    counters = crawl_counters.snapshot()
+    
+    # 동시 처리/대기열/브라우저 풀
+    out.gauge('naver_crawler_keywords_in_flight', '크롤링 중인 키워드 수', counters['in_flight'])
+    out.gauge('naver_crawler_queue_depth', '브라우저 서비스 대기 작업 수', browser_service.queue_depth)
+    out.gauge('naver_crawler_workers', '브라우저 워커 수 (워커마다 Chromium 1개)', browser_service.workers)
+    out.gauge('naver_crawler_workers_busy', '작업 실행 중인 워커 수', browser_service.busy_workers)
+    out.gauge('naver_crawler_worker_utilization', '워커 사용률 (0~1)', browser_service.busy_workers / browser_service.workers)
+    jobs = job_manager.stats()
+    out.gauge('naver_crawler_job_queue_depth', '작업 큐 대기 키워드 수', jobs['queued'])
+    out.gauge('naver_crawler_job_workers_busy', '키워드 처리 중인 작업 워커 수', jobs['running'])
+    out.gauge('naver_crawler_browser_contexts', '재사용 컨텍스트 풀 크기 (워커 수 x 워커당 컨텍스트)', browser_service.workers * browser_service.pool_size)
+    
+    # 누적 카운터
+    for outcome, count in sorted(counters['keywords'].items()):
+        out.counter('naver_crawler_keywords_total', '처리한 키워드 수 (결과 종류별)', count, {'outcome': outcome})
+    out.counter('naver_crawler_detail_page_visits_total', '상세 페이지 방문 수', counters['detail_page_visits'])
+    for resource_type, count in sorted(counters['blocked_requests'].items()):
+        out.counter('naver_crawler_blocked_requests_total', '차단한 요청 수 (리소스 타입별)', count, {'type': resource_type})
+    out.counter('naver_crawler_allowed_requests_total', '차단하지 않은 요청 수', counters['allowed_requests'])
+    out.counter('naver_crawler_blocked_bytes_total', '요청 차단으로 절감한 바이트 (타입별 평균 크기 추정)', counters['blocked_bytes'])
+    
+    # 요청 속도 제한 (호스트 그룹별)
+    for group, limit in crawler.limiter.stats().items():
+        labels = {'group': group}
+        out.gauge('naver_crawler_rate_limit_per_second', '현재 허용 요청 속도 (차단 시 감속)', limit['effective_rate'], labels)
+        out.gauge('naver_crawler_rate_limit_factor', '설정 속도 대비 배율 (1 = 감속 없음)', limit['factor'], labels)
+        out.counter('naver_crawler_rate_limited_requests_total', '속도 제한을 거친 페이지 이동 수', limit['requests'], labels)
+        out.counter('naver_crawler_rate_limit_wait_seconds_total', '속도 제한 대기 시간 합계', limit['wait_seconds'], labels)
+        out.counter('naver_crawler_blocked_responses_total', '차단/캡차 문서 응답 수', limit['blocked'], labels)
+    
+    # 캐시
+    cache = result_cache.stats()
+    for result, key in (('hit', 'hits'), ('stale', 'stale_hits'), ('miss', 'misses'), ('bypass', 'bypasses')):
+        out.counter('naver_crawler_result_cache_lookups_total', '결과 캐시 조회 수', cache[key], {'result': result})
+    out.gauge('naver_crawler_result_cache_entries', '결과 캐시 항목 수', cache['entries'])
+    out.gauge('naver_crawler_result_cache_bytes', '결과 캐시 크기', cache['bytes'])
+    detail = crawler.detail_cache.stats()
+    for result, key in (('hit', 'hits'), ('partial', 'partial_hits'), ('miss', 'misses')):
+        out.counter('naver_crawler_detail_cache_lookups_total', '상세 캐시 조회 수', detail[key], {'result': result})
+    
+    # 메모리
+    processes, chromium_rss = child_processes_rss()
+    out.gauge('naver_crawler_process_rss_bytes', 'Flask/크롤러 파이썬 프로세스 RSS', process_rss_bytes())
+    out.gauge('naver_crawler_chromium_processes', 'Chromium/드라이버 하위 프로세스 수', processes)
+    out.gauge('naver_crawler_chromium_rss_bytes', 'Chromium/드라이버 하위 프로세스 RSS 합계', chromium_rss)
+    
+    # 단계별 소요 시간
+    for phase, hist in latency_recorder.histograms().items():
+        out.histogram('naver_crawler_phase_duration_seconds', '크롤링 단계별 소요 시간',
+                      hist['bounds'], hist['counts'], hist['sum'], {'phase': phase}, scale=0.001)
+    
+    return Response(out.render(), content_type=CONTENT_TYPE)
+
 @app.route('/api/download-csv', methods=['POST'])
 def download_csv():
     data = request.json
     output = io.StringIO()
-    writer = csv.DictWriter(output, fieldnames=['keyword', 'name', 'category', 'address', 'phone', 'rating', 'reviews', 'place_type'])
-    writer.writeheader()
-    writer.writerows(data.get('results', []))
+    with latency_recorder.measure('serialize'):
+        writer = csv.DictWriter(output, fieldnames=['keyword', 'name', 'category', 'address', 'phone', 'rating', 'reviews', 'place_type'], extrasaction='ignore')
+        writer.writeheader()
+        writer.writerows(data.get('results', []))
     return Response(output.getvalue().encode('utf-8-sig'), mimetype='text/csv')
 
 # ========== Flask 서버 시작 ==========
 def run_flask():
+    job_manager.start()  # 이전 실행에서 남은 작업 재개
     app.run(host='0.0.0.0', port=5000, debug=False, use_reloader=False, threaded=True)
 
+print("🌐 브라우저 서비스 시작 중 (Chromium 1회 실행)...")
+try:
+    browser_service.start()
+except Exception as e:
+    print(f"⚠️ 브라우저 서비스 사전 시작 실패 (첫 요청 시 재시도): {e}")
+
 print("🚀 Flask 서버 시작 중...")
 flask_thread = threading.Thread(target=run_flask)
 flask_thread.daemon = True
@@ -1240,6 +1327,7 @@ try:
     while True:
         time.sleep(0.7)
 except KeyboardInterrupt:
+    browser_service.stop()
     print("\n✅ 서버 종료")
 
 
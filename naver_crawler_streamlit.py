@@ -3,23 +3,143 @@
 메인/타지역 업체 자동 판별 시스템
 """
 
-from playwright.async_api import async_playwright
 import asyncio
+import os
 import time
 import re
 from typing import List, Dict, Optional
 
+from async_browser_pool import AsyncBrowserPool
+from cancellation import CancelToken, CrawlCancelled
+from wait_engine import AsyncWaiter
+from request_blocking import BlockingProfile, RequestBlocker
+from apollo_state import extract_places, extract_places_from_html
+from detail_cache import DetailCache
+from region_classifier import classify_records
+from landmarks import landmark_index
+from detail_extract import DETAIL_DEBUG_HTML, detail_phone, ranked_candidates, read_detail_async
+from naver_endpoints import NaverEndpoints
+from phase_timing import CrawlResults, LatencyRecorder, PhaseTimer, latency_recorder
+from rate_limiter import RateLimiter, rate_limiter
+from page_classifier import BLOCKED, NO_PLACE, RESULTS, UNKNOWN, PageClassifier, Verdict
+
+
+# 데스크톱 컨텍스트 설정 (공유 풀 생성 시에도 사용)
+DESKTOP_CONTEXT_OPTIONS = {
+    'user_agent': (
+        'Mozilla/5.0 (Windows NT 10.0; Win64; x64) '
+        'AppleWebKit/537.36 (KHTML, like Gecko) '
+        'Chrome/120.0.0.0 Safari/537.36'
+    ),
+    'viewport': {'width': 1920, 'height': 1080},  # 데스크톱 해상도
+    'locale': 'ko-KR',
+    'timezone_id': 'Asia/Seoul'
+}
+
+# 봇 감지 우회 스크립트
+STEALTH_SCRIPT = """
+    Object.defineProperty(navigator, 'webdriver', {get: () => undefined});
+    Object.defineProperty(navigator, 'plugins', {get: () => [1, 2, 3, 4, 5]});
+    Object.defineProperty(navigator, 'languages', {get: () => ['ko-KR', 'ko']});
+"""
+
+
+# 상세 페이지 동시 로드 수
+DETAIL_CONCURRENCY = int(os.getenv('DETAIL_CONCURRENCY', '4'))
+
+# 검색 결과 아이템 후보 (로드/스크롤 안정화 판정용 - 아래 셀렉터 목록의 합집합)
+RESULT_ITEM_SELECTOR = (
+    'div.qbGlu, li.VLTHu, li.UEzoS, ul.place_section_content > li, '
+    '.place_list li, li._YwYLL, li[data-index]'
+)
+
+# 조기 판정 - 지도 페이지(목록/상세 iframe 유무, 차단), 목록 iframe(아이템 유무, 결과 없음 문구)
+MAP_PAGE_CLASSIFIER = PageClassifier('iframe#searchIframe, iframe#entryIframe')
+LIST_CLASSIFIER = PageClassifier(RESULT_ITEM_SELECTOR)
+
+# 리스트 아이템에서 플레이스 ID 추출 (링크 경로 또는 data 속성)
+PLACE_ID_SCRIPT = """
+el => {
+    const link = el.querySelector('a[href*="/place/"], a[href*="/restaurant/"], a[href*="/hospital/"], a[href*="/hairshop/"]');
+    const m = link && link.getAttribute('href').match(/\\/(?:place|restaurant|hospital|hairshop|nailshop|accommodation)\\/(\\d+)/);
+    if (m) return m[1];
+    const holder = el.matches('[data-id], [data-cid], [data-place-id]')
+        ? el : el.querySelector('[data-id], [data-cid], [data-place-id]');
+    if (!holder) return '';
+    return holder.dataset.id || holder.dataset.cid || holder.dataset.placeId || '';
+}
+"""
+
+# 리스트 iframe의 Apollo 상태 전체 (JSON 직렬화 가능한 캐시 객체)
+APOLLO_STATE_SCRIPT = "() => window.__APOLLO_STATE__ || null"
+
+# 리스트 iframe의 Apollo 상태에서 (상호명 → 플레이스 ID) 목록 추출
+APOLLO_IDS_SCRIPT = """
+() => {
+    const state = window.__APOLLO_STATE__ || {};
+    const out = [];
+    for (const value of Object.values(state)) {
+        if (value && value.id && value.name && /Summary$/.test(value.__typename || '')) {
+            out.push([value.name, String(value.id)]);
+        }
+    }
+    return out;
+}
+"""
+
+
+def create_browser_pool(max_contexts: int = 3, checkout_timeout: float = 60) -> AsyncBrowserPool:
+    """NaverPlaceCrawler용 브라우저 풀 생성"""
+    return AsyncBrowserPool(
+        max_contexts=max_contexts,
+        checkout_timeout=checkout_timeout,
+        context_options=DESKTOP_CONTEXT_OPTIONS,
+        init_script=STEALTH_SCRIPT
+    )
+
+
+# 플레이스가 없는 키워드의 결과 (1행)
+NO_PLACE_RESULT = {
+    'name': '플레이스 없음',
+    'category': '-',
+    'address': '-',
+    'phone': '-',
+    'rating': '-',
+    'reviews': '-',
+    'is_other_region': False,
+    'place_type': '플레이스 없음'
+}
+
 
 class NaverPlaceCrawler:
     """네이버 플레이스 크롤러"""
     
-    def __init__(self):
+    def __init__(self, pool: Optional[AsyncBrowserPool] = None,
+                 blocking: Optional[BlockingProfile] = None,
+                 detail_cache: Optional[DetailCache] = None,
+                 endpoints: Optional[NaverEndpoints] = None,
+                 recorder: Optional[LatencyRecorder] = None,
+                 limiter: Optional[RateLimiter] = None):
+        # 공유 브라우저 풀 (없으면 crawl 호출마다 임시 풀 생성)
+        self.pool = pool
+        
+        # 지도 타일/이미지/폰트/광고 요청 차단 규칙
+        self.blocking = blocking or BlockingProfile.from_env()
+        
+        # 플레이스 ID별 전화번호 캐시 - 상세 페이지 재방문 방지
+        self.detail_cache = detail_cache or DetailCache.from_env()
+        
+        # 네이버 주소 (NAVER_BASE_URL 지정 시 로컬 목 서버)
+        self.endpoints = endpoints or NaverEndpoints.from_env()
+        
+        # 단계별 소요 시간 히스토그램 (p50/p95/p99)
+        self.recorder = recorder or latency_recorder
+        
+        # 호스트별 요청 속도 제한 (모든 세션 공유, 차단 응답 시 자동 감속)
+        self.limiter = limiter or rate_limiter
+        
         # 데스크톱 User-Agent로 변경 (더 안정적)
-        self.user_agent = (
-            'Mozilla/5.0 (Windows NT 10.0; Win64; x64) '
-            'AppleWebKit/537.36 (KHTML, like Gecko) '
-            'Chrome/120.0.0.0 Safari/537.36'
-        )
+        self.user_agent = DESKTOP_CONTEXT_OPTIONS['user_agent']
         
         # 모바일 User-Agent (백업용)
         self.mobile_user_agent = (
@@ -28,95 +148,75 @@ class NaverPlaceCrawler:
             'Mobile/15E148 Safari/604.1'
         )
     
-    async def crawl(self, keyword: str, max_results: int = 20) -> List[Dict]:
+    async def crawl(self, keyword: str, max_results: int = 20,
+                    token: Optional[CancelToken] = None) -> List[Dict]:
         """
         네이버 플레이스 크롤링 실행
         
         Args:
             keyword: 검색 키워드
             max_results: 최대 결과 수
+            token: 취소 토큰 (취소/시간 예산 초과 시 남은 단계를 건너뜀)
             
         Returns:
-            크롤링 결과 리스트
+            크롤링 결과 리스트 (CrawlResults - .timing에 단계별 시간, 중간에 끊기면 .partial)
         """
         print(f"\n{'='*60}")
         print(f"🚀 크롤링 시작: '{keyword}'")
         print(f"{'='*60}")
         
+        timer = PhaseTimer(keyword)
+        token = token or CancelToken()
+        # 키워드별 예산은 작업을 시작할 때부터
+        token.start()
+        own_pool = self.pool is None
+        pool = self.pool or create_browser_pool(max_contexts=1)
+        
         try:
-            async with async_playwright() as p:
-                print("✓ Playwright 초기화 성공")
-                
-                try:
-                    browser = await p.chromium.launch(
-                        headless=True,
-                        args=[
-                            '--disable-blink-features=AutomationControlled',
-                            '--disable-dev-shm-usage',
-                            '--no-sandbox',
-                        ]
-                    )
-                    print("✓ Chromium 브라우저 실행 성공")
-                except Exception as launch_error:
-                    print(f"❌ 브라우저 실행 실패: {launch_error}")
-                    raise
-            
-                context = await browser.new_context(
-                    user_agent=self.user_agent,
-                    viewport={'width': 1920, 'height': 1080},  # 데스크톱 해상도
-                    locale='ko-KR',
-                    timezone_id='Asia/Seoul'
-                )
-                print("✓ 브라우저 컨텍스트 생성 성공")
+            async with pool.context() as context:
+                timer.lap("acquire")
+                print("✓ 브라우저 컨텍스트 확보 (공유 풀)")
                 
-                # 봇 감지 우회 스크립트
-                await context.add_init_script("""
-                    Object.defineProperty(navigator, 'webdriver', {get: () => undefined});
-                    Object.defineProperty(navigator, 'plugins', {get: () => [1, 2, 3, 4, 5]});
-                    Object.defineProperty(navigator, 'languages', {get: () => ['ko-KR', 'ko']});
-                """)
-                print("✓ 봇 우회 스크립트 추가 완료")
+                # 컨텍스트 단위로 연결 - 검색/상세 페이지 모두 적용, 반환 전 해제
+                blocker = RequestBlocker(self.blocking)
+                await blocker.attach_async(context)
+                watcher = self.limiter.watch(context)
                 
                 page = await context.new_page()
                 print("✓ 새 페이지 생성 성공")
                 
                 try:
-                    # 네이버 플레이스 검색 - 데스크톱 URL 시도
-                    import urllib.parse
-                    encoded_keyword = urllib.parse.quote(keyword)
+                    # 컨텍스트를 기다리는 동안 취소된 키워드는 접속하지 않음
+                    token.check()
                     
-                    # 모바일 대신 데스크톱 URL 사용
-                    search_url = f"https://map.naver.com/p/search/{encoded_keyword}"
+                    # 네이버 플레이스 검색 - 모바일 대신 데스크톱 URL 사용
+                    search_url = self.endpoints.map_search(keyword)
                     print(f"→ 검색 URL (데스크톱): {search_url}")
                     
                     # 페이지 로드 - networkidle 대기
-                    await page.goto(search_url, wait_until="networkidle", timeout=30000)
+                    timer.add("rate_wait", await self.limiter.wait_async(search_url, token) * 1000)
+                    token.check()
+                    response = await page.goto(search_url, wait_until="networkidle", timeout=token.timeout_ms(30000))
+                    timer.lap("navigate")
+                    token.check()
                     print("✓ 페이지 로드 완료 (networkidle)")
                     
-                    # 추가 대기 (JavaScript 실행 대기) - 속도 향상
-                    await asyncio.sleep(2)
-                    print("✓ JavaScript 실행 대기 완료")
+                    # 차단/오류/플레이스 없음이면 iframe을 10초 동안 기다리지 않고 바로 종료
+                    verdict = await MAP_PAGE_CLASSIFIER.classify_async(page, timeout=token.timeout_ms(5000), response=response)
+                    print(f"✓ 페이지 판정: {verdict.summary()}")
+                    if verdict.state not in (RESULTS, UNKNOWN):
+                        timer.lap("section_wait")
+                        return self._dead_keyword_results(keyword, verdict, timer, search_url, response)
                     
-                    # iframe이 생성될 때까지 대기 (최대 10초)
+                    # iframe이 place/list로 이동할 때까지 대기 (최대 10초, 이동 즉시 진행)
                     print("🔍 플레이스 iframe 로딩 대기 중...")
-                    search_frame = None
-                    for attempt in range(10):  # 10번 시도 (1초 간격)
-                        frames = page.frames
-                        
-                        # 1순위: place/list URL이 있는 iframe
-                        for frame in frames:
-                            if 'place.naver.com/place/list' in frame.url:
-                                search_frame = frame
-                                print(f"✓ 검색 결과 iframe 발견 (시도 {attempt+1}/10): {frame.url[:100]}...")
-                                break
-                        
-                        if search_frame:
-                            break
-                        
-                        # iframe이 아직 없으면 1초 대기
-                        if attempt < 9:
-                            await asyncio.sleep(1)
-                            print(f"  재시도 {attempt+2}/10...")
+                    waiter = AsyncWaiter(page)
+                    
+                    # 1순위: place/list URL이 있는 iframe
+                    search_frame = await waiter.frame('place.naver.com/place/list', timeout=token.timeout_ms(10000))
+                    if search_frame:
+                        print(f"✓ 검색 결과 iframe 발견: {search_frame.url[:100]}...")
+                    print(f"  {waiter.summary()}")
                     
                     # iframe 확인 및 디버그 출력
                     frames = page.frames
@@ -150,10 +250,22 @@ class NaverPlaceCrawler:
                                 print(f"✓ 플레이스 iframe 발견 (4순위 - name): {frame.name}, URL: {frame.url[:100]}...")
                                 break
                     
-                    # iframe이 있으면 그 안에서 추출, 없으면 플레이스 없음 반환
+                    timer.lap("section_wait")
+                    
+                    # iframe이 있으면 목록 판정 후 그 안에서 추출, 없으면 플레이스 없음 반환
                     if search_frame:
                         print(f"✅ 검색 iframe 선택됨: {search_frame.url[:100]}...")
-                        results = await self._extract_results(search_frame, keyword, max_results, main_page=page)
+                        verdict = await LIST_CLASSIFIER.classify_async(search_frame, timeout=token.timeout_ms(5000))
+                        print(f"✓ 목록 판정: {verdict.summary()}")
+                        if verdict.state not in (RESULTS, UNKNOWN):
+                            # 셀렉터만 바뀌었거나 목록이 늦게 그려졌을 수도 있으므로 Apollo 상태를 한 번 확인 (수 ms), 없으면 바로 종료
+                            if verdict.state == NO_PLACE and await self._collect_place_ids(search_frame):
+                                print("⚠️ 목록 셀렉터 없음 - Apollo 상태에 업체 있음 (계속 진행)")
+                            else:
+                                timer.lap("section_wait")
+                                return self._dead_keyword_results(keyword, verdict, timer, search_frame.url)
+                        results = await self._extract_results(search_frame, keyword, max_results, main_page=page,
+                                                              timer=timer, token=token)
                     else:
                         print("⚠️ 검색 iframe 없음 - 플레이스 탭 없음")
                         print("🔍 디버그: 모든 Frame 정보")
@@ -164,40 +276,89 @@ class NaverPlaceCrawler:
                             print(f"    - about:blank? {frame.url == 'about:blank'}")
                         
                         # 플레이스 없음 결과 반환
-                        results = [{
-                            'search_keyword': keyword,
-                            'name': '플레이스 없음',
-                            'category': '-',
-                            'address': '-',
-                            'phone': '-',
-                            'rating': '-',
-                            'reviews': '-',
-                            'is_other_region': False,
-                            'place_type': '플레이스 없음'
-                        }]
+                        results = [dict(NO_PLACE_RESULT, search_keyword=keyword)]
                     
                     print(f"✓ 최종 결과: {len(results)}개 추출")
-                    return results
-                    
+                    print(f"⏱ {timer.finish().summary()}")
+                    if token.cancelled:
+                        print(f"⏹ 일부 단계 생략 ({token.reason}) - 부분 결과 반환")
+                    return CrawlResults(results, timer.as_dict(), partial=token.cancelled,
+                                        status=RESULTS if search_frame else NO_PLACE)
+                    
+                except CrawlCancelled as e:
+                    print(f"⏹ '{keyword}' 크롤링 중단 ({e})")
+                    return CrawlResults([], timer.finish().as_dict(), partial=True)
+                
                 except Exception as e:
                     print(f"❌ 크롤링 오류: {str(e)}")
                     import traceback
                     traceback.print_exc()
-                    return []
+                    return CrawlResults([], timer.finish().as_dict(), partial=token.cancelled)
                 
                 finally:
-                    await browser.close()
-                    print("✓ 브라우저 종료")
+                    await page.close()
+                    await blocker.detach_async(context)
+                    self.limiter.unwatch(context, watcher)
+                    print(f"🚫 {blocker.stats.summary()}")
                     
         except Exception as outer_error:
             print(f"❌ Playwright 실행 실패: {outer_error}")
             import traceback
             traceback.print_exc()
-            return []
+            return CrawlResults([], timer.finish().as_dict())
+        
+        finally:
+            self.recorder.record(timer.finish())
+            if own_pool:
+                await pool.close()
+                print("✓ 브라우저 종료")
+    
+    def _dead_keyword_results(self, keyword: str, verdict: Verdict, timer: PhaseTimer,
+                              url: str, response=None) -> CrawlResults:
+        """플레이스 없음/차단/오류 판정 → iframe 대기·스크롤·추출 없이 바로 반환할 결과"""
+        if verdict.state == NO_PLACE:
+            print(f"⚠️ '{keyword}' 플레이스 없음 ({verdict.reason}) - 대기/추출 생략")
+            results = [dict(NO_PLACE_RESULT, search_keyword=keyword)]
+        else:
+            if verdict.state == BLOCKED and (response is None or response.status < 400):
+                self.limiter.report_blocked(url)
+            print(f"⛔ '{keyword}' {'차단/캡차 페이지' if verdict.state == BLOCKED else '오류 응답'} ({verdict.reason}) - 크롤링 중단")
+            results = []
+        print(f"⏱ {timer.finish().summary()}")
+        return CrawlResults(results, timer.as_dict(), status=verdict.state, reason=verdict.reason)
     
-    async def _extract_results(self, page, keyword: str, max_results: int, main_page=None) -> List[Dict]:
-        """검색 결과 추출"""
+    async def crawl_many(self, keywords: List[str], max_results: int = 20) -> List[List[Dict]]:
+        """
+        여러 키워드를 동시에 크롤링 (동시 실행 수는 풀 크기로 제한)
+        
+        Returns:
+            keywords와 같은 순서의 결과 리스트
+        """
+        own_pool = self.pool is None
+        if own_pool:
+            self.pool = create_browser_pool()
+        
+        async def crawl_one(keyword):
+            try:
+                return await self.crawl(keyword, max_results=max_results)
+            except Exception as e:
+                print(f"❌ '{keyword}' 크롤링 실패: {e}")
+                return []
+        
+        try:
+            return list(await asyncio.gather(*(crawl_one(k) for k in keywords)))
+        finally:
+            if own_pool:
+                await self.pool.close()
+                self.pool = None
+    
+    async def _extract_results(self, page, keyword: str, max_results: int, main_page=None,
+                               timer: Optional[PhaseTimer] = None,
+                               token: Optional[CancelToken] = None) -> List[Dict]:
+        """검색 결과 추출 (token이 취소되면 스크롤/상세 페이지를 건너뛰고 목록 정보만)"""
         results = []
+        timer = timer or PhaseTimer(keyword)
+        token = token or CancelToken()
         
         # main_page가 없으면 page를 사용 (하위 호환성)
         if main_page is None:
@@ -206,22 +367,27 @@ class NaverPlaceCrawler:
         try:
             print(f"\n🔍 '{keyword}' 검색 결과 추출 시작... (v2.0 - 자동 셀렉터)")
             
-            # 검색 결과 로드 대기
-            await asyncio.sleep(3)
+            # 검색 결과 로드 대기 - 아이템이 나타나고 개수가 안정될 때까지
+            waiter = AsyncWaiter(main_page)
+            target = page if page is not main_page else None
+            await waiter.selector(RESULT_ITEM_SELECTOR, timeout=token.timeout_ms(5000), target=target)
+            await waiter.settled(RESULT_ITEM_SELECTOR, timeout=token.timeout_ms(3000), target=target)
+            timer.lap("section_wait")
             
-            # 페이지 HTML 확인 (디버깅용)
-            html = await page.content()
-            print(f"  → 페이지 HTML 길이: {len(html)} 문자")
-            
-            # HTML 샘플 출력 (처음 500자)
-            print(f"  → HTML 샘플 (처음 500자):")
-            print(f"     {html[:500]}")
-            
-            # 특정 키워드 검색
-            if "플레이스" in html or "place" in html.lower():
-                print("  ✓ HTML에 '플레이스' 관련 키워드 발견")
-            else:
-                print("  ❌ HTML에 '플레이스' 키워드 없음 (차단되었을 수 있음)")
+            # 페이지 HTML 확인 (디버깅용 - HTML 전체 전송은 DETAIL_DEBUG_HTML=1일 때만)
+            if DETAIL_DEBUG_HTML:
+                html = await page.content()
+                print(f"  → 페이지 HTML 길이: {len(html)} 문자")
+                
+                # HTML 샘플 출력 (처음 500자)
+                print(f"  → HTML 샘플 (처음 500자):")
+                print(f"     {html[:500]}")
+                
+                # 특정 키워드 검색
+                if "플레이스" in html or "place" in html.lower():
+                    print("  ✓ HTML에 '플레이스' 관련 키워드 발견")
+                else:
+                    print("  ❌ HTML에 '플레이스' 키워드 없음 (차단되었을 수 있음)")
             
             # 현재 URL 확인
             current_url = page.url
@@ -230,371 +396,72 @@ class NaverPlaceCrawler:
             # 스크롤하여 더 많은 결과 로드
             print("  → 스크롤 중...")
             for i in range(3):
+                if token.cancelled:
+                    break
                 await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                await asyncio.sleep(0.5)
-            
-            # HTML 전체 저장 (디버깅용)
-            full_html = await page.content()
-            import os
-            debug_file = "/tmp/naver_place_debug.html"
-            with open(debug_file, "w", encoding="utf-8") as f:
-                f.write(full_html)
-            print(f"  📝 전체 HTML 저장됨: {debug_file} ({len(full_html)} 문자)")
-            
-            # 플레이스 아이템 찾기 - 여러 셀렉터 시도
-            print("  → 셀렉터로 아이템 찾는 중...")
-            
-            # 시도할 모든 셀렉터 (iframe 내부용)
-            selectors = [
-                # PC 데스크톱 검색 결과 (pcmap.place.naver.com/place/list)
-                # 각 검색 결과는 ul 안의 li.VLTHu 내부의 개별 div
-                ('ul > li.VLTHu > div.qbGlu', 'ul > li > div.qbGlu (개별 검색 결과)'),  # 최우선
-                ('div.qbGlu', 'div.qbGlu (검색 결과 카드)'),
-                ('li.VLTHu', 'li.VLTHu (PC 검색 결과 리스트)'),
-                ('li.UEzoS', 'li.UEzoS (PC 검색 결과)'),
-                ('ul.place_section_content > li', 'ul.place_section_content > li'),
-                ('.place_list li', '.place_list li'),
-                
-                # 모바일 검색 결과
-                ('li._YwYLL', 'li._YwYLL (모바일)'),
-                ('li[data-index]', 'li[data-index]'),
-                ('.item_inner', '.item_inner'),
-                
-                # 일반 (UI 요소 제외)
-                ('ul.place_list > li', 'ul.place_list > li'),
-                ('div[role="list"] > div', 'div[role="list"] > div'),
-            ]
-            
-            items = []
-            max_found = 0
-            selected_selector_name = ""
-            
-            print("  → 모든 셀렉터 시도 중...")
-            
-            # 모든 셀렉터를 시도하고 가장 많은 아이템을 찾은 것 선택
-            for selector, name in selectors:
-                found = await page.query_selector_all(selector)
-                count = len(found)
-                print(f"    • {name}: {count}개")
-                
-                # 최소 3개 이상이고, 이전보다 많으면 업데이트
-                if count >= 3 and count > max_found:
-                    items = found
-                    max_found = count
-                    selected_selector_name = name
-                    print(f"      → 현재 최적: {name} ({count}개)")
-            
-            # 3개 미만이면 첫 번째로 발견한 것 사용
-            if not items:
-                print("  ⚠️ 3개 이상 찾지 못함, 첫 번째 셀렉터 사용")
-                for selector, name in selectors:
-                    found = await page.query_selector_all(selector)
-                    if found:
-                        items = found
-                        selected_selector_name = name
-                        break
+                await waiter.settled(RESULT_ITEM_SELECTOR, timeout=token.timeout_ms(1500), target=target)
+            timer.lap("scroll")
+            print(f"  → {waiter.summary()}")
             
-            print(f"\n  ✅ 최종 선택된 셀렉터: {selected_selector_name}")
-            print(f"  ✅ 최종 발견된 아이템 수: {len(items)}")
+            # HTML 전체 저장 (디버깅용 - DETAIL_DEBUG_HTML=1일 때만)
+            full_html = None
+            if DETAIL_DEBUG_HTML:
+                full_html = await page.content()
+                debug_file = "/tmp/naver_place_debug.html"
+                with open(debug_file, "w", encoding="utf-8") as f:
+                    f.write(full_html)
+                print(f"  📝 전체 HTML 저장됨: {debug_file} ({len(full_html)} 문자)")
             
-            # ========== 1단계: 리스트에서 기본 정보만 수집 (iframe detach 방지) ==========
+            # ========== 1단계: 리스트 기본 정보 수집 ==========
+            # 1순위: 리스트 iframe의 Apollo 상태 - evaluate 1회 + JSON 디코딩으로 전체 목록
             print(f"\n📋 1단계: 리스트에서 기본 정보 수집 중...")
-            temp_items = []
-            
-            for idx, item in enumerate(items[:max_results]):
-                try:
-                    print(f"  [{idx+1}] 아이템 처리 중...")
-                    
-                    # 디버깅: 처음 3개 아이템 HTML 출력
-                    if idx < 3:
-                        item_html = await item.inner_html()
-                        print(f"    → 아이템 HTML 길이: {len(item_html)}")
-                        # YwYLL 클래스 찾기
-                        ywyll_test = await item.query_selector_all('.YwYLL')
-                        print(f"    → YwYLL 요소 수: {len(ywyll_test)}")
-                        for yw_idx, yw in enumerate(ywyll_test[:3]):
-                            yw_text = await yw.inner_text()
-                            print(f"      YwYLL[{yw_idx}]: {yw_text[:50]}")
-                    
-                    # 상호명 - place_bluelink 안의 YwYLL만 사용 (정확도 향상)
-                    name = ""
-                    place_link_for_name = await item.query_selector('a.place_bluelink')
-                    if place_link_for_name:
-                        ywyll_elem = await place_link_for_name.query_selector('.YwYLL')
-                        if ywyll_elem:
-                            name = await ywyll_elem.inner_text()
-                            name = name.strip() if name else ""
-                    
-                    # 실패하면 전체에서 첫 번째 YwYLL 찾기
-                    if not name:
-                        ywyll_elem = await item.query_selector('.YwYLL')
-                        if ywyll_elem:
-                            name = await ywyll_elem.inner_text()
-                            name = name.strip() if name else ""
-                    
-                    if not name:
-                        print(f"    ⚠️ 상호명 없음, 스킵")
-                        continue
-                    
-                    if idx < 3:
-                        print(f"    → 상호명: {name}")
-                    
-                    # 주소
-                    addr = ""
-                    addr_elem = await item.query_selector('.Pb4bU')
-                    if addr_elem:
-                        addr = await addr_elem.inner_text()
-                        addr = addr.strip() if addr else ""
-                    
-                    # 카테고리
-                    category = await self._get_text(item, ['.YzBgS', 'span.YzBgS'])
-                    
-                    # 평점
-                    rating = await self._get_text(item, ['.h69bs', '[class*="rating"]'])
-                    
-                    # 리뷰 수
-                    reviews = await self._get_text(item, ['.AQ85', '[class*="review"]'])
-                    
-                    # 상세 페이지 링크 요소만 저장 (나중에 클릭)
-                    # href는 '#'이므로 사용 불가, 클릭 이벤트 필요
-                    place_link = await item.query_selector('a.place_bluelink')
-                    
-                    if idx < 3:
-                        if place_link:
-                            href_attr = await place_link.get_attribute('href')
-                            print(f"    → place_link 있음 (href: {href_attr})")
-                        else:
-                            print(f"    → place_link 없음")
-                    
-                    temp_items.append({
-                        'name': name,
-                        'category': category or "미분류",
-                        'address': addr or "주소 정보 없음",
-                        'rating': rating or "",
-                        'reviews': reviews or "",
-                        'item_element': item  # 아이템 요소 자체를 저장
-                    })
-                    
-                    print(f"    ✓ {name} - 기본 정보 수집 완료 (link: {'있음' if place_link else '없음'})")
-                    
-                except Exception as e:
-                    print(f"    ⚠️ 아이템 추출 실패: {str(e)}")
-                    continue
+            temp_items = await self._collect_items_apollo(page, full_html, max_results)
+            item_count = len(temp_items)
+            if temp_items:
+                print(f"  ✓ Apollo 상태에서 {item_count}개 추출 (셀렉터 생략)")
+            else:
+                # 2순위: 셀렉터 방식 (아이템마다 query_selector 반복)
+                temp_items, item_count = await self._collect_items_dom(page, max_results)
             
+            timer.lap("list_extract")
             print(f"\n✅ 1단계 완료: {len(temp_items)}개 업체 기본 정보 수집")
             
-            # ========== 2단계: 상세 페이지에서 전화번호 수집 ==========
+            # ========== 2단계: 상세 페이지에서 전화번호 수집 (직접 로드, 동시 처리) ==========
             print(f"\n📞 2단계: 상세 페이지에서 전화번호 수집 중...")
-            print(f"  → 수집할 업체 수: {len(temp_items)}개")
+            print(f"  → 수집할 업체 수: {len(temp_items)}개 (동시 {DETAIL_CONCURRENCY}개)")
             
-            for idx, temp_item in enumerate(temp_items):
-                try:
-                    print(f"\n  [{idx+1}/{len(temp_items)}] {temp_item['name']} 전화번호 수집 중...")
-                    
-                    phone = ""
-                    
-                    # 아이템 요소에서 링크 찾기
-                    try:
-                        item_elem = temp_item['item_element']
-                        place_link = await item_elem.query_selector('a.place_bluelink')
-                        
-                        if not place_link:
-                            print(f"    ⚠️ place_link 없음, 스킵")
-                            # 전화번호 없이 결과 추가
-                            is_other = self._is_other_region(
-                                temp_item['name'], 
-                                temp_item['address'], 
-                                "", 
-                                temp_item['rating'], 
-                                keyword
-                            )
-                            
-                            results.append({
-                                'name': temp_item['name'],
-                                'category': temp_item['category'],
-                                'address': temp_item['address'],
-                                'phone': "전화번호 없음",
-                                'rating': temp_item['rating'],
-                                'reviews': temp_item['reviews'],
-                                'is_other_region': is_other,
-                                'place_type': '타지역업체' if is_other else '주업체'
-                            })
-                            continue
-                        
-                        print(f"    → 링크 클릭 시도...")
-                        
-                        # 현재 URL 저장
-                        old_url = main_page.url
-                        
-                        # 링크 클릭 (JavaScript 이벤트 실행)
-                        await place_link.click()
-                        
-                        # URL 변경 대기 (최대 5초)
-                        try:
-                            await main_page.wait_for_url(lambda url: url != old_url, timeout=5000)
-                            print(f"    → 상세 페이지로 이동 완료")
-                        except:
-                            print(f"    ⚠️ URL 변경 없음 (타임아웃)")
-                        
-                        await asyncio.sleep(1.5)  # 추가 로딩 대기 - 속도 향상
-                        
-                        # 현재 메인 페이지 URL 확인
-                        current_main_url = main_page.url
-                        if idx < 3:
-                            print(f"    → 현재 메인 페이지 URL: {current_main_url[:100]}")
-                        
-                        # place iframe 찾기
-                        print(f"    → iframe 수: {len(main_page.frames)}")
-                        place_frame_found = False
-                        
-                        # 모든 프레임 URL 출력 (처음 3개 아이템만)
-                        if idx < 3:
-                            for frame_idx, frame in enumerate(main_page.frames):
-                                print(f"      Frame {frame_idx}: {frame.url}")
-                        
-                        for frame_idx, frame in enumerate(main_page.frames):
-                            frame_url = frame.url.lower()
-                            
-                            # pcmap.place.naver.com/place/XXX/home 또는 /entry 형태만 매칭
-                            # (placePath=/home 파라미터는 제외)
-                            is_detail_page = (
-                                'pcmap.place.naver.com/place/' in frame_url and
-                                ('/home' in frame_url or '/entry' in frame_url) and
-                                'placepath=' not in frame_url  # URL 파라미터 제외
-                            )
-                            
-                            if is_detail_page:
-                                place_frame_found = True
-                                print(f"    → place 상세 iframe 발견: Frame {frame_idx}")
-                                await asyncio.sleep(1)  # 대기 시간 - 속도 향상
-                                detail_html = await frame.content()
-                                print(f"    → HTML 길이: {len(detail_html)}")
-                                
-                                # 1. tel: 링크 찾기 (가장 확실한 방법)
-                                tel_elem = await frame.query_selector('a[href^="tel:"]')
-                                if tel_elem:
-                                    tel_href = await tel_elem.get_attribute('href')
-                                    if tel_href:
-                                        phone = tel_href.replace('tel:', '').strip()
-                                        print(f"    ✅ tel: 링크에서 전화번호: {phone}")
-                                        break
-                                else:
-                                    if idx < 3:
-                                        print(f"    → tel: 링크 없음, 다른 방법 시도...")
-                                
-                                # 2. 다양한 셀렉터로 전화번호 요소 직접 찾기
-                                if not phone:
-                                    phone_selectors = [
-                                        'span.xlx7Q',  # PC 상세 페이지 전화번호
-                                        'span[class*="phone"]',
-                                        'div[class*="phone"]',
-                                        'a.phone',
-                                        '.contact_number',
-                                        '[data-phone]',
-                                    ]
-                                    
-                                    for selector in phone_selectors:
-                                        try:
-                                            phone_elem = await frame.query_selector(selector)
-                                            if phone_elem:
-                                                phone_text = await phone_elem.inner_text()
-                                                if phone_text and re.search(r'\d{2,4}[-\s]?\d{3,4}[-\s]?\d{4}', phone_text):
-                                                    phone = phone_text.strip()
-                                                    print(f"    ✅ 셀렉터({selector})에서 전화번호: {phone}")
-                                                    break
-                                        except:
-                                            continue
-                                
-                                # 3. HTML에서 직접 찾기
-                                if not phone:
-                                    tel_match = re.search(r'href=["\']tel:([0-9\-]+)["\']', detail_html)
-                                    if tel_match:
-                                        phone = tel_match.group(1).strip()
-                                        print(f"    ✅ HTML에서 전화번호: {phone}")
-                                        break
-                                    else:
-                                        if idx < 3:
-                                            print(f"    → HTML에서 tel: 패턴 없음")
-                                
-                                # 4. 정규식으로 찾기 (다양한 패턴 지원)
-                                if not phone:
-                                    phone_patterns = [
-                                        r'(0507[-\s]?\d{4}[-\s]?\d{4})',     # 0507-xxxx-xxxx (네이버 대표)
-                                        r'(070[-\s]?\d{3,4}[-\s]?\d{4})',    # 070-xxx-xxxx
-                                        r'(0\d{1,2}[-\s]?\d{3,4}[-\s]?\d{4})',  # 02-xxx-xxxx, 031-xxx-xxxx
-                                        r'(1\d{3}[-\s]?\d{4})',           # 1588-xxxx
-                                    ]
-                                    for pattern in phone_patterns:
-                                        match = re.search(pattern, detail_html)
-                                        if match:
-                                            temp_phone = match.group(1).strip()
-                                            # 하이픈 정규화
-                                            temp_phone = re.sub(r'\s+', '-', temp_phone)
-                                            # 날짜 제외 (8자리 연속 숫자)
-                                            if not re.match(r'^\d{8}$', temp_phone.replace('-', '')):
-                                                phone = temp_phone
-                                                print(f"    ✅ 정규식으로 전화번호: {phone}")
-                                                break
-                                    
-                                    if not phone and idx < 3:
-                                        print(f"    → 정규식으로도 전화번호 없음")
-                                        # HTML 일부 출력 (디버깅용)
-                                        print(f"    → HTML 샘플 (1000-1500자): {detail_html[1000:1500]}")
-                                
-                                if phone:
-                                    break
-                        
-                        if not place_frame_found:
-                            print(f"    ⚠️ place 상세 iframe을 찾지 못함")
-                            if idx < 3:
-                                print(f"    ⚠️ 상세 페이지로 이동하지 않았을 가능성 - 메인 URL: {main_page.url[:100]}")
-                        
-                        # 뒤로 가기 (리스트로 돌아가기)
-                        await main_page.go_back()
-                        await asyncio.sleep(1)
-                    
-                    except Exception as e:
-                        print(f"    ⚠️ 상세 페이지 열기 실패: {str(e)[:100]}")
-                    
-                    # 최종 결과 추가
-                    is_other = self._is_other_region(
-                        temp_item['name'], 
-                        temp_item['address'], 
-                        phone, 
-                        temp_item['rating'], 
-                        keyword
-                    )
-                    
-                    results.append({
-                        'name': temp_item['name'],
-                        'category': temp_item['category'],
-                        'address': temp_item['address'],
-                        'phone': phone or "전화번호 없음",
-                        'rating': temp_item['rating'],
-                        'reviews': temp_item['reviews'],
-                        'is_other_region': is_other,
-                        'place_type': '타지역업체' if is_other else '주업체'
-                    })
-                    
-                    print(f"  [{idx+1}] {temp_item['name']} - {phone or '전화번호 없음'} → {'타지역' if is_other else '메인'}")
-                    
-                except Exception as e:
-                    print(f"  ⚠️ 전화번호 수집 실패: {str(e)[:100]}")
-                    continue
+            owner_page = main_page if hasattr(main_page, 'context') else main_page.page
+            phones = await self._fetch_phones(owner_page.context, temp_items, timer, token)
+            timer.lap("detail")
+            
+            # 타지역업체 판정 - 키워드 지명까지 거리(distance_km) 추가 후 전체 업체를 열 단위로 한 번에
+            landmark_index.annotate(temp_items, keyword)
+            other_flags, _ = classify_records(
+                [dict(temp_item, phone=phone) for temp_item, phone in zip(temp_items, phones)],
+                "streamlit", keyword,
+            )
+            
+            # 리스트 순서대로 최종 결과 구성
+            for idx, (temp_item, phone, is_other) in enumerate(zip(temp_items, phones, other_flags)):
+                results.append({
+                    'name': temp_item['name'],
+                    'category': temp_item['category'],
+                    'address': temp_item['address'],
+                    'phone': phone or "전화번호 없음",
+                    'rating': temp_item['rating'],
+                    'reviews': temp_item['reviews'],
+                    'distance_km': temp_item.get('distance_km'),
+                    'is_other_region': is_other,
+                    'place_type': '타지역업체' if is_other else '주업체'
+                })
+                
+                print(f"  [{idx+1}] {temp_item['name']} - {phone or '전화번호 없음'} → {'타지역' if is_other else '메인'}")
+            timer.lap("classify")
             
             if not results:
-                print(f"  ⚠️ '{keyword}': 추출된 결과 없음 (아이템은 {len(items)}개 발견) - 플레이스 없음으로 표시")
+                print(f"  ⚠️ '{keyword}': 추출된 결과 없음 (아이템은 {item_count}개 발견) - 플레이스 없음으로 표시")
                 # 결과가 없어도 플레이스 없음으로 표시
-                results = [{
-                    'name': '플레이스 없음',
-                    'category': '-',
-                    'address': '-',
-                    'phone': '-',
-                    'rating': '-',
-                    'reviews': '-',
-                    'is_other_region': False,
-                    'place_type': '플레이스 없음'
-                }]
+                results = [dict(NO_PLACE_RESULT)]
             else:
                 print(f"  ✅ '{keyword}': {len(results)}개 결과 추출 완료")
             
@@ -605,6 +472,273 @@ class NaverPlaceCrawler:
         
         return results
     
+    async def _collect_items_apollo(self, frame, html: Optional[str], max_results: int) -> List[Dict]:
+        """Apollo 상태 → 1단계 아이템 (상태가 없으면 빈 리스트, html은 디버그 모드에서 받은 경우에만 대체 경로로)"""
+        try:
+            state = await frame.evaluate(APOLLO_STATE_SCRIPT)
+            records = extract_places([state], max_results) if state else []
+        except Exception as e:
+            print(f"  ⚠️ Apollo 상태 읽기 실패: {str(e)[:100]}")
+            records = []
+        if not records and html:
+            records = extract_places_from_html(html, max_results)
+        
+        return [{
+            'name': record['name'],
+            'category': record['category'] or "미분류",
+            'address': record['address'] or "주소 정보 없음",
+            'rating': record['rating'],
+            'reviews': record['reviews'],
+            'place_id': record['place_id'],
+            'phone': record['phone'],
+            'latitude': record['latitude'],
+            'longitude': record['longitude']
+        } for record in records]
+    
+    async def _collect_items_dom(self, page, max_results: int):
+        """셀렉터 방식 1단계 (Apollo 상태가 없을 때의 대체 경로) → (temp_items, 발견 아이템 수)"""
+        # 플레이스 아이템 찾기 - 여러 셀렉터 시도
+        print("  → 셀렉터로 아이템 찾는 중...")
+        
+        # 시도할 모든 셀렉터 (iframe 내부용)
+        selectors = [
+            # PC 데스크톱 검색 결과 (pcmap.place.naver.com/place/list)
+            # 각 검색 결과는 ul 안의 li.VLTHu 내부의 개별 div
+            ('ul > li.VLTHu > div.qbGlu', 'ul > li > div.qbGlu (개별 검색 결과)'),  # 최우선
+            ('div.qbGlu', 'div.qbGlu (검색 결과 카드)'),
+            ('li.VLTHu', 'li.VLTHu (PC 검색 결과 리스트)'),
+            ('li.UEzoS', 'li.UEzoS (PC 검색 결과)'),
+            ('ul.place_section_content > li', 'ul.place_section_content > li'),
+            ('.place_list li', '.place_list li'),
+            
+            # 모바일 검색 결과
+            ('li._YwYLL', 'li._YwYLL (모바일)'),
+            ('li[data-index]', 'li[data-index]'),
+            ('.item_inner', '.item_inner'),
+            
+            # 일반 (UI 요소 제외)
+            ('ul.place_list > li', 'ul.place_list > li'),
+            ('div[role="list"] > div', 'div[role="list"] > div'),
+        ]
+        
+        items = []
+        max_found = 0
+        selected_selector_name = ""
+        
+        print("  → 모든 셀렉터 시도 중...")
+        
+        # 모든 셀렉터를 시도하고 가장 많은 아이템을 찾은 것 선택
+        for selector, name in selectors:
+            found = await page.query_selector_all(selector)
+            count = len(found)
+            print(f"    • {name}: {count}개")
+            
+            # 최소 3개 이상이고, 이전보다 많으면 업데이트
+            if count >= 3 and count > max_found:
+                items = found
+                max_found = count
+                selected_selector_name = name
+                print(f"      → 현재 최적: {name} ({count}개)")
+        
+        # 3개 미만이면 첫 번째로 발견한 것 사용
+        if not items:
+            print("  ⚠️ 3개 이상 찾지 못함, 첫 번째 셀렉터 사용")
+            for selector, name in selectors:
+                found = await page.query_selector_all(selector)
+                if found:
+                    items = found
+                    selected_selector_name = name
+                    break
+        
+        print(f"\n  ✅ 최종 선택된 셀렉터: {selected_selector_name}")
+        print(f"  ✅ 최종 발견된 아이템 수: {len(items)}")
+        
+        # 리스트에서 기본 정보 + 플레이스 ID 수집
+        temp_items = []
+        place_ids_by_name = await self._collect_place_ids(page)
+        
+        for idx, item in enumerate(items[:max_results]):
+            try:
+                print(f"  [{idx+1}] 아이템 처리 중...")
+                
+                # 디버깅: 처음 3개 아이템 HTML 출력
+                if idx < 3:
+                    item_html = await item.inner_html()
+                    print(f"    → 아이템 HTML 길이: {len(item_html)}")
+                    # YwYLL 클래스 찾기
+                    ywyll_test = await item.query_selector_all('.YwYLL')
+                    print(f"    → YwYLL 요소 수: {len(ywyll_test)}")
+                    for yw_idx, yw in enumerate(ywyll_test[:3]):
+                        yw_text = await yw.inner_text()
+                        print(f"      YwYLL[{yw_idx}]: {yw_text[:50]}")
+                
+                # 상호명 - place_bluelink 안의 YwYLL만 사용 (정확도 향상)
+                name = ""
+                place_link_for_name = await item.query_selector('a.place_bluelink')
+                if place_link_for_name:
+                    ywyll_elem = await place_link_for_name.query_selector('.YwYLL')
+                    if ywyll_elem:
+                        name = await ywyll_elem.inner_text()
+                        name = name.strip() if name else ""
+                
+                # 실패하면 전체에서 첫 번째 YwYLL 찾기
+                if not name:
+                    ywyll_elem = await item.query_selector('.YwYLL')
+                    if ywyll_elem:
+                        name = await ywyll_elem.inner_text()
+                        name = name.strip() if name else ""
+                
+                if not name:
+                    print(f"    ⚠️ 상호명 없음, 스킵")
+                    continue
+                
+                if idx < 3:
+                    print(f"    → 상호명: {name}")
+                
+                # 주소
+                addr = ""
+                addr_elem = await item.query_selector('.Pb4bU')
+                if addr_elem:
+                    addr = await addr_elem.inner_text()
+                    addr = addr.strip() if addr else ""
+                
+                # 카테고리
+                category = await self._get_text(item, ['.YzBgS', 'span.YzBgS'])
+                
+                # 평점
+                rating = await self._get_text(item, ['.h69bs', '[class*="rating"]'])
+                
+                # 리뷰 수
+                reviews = await self._get_text(item, ['.AQ85', '[class*="review"]'])
+                
+                # 플레이스 ID 수집 (place_bluelink의 href는 '#'이므로 아이템 속성/링크 → Apollo 상태 순으로 확인)
+                place_id = await item.evaluate(PLACE_ID_SCRIPT)
+                if not place_id:
+                    place_id = place_ids_by_name.get(self._normalize_name(name), "")
+                
+                if idx < 3:
+                    print(f"    → place_id: {place_id or '없음'}")
+                
+                temp_items.append({
+                    'name': name,
+                    'category': category or "미분류",
+                    'address': addr or "주소 정보 없음",
+                    'rating': rating or "",
+                    'reviews': reviews or "",
+                    'place_id': place_id
+                })
+                
+                print(f"    ✓ {name} - 기본 정보 수집 완료 (place_id: {place_id or '없음'})")
+                
+            except Exception as e:
+                print(f"    ⚠️ 아이템 추출 실패: {str(e)}")
+                continue
+        
+        return temp_items, len(items)
+    
+    async def _collect_place_ids(self, frame) -> Dict[str, str]:
+        """리스트 iframe의 Apollo 상태에서 상호명 → 플레이스 ID 매핑 (없으면 빈 dict)"""
+        try:
+            pairs = await frame.evaluate(APOLLO_IDS_SCRIPT)
+        except Exception as e:
+            print(f"  ⚠️ Apollo 상태 읽기 실패: {str(e)[:100]}")
+            return {}
+        print(f"  → Apollo 상태에서 플레이스 ID {len(pairs)}개 확인")
+        return {self._normalize_name(name): place_id for name, place_id in pairs}
+    
+    @staticmethod
+    def _normalize_name(name: str) -> str:
+        """상호명 비교용 정규화 (<mark> 태그/공백 제거)"""
+        return re.sub(r'<[^>]+>|\s+', '', name or '')
+    
+    async def _fetch_phones(self, context, temp_items: List[Dict],
+                            timer: Optional[PhaseTimer] = None,
+                            token: Optional[CancelToken] = None) -> List[str]:
+        """
+        상세(entry) 페이지를 재사용 페이지 풀에서 동시에 직접 로드해 전화번호 수집
+        
+        메인 페이지 클릭/뒤로가기에 의존하지 않으며, 결과는 temp_items 순서대로 반환
+        token이 취소되면 아직 열지 않은 상세 페이지는 건너뜀 (전화번호 빈 값)
+        """
+        token = token or CancelToken()
+        # Apollo 상태에서 이미 전화번호를 얻은 업체, 상세 캐시에 있는 업체는 상세 페이지 생략
+        phones = [item.get('phone') or "" for item in temp_items]
+        cached_count = 0
+        for i, item in enumerate(temp_items):
+            if phones[i] or not item.get('place_id'):
+                continue
+            cached = self.detail_cache.get(item['place_id'])
+            if cached and cached['phones']:
+                phones[i] = cached['phones'][0]
+                cached_count += 1
+        if cached_count:
+            print(f"  → 상세 캐시 적중: {cached_count}개 (상세 페이지 생략)")
+        
+        targets = [i for i, item in enumerate(temp_items) if item.get('place_id') and not phones[i]]
+        if targets and token.cancelled:
+            print(f"  ⏹ 상세 페이지 {len(targets)}개 생략 ({token.reason})")
+            return phones
+        if not targets:
+            print("  → 상세 페이지를 열 업체 없음 (전화번호 확보 또는 플레이스 ID 없음)")
+            return phones
+        
+        pages: asyncio.Queue = asyncio.Queue()
+        opened = []
+        for _ in range(min(DETAIL_CONCURRENCY, len(targets))):
+            detail_page = await context.new_page()
+            opened.append(detail_page)
+            pages.put_nowait(detail_page)
+        
+        async def fetch(i):
+            item = temp_items[i]
+            detail_page = await pages.get()
+            url = self.endpoints.place_detail(item['place_id'])
+            waited = await self.limiter.wait_async(url, token)
+            if timer:
+                timer.add("rate_wait", waited * 1000)
+            if token.cancelled:
+                pages.put_nowait(detail_page)
+                return
+            started = time.perf_counter()
+            try:
+                await detail_page.goto(url, wait_until="domcontentloaded", timeout=token.timeout_ms(15000))
+                detail = await read_detail_async(detail_page, place_id=item['place_id'])
+                phones[i] = self._extract_phone(detail, i)
+                # 상세 캐시 - 고른 번호를 맨 앞에 둔 후보 전체와 상세 주소 (core와 같은 형태)
+                self.detail_cache.put(item['place_id'], phones=ranked_candidates(detail),
+                                      address=detail['address'] or detail['apollo_address'])
+            except Exception as e:
+                print(f"    ⚠️ [{i+1}] {item['name']} 상세 페이지 열기 실패: {str(e)[:100]}")
+            finally:
+                if timer:
+                    timer.add("detail_item", (time.perf_counter() - started) * 1000)
+                pages.put_nowait(detail_page)
+        
+        try:
+            await asyncio.gather(*(fetch(i) for i in targets))
+        finally:
+            for detail_page in opened:
+                try:
+                    await detail_page.close()
+                except Exception:
+                    pass
+        
+        return phones
+    
+    def _extract_phone(self, detail: Dict, idx: int) -> str:
+        """상세 필드(read_detail_async 결과)에서 전화번호 선택
+        
+        출처 순: tel: 링크 → 전화번호 셀렉터 텍스트 → 이 업체의 Apollo 상태/HTML 번호 중 우선순위(070 > 0507 > 대표번호 > 지역번호)
+        """
+        best = detail_phone(detail)
+        if best:
+            print(f"    ✅ [{idx+1}] 상세 페이지에서 전화번호: {best.canonical}")
+            return best.canonical
+        
+        if idx < 3:
+            print(f"    → [{idx+1}] HTML에서도 전화번호 없음")
+        return ""
+    
     async def _get_text(self, element, selectors: List[str], debug_name: str = "") -> str:
         """여러 셀렉터로 텍스트 추출 시도"""
         for idx, selector in enumerate(selectors):
@@ -619,31 +753,6 @@ class NaverPlaceCrawler:
             except:
                 continue
         return ""
-    
-    def _is_other_region(self, name: str, addr: str, phone: str, rating: str, 
-                        keyword: str) -> bool:
-        """메인/타지역 판정"""
-        
-        # 1순위: 상호명 "흥신소" 정확히 3글자 = 무조건 타지역
-        if name and name.strip() == "흥신소":
-            return True  # 흥신소(3글자만) = 무조건 타지역
-        
-        # 2순위: 전화번호 기반 판정
-        if phone and phone != "-" and phone != "전화번호 없음":
-            # 0507 = 네이버 플레이스 대표번호 = 100% 메인
-            if '0507' in phone or phone.startswith('0507'):
-                return False  # 메인 (네이버 대표번호)
-            
-            # 070 = 인터넷 전화 = 타지역
-            if '070' in phone or phone.startswith('070'):
-                return True  # 타지역
-            
-            # 유효한 전화번호가 있고 070이 아니면 메인
-            if re.search(r'\d', phone):
-                return False  # 메인 (031, 02, 1588 등 일반 전화번호)
-        
-        # 3순위: 전화번호 없으면 메인 (기본값)
-        return False  # 메인 (전화번호 없음도 메인으로 처리)
 
 
 # 테스트용 실행
@@ -9,6 +9,8 @@ from playwright.sync_api import sync_playwright
 import time
 import re
 from urllib.parse import quote
+from region_classifier import classify_place
+from phone_numbers import normalize_phone
 
 class NaverPlaceCrawlerV41:
     """네이버 플레이스 크롤러 v4.1 - 주소 수집 디버깅 강화"""
@@ -179,10 +181,10 @@ class NaverPlaceCrawlerV41:
                         addr_success += 1
                     
                     # 전화번호
-                    phone = self._get_text(item, [
+                    phone = normalize_phone(self._get_text(item, [
                         '.dry6Z', '.tel', 'span.place_tel',
                         '[class*="tel"]', 'span.phone'
-                    ])
+                    ]))
                     
                     # 평점
                     rating = self._get_text(item, [
@@ -196,7 +198,7 @@ class NaverPlaceCrawlerV41:
                     reviews = re.sub(r'[^0-9]', '', reviews) if reviews else "0"
                     
                     # 타지역 판단
-                    is_other = self._is_other_region(name, addr, phone, rating, keyword)
+                    is_other, _ = classify_place("score", name, addr, phone, rating, keyword=keyword)
                     
                     result = {
                         'name': name,
@@ -252,32 +254,6 @@ class NaverPlaceCrawlerV41:
                 pass
         return ""
     
-    def _is_other_region(self, name, addr, phone, rating, keyword):
-        """타지역업체 판단"""
-        score = 0
-        
-        if phone and "070" in phone:
-            score += 3
-        
-        if addr and addr != "주소 정보 없음":
-            if len(addr.split()) <= 3:
-                score += 2
-            if addr.endswith(("동", "구", "시")):
-                score += 1
-        
-        if not addr or addr == "주소 정보 없음":
-            score += 2
-        
-        if not rating:
-            score += 1
-        
-        if name and keyword:
-            words = [w for w in keyword.split() if len(w) > 1]
-            if any(w in name for w in words):
-                score += 2
-        
-        return score >= 4
-    
     def close(self):
         try:
             if self.browser:
@@ -6,20 +6,33 @@ iframe이 아닌 메인 페이지에서 직접 크롤링
 """
 
 from playwright.sync_api import sync_playwright
-import time
 import re
-from urllib.parse import quote
 import json
+from wait_engine import Waiter
+from request_blocking import RequestBlocker
+from naver_endpoints import NaverEndpoints
+from rate_limiter import rate_limiter
+from region_classifier import classify_place
+from phone_numbers import best_phone, find_phones
+
+# SPA 로딩/스크롤 완료 판정용 아이템 셀렉터
+SPA_ITEM_SELECTOR = 'a[href*="/place/"], li[role="listitem"], [data-place-id]'
 
 class NaverPlaceCrawlerV42:
     """네이버 플레이스 크롤러 v4.2 - SPA 구조 대응"""
     
-    def __init__(self, debug=True):
+    def __init__(self, debug=True, blocking=None, endpoints=None, limiter=None):
         self.playwright = None
         self.browser = None
         self.page = None
         self.version = "v4.2"
         self.debug = debug
+        # 지도 타일/이미지/폰트/광고 요청 차단 (None이면 환경변수 설정)
+        self.blocker = RequestBlocker(blocking)
+        # 네이버 주소 (NAVER_BASE_URL 지정 시 로컬 목 서버)
+        self.endpoints = endpoints or NaverEndpoints.from_env()
+        # 호스트별 요청 속도 제한 (프로세스 공용)
+        self.limiter = limiter or rate_limiter
     
     def start(self):
         try:
@@ -34,6 +47,8 @@ class NaverPlaceCrawlerV42:
                 ]
             )
             self.page = self.browser.new_page()
+            self.blocker.attach(self.page)
+            self.limiter.watch(self.page)
             self.page.set_viewport_size({"width": 1920, "height": 1080})
             self.page.set_extra_http_headers({
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
@@ -50,17 +65,25 @@ class NaverPlaceCrawlerV42:
         
         try:
             print(f"\n🔍 '{keyword}' 검색 중...")
+            self.blocker.stats.reset()
             
-            url = f"https://map.naver.com/p/search/{quote(keyword)}"
+            url = self.endpoints.map_search(keyword)
+            self.limiter.wait(url)
             self.page.goto(url, timeout=30000, wait_until="networkidle")
-            time.sleep(5)  # SPA 로딩 대기
+            # SPA 로딩 대기 - 플레이스 링크가 나타나고 개수가 안정될 때까지 (최대 5초)
+            waiter = Waiter(self.page)
+            waiter.selector(SPA_ITEM_SELECTOR, timeout=5000)
+            waiter.settled(SPA_ITEM_SELECTOR, timeout=2000)
             
             print("📜 페이지 로딩 완료, 데이터 수집 중...")
             
             # 스크롤하여 더 많은 결과 로드
             for i in range(5):
                 self.page.evaluate("window.scrollBy(0, 500)")
-                time.sleep(0.5)
+                waiter.settled(SPA_ITEM_SELECTOR, quiet_ms=200, timeout=1000)
+            
+            if self.debug:
+                print(f"⏱️ {waiter.summary()}")
             
             # 메인 페이지에서 직접 리스트 아이템 찾기
             item_selectors = [
@@ -191,19 +214,9 @@ class NaverPlaceCrawlerV42:
                     if addr and addr != "주소 정보 없음":
                         addr_success += 1
                     
-                    # 전화번호 추출
-                    phone = ""
-                    phone_patterns = [
-                        r'(0\d{1,2}[-\s]?\d{3,4}[-\s]?\d{4})',
-                        r'(070[-\s]?\d{3,4}[-\s]?\d{4})',
-                        r'(1\d{3}[-\s]?\d{4})',
-                        r'(\d{2,3}-\d{3,4}-\d{4})'
-                    ]
-                    for pattern in phone_patterns:
-                        match = re.search(pattern, item_text)
-                        if match:
-                            phone = match.group(1)
-                            break
+                    # 전화번호 추출 (여러 개면 070 우선)
+                    best = best_phone(find_phones(item_text))
+                    phone = best.canonical if best else ""
                     
                     # 평점 추출
                     rating = ""
@@ -221,7 +234,7 @@ class NaverPlaceCrawlerV42:
                             break
                     
                     # 타지역 판단
-                    is_other = self._is_other_region(name, addr, phone, rating, keyword)
+                    is_other, _ = classify_place("score", name, addr, phone, rating, keyword=keyword)
                     
                     result = {
                         'name': name,
@@ -255,6 +268,7 @@ class NaverPlaceCrawlerV42:
             print(f"   🟢 주업체: {len([r for r in results if not r['is_other_region']])}개")
             print(f"   🟠 타지역: {len([r for r in results if r['is_other_region']])}개")
             print(f"   📍 주소 수집: {addr_success}/{total} ({addr_rate:.1f}%)")
+            print(f"   🚫 {self.blocker.stats.summary()}")
             print(f"{'='*70}\n")
             
             return results
@@ -265,32 +279,6 @@ class NaverPlaceCrawlerV42:
             traceback.print_exc()
             return []
     
-    def _is_other_region(self, name, addr, phone, rating, keyword):
-        """타지역업체 판단"""
-        score = 0
-        
-        if phone and "070" in phone:
-            score += 3
-        
-        if addr and addr != "주소 정보 없음":
-            if len(addr.split()) <= 3:
-                score += 2
-            if addr.endswith(("동", "구", "시")):
-                score += 1
-        
-        if not addr or addr == "주소 정보 없음":
-            score += 2
-        
-        if not rating:
-            score += 1
-        
-        if name and keyword:
-            words = [w for w in keyword.split() if len(w) > 1]
-            if any(w in name for w in words):
-                score += 2
-        
-        return score >= 4
-    
     def close(self):
         try:
             if self.browser:
@@ -0,0 +1,73 @@
+"""
+네이버 접속 주소 설정
+NAVER_BASE_URL을 지정하면 네이버 호스트 주소를 {base}/{호스트}/경로 형태로 바꿔
+로컬 목 서버(mock_naver_server.py)로 보낸다
+
+호스트 이름을 경로에 남기므로 'place.naver.com/place/list' 같은 URL 부분 문자열
+검사와 플레이스 ID 정규식은 목 서버에서도 그대로 동작한다
+"""
+
+import os
+from urllib.parse import quote, urlsplit
+
+
+# 목 서버로 보낼 수 있는 네이버 호스트
+NAVER_HOSTS = (
+    "m.search.naver.com",
+    "search.naver.com",
+    "map.naver.com",
+    "pcmap.place.naver.com",
+    "m.place.naver.com",
+)
+
+
+def naver_host(url: str) -> str:
+    """URL의 네이버 호스트 (목 서버 주소 {base}/{호스트}/경로 형태 포함, 네이버가 아니면 빈 문자열)"""
+    parts = urlsplit(url or "")
+    if parts.hostname in NAVER_HOSTS:
+        return parts.hostname
+    first = parts.path.lstrip("/").split("/", 1)[0]
+    return first if first in NAVER_HOSTS else ""
+
+
+class NaverEndpoints:
+    """네이버 URL 생성 + 기본 주소 치환 (base_url이 비어 있으면 실제 네이버 주소 그대로)"""
+
+    def __init__(self, base_url: str = ""):
+        self.base_url = (base_url or "").rstrip("/")
+
+    @classmethod
+    def from_env(cls):
+        """환경변수 설정 (예: NAVER_BASE_URL=http://127.0.0.1:8765)"""
+        return cls(os.getenv("NAVER_BASE_URL", ""))
+
+    @property
+    def is_mock(self) -> bool:
+        return bool(self.base_url)
+
+    def url(self, url: str) -> str:
+        """실제 네이버 URL → 설정된 기본 주소 기준 URL (네이버 호스트가 아니면 그대로)"""
+        if not self.base_url or not url:
+            return url
+        parts = urlsplit(url)
+        if parts.hostname not in NAVER_HOSTS:
+            return url
+        rewritten = f"{self.base_url}/{parts.hostname}{parts.path or '/'}"
+        if parts.query:
+            rewritten += f"?{parts.query}"
+        return rewritten
+
+    # ========== 페이지별 URL ==========
+
+    def mobile_search(self, keyword: str) -> str:
+        return self.url(f"https://m.search.naver.com/search.naver?where=m&sm=mtb_jum&query={quote(keyword)}")
+
+    def search(self, keyword: str) -> str:
+        return self.url(f"https://search.naver.com/search.naver?query={quote(keyword)}")
+
+    def map_search(self, keyword: str) -> str:
+        return self.url(f"https://map.naver.com/p/search/{quote(keyword)}")
+
+    def place_detail(self, place_id: str) -> str:
+        """PC 상세(entry) 페이지 - 지도 리스트 iframe과 같은 pcmap 도메인"""
+        return self.url(f"https://pcmap.place.naver.com/place/{place_id}/home")
@@ -17,6 +17,8 @@ import random
 import re
 import sys
 
+from landmarks import landmark_index
+
 # 실제 크롤러 import
 try:
     from naver_place_crawler_real import RealNaverPlaceCrawler
@@ -124,12 +126,9 @@ class NaverMapCrawler:
             return '맛집'
     
     def _extract_location(self, keyword):
-        """키워드에서 지역 추출"""
-        locations = ['강남', '홍대', '신촌', '명동', '이태원', '여의도', '잠실', '건대', '신림', '수원', '판교', '분당']
-        for loc in locations:
-            if loc in keyword:
-                return loc
-        return None
+        """키워드에서 지역 추출 (landmarks 지명 사전 - 역/상권/구/시)"""
+        landmark = landmark_index.find_in_keyword(keyword)
+        return landmark.name if landmark else None
     
     def _generate_place_data(self, template, location, index, keyword=''):
         """개별 장소 데이터 생성 (타지역업체 포함)"""
@@ -6,18 +6,28 @@
 """
 
 from playwright.sync_api import sync_playwright
-import time
 import re
-from urllib.parse import quote
+from wait_engine import Waiter
+from request_blocking import RequestBlocker
+from naver_endpoints import NaverEndpoints
+from rate_limiter import rate_limiter
+from region_classifier import classify_place
+from phone_numbers import normalize_phone
 
 class RealNaverPlaceCrawler:
     """실제 네이버 플레이스 크롤러"""
     
-    def __init__(self, headless=True):
+    def __init__(self, headless=True, blocking=None, endpoints=None, limiter=None):
         self.headless = headless
         self.playwright = None
         self.browser = None
         self.page = None
+        # 지도 타일/이미지/폰트/광고 요청 차단 (None이면 환경변수 설정)
+        self.blocker = RequestBlocker(blocking)
+        # 네이버 주소 (NAVER_BASE_URL 지정 시 로컬 목 서버)
+        self.endpoints = endpoints or NaverEndpoints.from_env()
+        # 호스트별 요청 속도 제한 (프로세스 공용)
+        self.limiter = limiter or rate_limiter
         
         # 플레이스 탭을 표시하는 키워드 패턴
         self.place_keywords = [
@@ -35,6 +45,8 @@ class RealNaverPlaceCrawler:
             self.playwright = sync_playwright().start()
             self.browser = self.playwright.chromium.launch(headless=self.headless)
             self.page = self.browser.new_page()
+            self.blocker.attach(self.page)
+            self.limiter.watch(self.page)
             self.page.set_viewport_size({"width": 1920, "height": 1080})
             print("✅ 브라우저 시작 완료")
             return True
@@ -49,9 +61,14 @@ class RealNaverPlaceCrawler:
                 self.start()
             
             # 네이버 검색
-            search_url = f"https://search.naver.com/search.naver?query={quote(keyword)}"
+            search_url = self.endpoints.search(keyword)
+            self.limiter.wait(search_url)
             self.page.goto(search_url, wait_until="domcontentloaded", timeout=10000)
-            time.sleep(2)
+            # 탭 영역이 그려지면 바로 확인 (최대 2초)
+            Waiter(self.page).selector(
+                'a[data-tab="place"], a.tab[href*="place"], .api_subject_bx a[href*="place"]',
+                timeout=2000
+            )
             
             # 플레이스 탭 확인
             place_tab_selectors = [
@@ -98,11 +115,14 @@ class RealNaverPlaceCrawler:
                 self.start()
             
             print(f"🔍 '{keyword}' 검색 시작...")
+            self.blocker.stats.reset()
             
             # 네이버 지도로 이동
-            map_url = f"https://map.naver.com/p/search/{quote(keyword)}"
+            map_url = self.endpoints.map_search(keyword)
+            self.limiter.wait(map_url)
             self.page.goto(map_url, wait_until="domcontentloaded", timeout=15000)
-            time.sleep(3)
+            waiter = Waiter(self.page)
+            waiter.selector('iframe#searchIframe', timeout=10000)
             
             # iframe으로 전환
             try:
@@ -114,6 +134,9 @@ class RealNaverPlaceCrawler:
                 print(f"❌ iframe 오류: {e}")
                 return []
             
+            # 리스트가 그려질 때까지 대기
+            waiter.selector('li[role="listitem"]', timeout=10000, target=iframe)
+            
             results = []
             
             # 스크롤하면서 데이터 수집
@@ -144,10 +167,12 @@ class RealNaverPlaceCrawler:
                     scroll_area = iframe.query_selector('.Ryr1F')  # 스크롤 영역
                     if scroll_area:
                         iframe.evaluate('(element) => element.scrollTop += 1000', scroll_area)
-                        time.sleep(1)
+                        waiter.settled('li[role="listitem"]', timeout=2000, target=iframe)
                 except:
                     pass
             
+            print(f"⏱️ {waiter.summary()}")
+            print(f"🚫 {self.blocker.stats.summary()}")
             print(f"✅ 총 {len(results)}개 결과 수집 완료")
             return results
             
@@ -177,7 +202,7 @@ class RealNaverPlaceCrawler:
             
             # 전화번호
             phone_elem = item.query_selector('.dry6Z, .tel')
-            phone = phone_elem.inner_text().strip() if phone_elem else ""
+            phone = normalize_phone(phone_elem.inner_text()) if phone_elem else ""
             
             # 평점
             rating_elem = item.query_selector('.h69bs, .score')
@@ -189,9 +214,7 @@ class RealNaverPlaceCrawler:
             reviews = re.sub(r'[^0-9]', '', reviews)
             
             # 타지역업체 판단
-            is_other_region = self._detect_other_region_place(
-                name, address, phone, rating, reviews, keyword
-            )
+            is_other_region, _ = classify_place("real", name, address, phone, rating, reviews, keyword)
             
             place_data = {
                 'name': name,
@@ -210,48 +233,6 @@ class RealNaverPlaceCrawler:
             print(f"⚠️ 데이터 추출 오류: {e}")
             return None
     
-    def _detect_other_region_place(self, name, address, phone, rating, reviews, keyword):
-        """타지역업체 감지 알고리즘"""
-        indicators = 0
-        
-        # 1. 070 가상번호 사용
-        if phone.startswith('070'):
-            indicators += 3  # 가중치 높음
-        
-        # 2. 주소가 동/구 단위만 (상세주소 없음)
-        if address:
-            # "서울 강남구 역삼동" 형태인지 확인
-            address_parts = address.split()
-            if len(address_parts) <= 3 or not any(char.isdigit() for char in address):
-                # 번지수나 상세주소 없음
-                indicators += 2
-        
-        # 3. 평점 없음
-        if not rating or rating == "":
-            indicators += 1
-        
-        # 4. 리뷰 수 0 또는 매우 적음
-        if reviews == "0" or (reviews and int(reviews) < 3):
-            indicators += 1
-        
-        # 5. 상호명에 검색 키워드 포함 (타지역업체 특징)
-        # 예: "홍대치킨" 검색 시 "홍대치킨배달", "홍대치킨전문점" 등
-        if keyword:
-            # 키워드를 단어로 분리
-            keyword_clean = re.sub(r'[^\w\s]', '', keyword)
-            keyword_words = keyword_clean.split()
-            
-            # 상호명에 키워드가 포함되어 있는지
-            if any(word in name for word in keyword_words if len(word) > 1):
-                indicators += 2
-        
-        # 6. 상호명 길이 짧음 (30자 이하 - 타지역업체 제약)
-        if len(name) <= 30:
-            indicators += 0.5
-        
-        # 판단: 4점 이상이면 타지역업체
-        return indicators >= 4
-    
     def _is_duplicate(self, results, new_place):
         """중복 확인"""
         for place in results:
@@ -0,0 +1,146 @@
+"""
+검색 페이지 조기 판정
+첫 응답(HTTP 상태)과 DOM 스냅샷만 보고 결과 있음/플레이스 없음/차단/오류를 수백 ms 안에 구분해
+결과가 없거나 차단된 키워드에서 셀렉터 대기(최대 10초), 스크롤, 셀렉터 추출 단계를 건너뛴다
+"""
+
+import time
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+from rate_limiter import BLOCK_URL_MARKERS, is_block_response
+
+
+RESULTS = "results"
+NO_PLACE = "no_place"
+BLOCKED = "blocked"
+ERROR = "error"
+UNKNOWN = "unknown"   # 시간 안에 판정 못 함 - 호출자는 기존 경로(셀렉터 추출)로 계속
+
+# 캡차/보안 확인 페이지 문구 (제목 또는 본문 앞부분)
+BLOCK_TEXT_MARKERS = (
+    "자동입력 방지",
+    "보안 확인",
+    "비정상적인 접근",
+    "일시적으로 제한",
+)
+
+# 검색 결과 없음 문구
+EMPTY_TEXT_MARKERS = (
+    "검색결과가 없습니다",
+    "검색 결과가 없습니다",
+    "조건에 맞는 업체가 없습니다",
+)
+
+# 본문 확인 범위 (textContent 앞부분 - 레이아웃 계산 없이 읽음)
+TEXT_SCAN_CHARS = 5000
+
+# 결과 셀렉터가 없을 때 '플레이스 없음'으로 확정하기 전 기다리는 시간 (ms)
+DEFAULT_GRACE_MS = 500
+
+POLL_INTERVAL_MS = 100
+
+# 페이지 안에서 실행 - 판정이 나면 {state, reason, count}, 아직이면 null
+PROBE_SCRIPT = """
+([resultSelector, blockMarkers, blockUrlMarkers, emptyMarkers, graceMs, textChars]) => {
+    const count = document.querySelectorAll(resultSelector).length;
+    if (count) return {state: 'results', reason: resultSelector, count: count};
+
+    const text = (document.title || '') + ' ' +
+        ((document.body && document.body.textContent) || '').slice(0, textChars);
+    for (const marker of blockUrlMarkers) {
+        if (location.href.includes(marker)) return {state: 'blocked', reason: marker, count: 0};
+    }
+    for (const marker of blockMarkers) {
+        if (text.includes(marker)) return {state: 'blocked', reason: marker, count: 0};
+    }
+    for (const marker of emptyMarkers) {
+        if (text.includes(marker)) return {state: 'no_place', reason: marker, count: 0};
+    }
+
+    if (document.readyState === 'loading') return null;
+    const state = window.__pageClassify || (window.__pageClassify = {since: performance.now()});
+    if (performance.now() - state.since >= graceMs) {
+        return {state: 'no_place', reason: 'no_selector', count: 0};
+    }
+    return null;
+}
+"""
+
+
+@dataclass
+class Verdict:
+    """판정 결과"""
+    state: str
+    reason: str = ""
+    count: int = 0
+    elapsed_ms: float = 0.0
+
+    @property
+    def has_results(self) -> bool:
+        return self.state == RESULTS
+
+    def summary(self) -> str:
+        return f"{self.state} ({self.reason}, {self.elapsed_ms:.0f}ms)"
+
+
+class PageClassifier:
+    """결과 셀렉터별 판정기 (모바일 검색 .place_section, 지도 리스트 iframe 아이템 등)"""
+
+    def __init__(self, result_selector: str, block_markers: Iterable[str] = BLOCK_TEXT_MARKERS,
+                 empty_markers: Iterable[str] = EMPTY_TEXT_MARKERS, grace_ms: int = DEFAULT_GRACE_MS):
+        self.result_selector = result_selector
+        self.block_markers = tuple(block_markers)
+        self.empty_markers = tuple(empty_markers)
+        self.grace_ms = grace_ms
+
+    @staticmethod
+    def from_response(response) -> Optional[Verdict]:
+        """goto 응답만으로 판정 가능한 경우 (차단/오류) → Verdict, 아니면 None"""
+        if response is None:
+            return None
+        status = response.status
+        if is_block_response(status, response.url):
+            return Verdict(BLOCKED, f"HTTP {status}")
+        if status >= 400:
+            return Verdict(ERROR, f"HTTP {status}")
+        return None
+
+    def classify(self, target, timeout: float = 10000, response=None) -> Verdict:
+        """sync - 판정이 날 때까지 DOM 스냅샷 폴링 (timeout 초과 시 unknown)"""
+        started = time.perf_counter()
+        verdict = self.from_response(response)
+        if verdict is None:
+            try:
+                handle = target.wait_for_function(
+                    PROBE_SCRIPT, arg=self._probe_args(), polling=POLL_INTERVAL_MS, timeout=timeout
+                )
+                verdict = self._to_verdict(handle.json_value())
+            except Exception as e:
+                verdict = Verdict(UNKNOWN, str(e)[:60])
+        verdict.elapsed_ms = (time.perf_counter() - started) * 1000
+        return verdict
+
+    async def classify_async(self, target, timeout: float = 10000, response=None) -> Verdict:
+        """async - classify와 같음"""
+        started = time.perf_counter()
+        verdict = self.from_response(response)
+        if verdict is None:
+            try:
+                handle = await target.wait_for_function(
+                    PROBE_SCRIPT, arg=self._probe_args(), polling=POLL_INTERVAL_MS, timeout=timeout
+                )
+                verdict = self._to_verdict(await handle.json_value())
+            except Exception as e:
+                verdict = Verdict(UNKNOWN, str(e)[:60])
+        verdict.elapsed_ms = (time.perf_counter() - started) * 1000
+        return verdict
+
+    def _probe_args(self):
+        return [self.result_selector, list(self.block_markers), list(BLOCK_URL_MARKERS),
+                list(self.empty_markers), self.grace_ms, TEXT_SCAN_CHARS]
+
+    @staticmethod
+    def _to_verdict(value) -> Verdict:
+        value = value or {}
+        return Verdict(value.get("state", UNKNOWN), value.get("reason", ""), int(value.get("count") or 0))
@@ -0,0 +1,218 @@
+"""
+크롤링 단계별 소요 시간 계측
+키워드마다 PhaseTimer로 단계(브라우저 확보, 접속, 섹션 대기, 스크롤, 목록 추출,
+상세 보강, 분류, 직렬화) 시간을 기록해 결과와 함께 돌려주고,
+LatencyRecorder가 단계별 히스토그램으로 누적해 p50/p95/p99를 계산한다
+"""
+
+import bisect
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+
+# 단계 이름 (보고 순서)
+PHASES = (
+    "acquire",       # 브라우저 컨텍스트 확보 (큐/풀 대기 포함)
+    "navigate",      # 검색 페이지 접속
+    "section_wait",  # 플레이스 섹션/리스트 iframe 대기
+    "scroll",        # 스크롤/더보기 로딩
+    "list_extract",  # 목록 추출 (Apollo 상태 또는 셀렉터)
+    "detail",        # 상세 페이지 보강 전체
+    "detail_item",   # 상세 페이지 1건 (업체마다 1개 샘플)
+    "rate_wait",     # 요청 속도 제한 대기 (navigate/detail 시간에 포함)
+    "classify",      # 타지역업체 판정
+    "serialize",     # 응답/파일 직렬화
+    "total",         # 키워드 전체
+)
+
+# 히스토그램 버킷 상한 (ms) - 1ms부터 1.5배씩, 약 2분까지
+BUCKET_BOUNDS = tuple(round(1.5 ** i, 1) for i in range(30))
+
+
+class PhaseTimer:
+    """키워드 1회 크롤링의 단계별 시간
+
+    같은 단계를 여러 번 기록하면 합계로 보고하고, 샘플은 각각 히스토그램에 들어간다.
+    started를 주면 (예: 작업 큐에 넣은 시각) 그때부터 total/첫 lap을 잰다.
+    """
+
+    def __init__(self, keyword: str = "", started: Optional[float] = None):
+        self.keyword = keyword
+        self.started = started if started is not None else time.perf_counter()
+        self.samples: Dict[str, List[float]] = {}
+        self._last = self.started
+
+    @contextmanager
+    def phase(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._last = time.perf_counter()
+            self.add(name, (self._last - start) * 1000)
+
+    def lap(self, name: str):
+        """직전 lap(또는 시작) 이후 시간을 name 단계로 기록"""
+        now = time.perf_counter()
+        self.add(name, (now - self._last) * 1000)
+        self._last = now
+
+    def add(self, name: str, ms: float):
+        self.samples.setdefault(name, []).append(ms)
+
+    def finish(self):
+        """total 기록 (한 번만)"""
+        if "total" not in self.samples:
+            self.add("total", (time.perf_counter() - self.started) * 1000)
+        return self
+
+    def as_dict(self) -> Dict:
+        phases = {name: round(sum(values), 1) for name, values in self._ordered()}
+        result = {"keyword": self.keyword, "phases_ms": phases}
+        items = self.samples.get("detail_item")
+        if items:
+            result["detail_items"] = {
+                "count": len(items),
+                "mean_ms": round(sum(items) / len(items), 1),
+                "max_ms": round(max(items), 1),
+            }
+        return result
+
+    def summary(self) -> str:
+        """한 줄 요약 (로그용)"""
+        parts = [f"{name} {sum(values):.0f}ms" for name, values in self._ordered() if name != "detail_item"]
+        return "단계별 시간: " + ", ".join(parts)
+
+    def _ordered(self):
+        known = [(name, self.samples[name]) for name in PHASES if name in self.samples]
+        extra = [(name, values) for name, values in self.samples.items() if name not in PHASES]
+        return known + extra
+
+
+class CrawlResults(list):
+    """크롤링 결과 목록 + 단계별 시간 (timing) - 기존 list 반환값과 그대로 호환
+
+    partial=True면 취소/시간 예산 초과로 일부 단계를 건너뛴 결과 (결과 캐시에 저장하지 않음)
+    status/reason은 페이지 판정 결과 (results/no_place/blocked/error, page_classifier)
+    """
+
+    def __init__(self, results=(), timing: Optional[Dict] = None, partial: bool = False,
+                 status: Optional[str] = None, reason: Optional[str] = None):
+        super().__init__(results)
+        self.timing = timing
+        self.partial = partial
+        self.status = status
+        self.reason = reason
+
+
+class LatencyHistogram:
+    """고정 버킷 히스토그램 (메모리 일정, 백분위는 버킷 안 선형 보간 추정)"""
+
+    def __init__(self, bounds=BUCKET_BOUNDS):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)  # 마지막은 +Inf
+        self.count = 0
+        self.sum = 0.0
+        self.min = None
+        self.max = None
+
+    def observe(self, ms: float):
+        self.counts[bisect.bisect_left(self.bounds, ms)] += 1
+        self.count += 1
+        self.sum += ms
+        self.min = ms if self.min is None else min(self.min, ms)
+        self.max = ms if self.max is None else max(self.max, ms)
+
+    def percentile(self, q: float) -> Optional[float]:
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            if n and seen + n >= rank:
+                lower = self.bounds[i - 1] if i > 0 else 0.0
+                upper = self.bounds[i] if i < len(self.bounds) else self.max
+                value = lower + (upper - lower) * (rank - seen) / n
+                return min(max(value, self.min), self.max)
+            seen += n
+        return self.max
+
+    def snapshot(self) -> Dict:
+        if not self.count:
+            return {"count": 0}
+        return {
+            "count": self.count,
+            "mean_ms": round(self.sum / self.count, 1),
+            "p50_ms": round(self.percentile(0.50), 1),
+            "p95_ms": round(self.percentile(0.95), 1),
+            "p99_ms": round(self.percentile(0.99), 1),
+            "max_ms": round(self.max, 1),
+        }
+
+
+class LatencyRecorder:
+    """단계별 히스토그램 누적 (프로세스 메모리, 스레드 안전)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._histograms: Dict[str, LatencyHistogram] = {}
+
+    def record(self, timer: PhaseTimer):
+        """키워드 1회분 샘플 전체 반영"""
+        with self._lock:
+            for name, values in timer.samples.items():
+                histogram = self._histogram(name)
+                for ms in values:
+                    histogram.observe(ms)
+
+    def observe(self, phase: str, ms: float):
+        """단일 샘플 반영 (직렬화처럼 크롤러 밖에서 재는 단계)"""
+        with self._lock:
+            self._histogram(phase).observe(ms)
+
+    @contextmanager
+    def measure(self, phase: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(phase, (time.perf_counter() - start) * 1000)
+
+    def snapshot(self) -> Dict[str, Dict]:
+        with self._lock:
+            names = [n for n in PHASES if n in self._histograms]
+            names += [n for n in self._histograms if n not in PHASES]
+            return {name: self._histograms[name].snapshot() for name in names}
+
+    def histograms(self) -> Dict[str, Dict]:
+        """단계별 버킷 원본 복사본 (Prometheus 내보내기용)
+
+        {단계: {'bounds': 상한 ms 목록, 'counts': 버킷별 개수(+Inf 포함), 'count': n, 'sum': 합계 ms}}
+        """
+        with self._lock:
+            return {
+                name: {
+                    "bounds": histogram.bounds,
+                    "counts": list(histogram.counts),
+                    "count": histogram.count,
+                    "sum": histogram.sum,
+                }
+                for name, histogram in self._histograms.items()
+            }
+
+    def reset(self):
+        with self._lock:
+            self._histograms.clear()
+
+    def _histogram(self, name: str) -> LatencyHistogram:
+        # self._lock 안에서 호출
+        histogram = self._histograms.get(name)
+        if histogram is None:
+            histogram = self._histograms[name] = LatencyHistogram()
+        return histogram
+
+
+# 프로세스 공용 기록기 (크롤러 인스턴스가 여러 개여도 한 곳에 누적)
+latency_recorder = LatencyRecorder()
@@ -0,0 +1,221 @@
+"""
+네이버 요청 속도 제한 (프로세스 공용)
+호스트 그룹(search/map/place)마다 토큰 버킷 1개 - 모든 브라우저 워커/세션의 페이지 이동이
+같은 버킷에서 토큰을 받아 가므로 동시 사용자가 늘어도 네이버로 가는 속도는 설정값을 넘지 않는다
+
+- 설정: RATE_LIMIT_SEARCH / RATE_LIMIT_MAP / RATE_LIMIT_PLACE = "초당 요청 수:버스트" (예: "2:5")
+         RATE_LIMIT=0 이면 전체 비활성화
+- 감속: 문서 응답이 403/429이거나 캡차 주소로 이동하면 해당 그룹 속도를 절반으로 (최소 min_factor),
+        정상 응답마다 조금씩 원래 속도로 회복 (AIMD)
+"""
+
+import asyncio
+import os
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+from naver_endpoints import naver_host
+
+
+# 호스트 → 그룹
+HOST_GROUPS = {
+    "m.search.naver.com": "search",
+    "search.naver.com": "search",
+    "map.naver.com": "map",
+    "pcmap.place.naver.com": "place",
+    "m.place.naver.com": "place",
+}
+
+# 그룹별 기본값 (초당 요청 수, 버스트)
+DEFAULT_RATES = {
+    "search": (2.0, 5),
+    "map": (1.0, 3),
+    "place": (5.0, 10),
+}
+
+# 차단/과다 요청 응답 상태
+BLOCK_STATUSES = (403, 429)
+
+# 이동한 주소에 포함되면 캡차/보안 확인 페이지로 판단
+BLOCK_URL_MARKERS = ("captcha", "nid.naver.com/login")
+
+
+def is_block_response(status: int, url: str = "") -> bool:
+    """문서 응답이 차단/캡차인지"""
+    return status in BLOCK_STATUSES or any(marker in (url or "") for marker in BLOCK_URL_MARKERS)
+
+
+class TokenBucket:
+    """토큰 버킷 - 토큰을 미리 빌려 음수가 되면 그만큼 기다려야 하는 시간으로 순서를 정함"""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.factor = 1.0   # 감속 배율 (1.0 = 설정 속도)
+        self.tokens = float(self.burst)
+        self.updated = time.monotonic()
+
+    @property
+    def effective_rate(self) -> float:
+        return self.rate * self.factor
+
+    def reserve(self, now: float) -> float:
+        """토큰 1개 예약 → 기다려야 하는 시간(초)"""
+        self._refill(now)
+        self.tokens -= 1
+        if self.tokens >= 0:
+            return 0.0
+        return -self.tokens / self.effective_rate
+
+    def slow_down(self, now: float, slowdown: float, min_factor: float):
+        self._refill(now)
+        self.factor = max(min_factor, self.factor * slowdown)
+        # 남은 버스트도 버림 - 다음 요청부터 바로 느린 속도로
+        self.tokens = min(self.tokens, 0.0)
+
+    def recover(self, step: float):
+        self.factor = min(1.0, self.factor + step)
+
+    def _refill(self, now: float):
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.effective_rate)
+        self.updated = now
+
+
+class RateLimiter:
+    """호스트 그룹별 토큰 버킷 + 차단 응답 감속 (스레드 안전, sync/async 크롤러 공용)"""
+
+    def __init__(self, rates: Optional[Dict[str, Tuple[float, int]]] = None, enabled: bool = True,
+                 slowdown: float = 0.5, min_factor: float = 0.1, recovery: float = 0.05):
+        self.enabled = enabled
+        self.slowdown = slowdown
+        self.min_factor = min_factor
+        self.recovery = recovery
+        self._lock = threading.Lock()
+        self._buckets = {
+            group: TokenBucket(rate, burst)
+            for group, (rate, burst) in (rates or DEFAULT_RATES).items()
+            if rate > 0
+        }
+        self._stats = {group: {"requests": 0, "waited": 0, "wait_seconds": 0.0, "blocked": 0}
+                       for group in self._buckets}
+
+    @classmethod
+    def from_env(cls):
+        """환경변수 설정 (RATE_LIMIT, RATE_LIMIT_<그룹>="초당 요청 수:버스트", 0이면 그룹 제한 없음)"""
+        rates = {}
+        for group, (rate, burst) in DEFAULT_RATES.items():
+            value = os.getenv(f"RATE_LIMIT_{group.upper()}")
+            if value:
+                rate_text, _, burst_text = value.partition(":")
+                rate = float(rate_text)
+                burst = int(burst_text) if burst_text else max(1, int(rate * 2))
+            rates[group] = (rate, burst)
+        return cls(rates, enabled=os.getenv("RATE_LIMIT", "1") != "0")
+
+    # ========== 대기 ==========
+
+    def reserve(self, url: str) -> float:
+        """url로 이동하기 전 토큰 예약 → 기다려야 하는 시간(초), 제한 대상이 아니면 0"""
+        group = self._group(url)
+        if group is None:
+            return 0.0
+        with self._lock:
+            delay = self._buckets[group].reserve(time.monotonic())
+            stats = self._stats[group]
+            stats["requests"] += 1
+            if delay > 0:
+                stats["waited"] += 1
+                stats["wait_seconds"] += delay
+        return delay
+
+    def wait(self, url: str, token=None) -> float:
+        """sync 크롤러용 - 차례가 올 때까지 대기 (token이 취소되면 바로 반환) → 대기 시간(초)"""
+        delay = self.reserve(url)
+        if delay > 0:
+            if token is not None:
+                token.wait(delay)
+            else:
+                time.sleep(delay)
+        return delay
+
+    async def wait_async(self, url: str, token=None) -> float:
+        """async 크롤러용 - 이벤트 루프를 막지 않고 대기 → 대기 시간(초)"""
+        delay = self.reserve(url)
+        if delay > 0:
+            remaining = token.remaining() if token is not None else None
+            await asyncio.sleep(delay if remaining is None else min(delay, remaining))
+        return delay
+
+    # ========== 응답 관찰 (감속/회복) ==========
+
+    def observe(self, url: str, status: int):
+        """문서 응답 1건 반영 - 차단이면 감속, 정상이면 조금 회복"""
+        group = self._group(url)
+        if group is None:
+            return
+        if is_block_response(status, url):
+            self._slow_down(group, f"차단 응답({status})")
+        elif 200 <= status < 400:
+            with self._lock:
+                self._buckets[group].recover(self.recovery)
+
+    def report_blocked(self, url: str, reason: str = "캡차 페이지"):
+        """HTTP 상태는 정상이지만 본문이 차단/캡차 페이지였을 때 (page_classifier 판정)"""
+        group = self._group(url)
+        if group is not None:
+            self._slow_down(group, reason)
+
+    def watch(self, context):
+        """컨텍스트의 모든 문서 응답(페이지/iframe/상세 페이지)을 관찰 → unwatch에 넘길 핸들러"""
+        if not self.enabled:
+            return None
+
+        def on_response(response):
+            try:
+                if response.request.resource_type == "document":
+                    self.observe(response.url, response.status)
+            except Exception:
+                pass
+        context.on("response", on_response)
+        return on_response
+
+    def unwatch(self, context, handler):
+        if handler is None:
+            return
+        try:
+            context.remove_listener("response", handler)
+        except Exception:
+            pass
+
+    def stats(self) -> Dict[str, Dict]:
+        """그룹별 설정/현재 속도 + 요청/대기/차단 누적"""
+        with self._lock:
+            return {
+                group: {
+                    "rate": bucket.rate,
+                    "burst": bucket.burst,
+                    "effective_rate": round(bucket.effective_rate, 3),
+                    "factor": round(bucket.factor, 3),
+                    **{k: round(v, 3) if isinstance(v, float) else v for k, v in self._stats[group].items()},
+                }
+                for group, bucket in self._buckets.items()
+            }
+
+    def _slow_down(self, group: str, reason: str):
+        with self._lock:
+            bucket = self._buckets[group]
+            bucket.slow_down(time.monotonic(), self.slowdown, self.min_factor)
+            self._stats[group]["blocked"] += 1
+            rate = bucket.effective_rate
+        print(f"🐢 '{group}' {reason} - 요청 속도 {rate:.2f}/s로 감속")
+
+    def _group(self, url: str) -> Optional[str]:
+        if not self.enabled:
+            return None
+        group = HOST_GROUPS.get(naver_host(url))
+        return group if group in self._buckets else None
+
+
+# 프로세스 공용 제한기 (모든 크롤러/워커가 같은 버킷 공유)
+rate_limiter = RateLimiter.from_env()
@@ -0,0 +1,383 @@
+"""
+타지역업체 판정 엔진 (크롤러 공용)
+크롤러마다 따로 있던 _is_other_region 규칙을 프로필로 모아 두고, 업체를 1건씩이 아니라
+열(column) 단위 표(dict of lists 또는 pandas DataFrame) 전체를 한 번에 판정한다
+
+- 패턴은 모듈 로드 시 1회 컴파일 (키워드 패턴은 키워드별 1회)
+- 규칙 1개를 남은 행 전체에 적용하는 열 단위 연산 - 앞 규칙에서 판정이 끝난 행은 다음 규칙에서 제외
+- 결과: place_type('주업체'/'타지역업체') + is_other_region + reason(판정 근거 코드)
+
+프로필:
+    core       naver_crawler_core (Flask)   상호명 → 좌표 거리 → 전화번호 → 번지수 → 점수 3점 이상
+    streamlit  naver_crawler_streamlit      상호명 → 좌표 거리 → 0507/070/일반번호, 번호 없으면 메인
+    score      naver_crawler_v41/v42_spa    가중치 점수 4점 이상
+    real       naver_place_crawler_real     리뷰 수/상호명 길이 포함 가중치 4점 이상
+"""
+
+import re
+from collections import namedtuple
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from address_parser import parse_address
+from landmarks import landmark_index
+from phone_numbers import SAFE, VOIP, classify_phones
+
+
+MAIN = "주업체"
+OTHER = "타지역업체"
+
+# 판정 근거 코드
+NAME_BLACKLIST = "name_blacklist"        # 사업자 등록이 안 되는 상호명 (흥신소)
+PHONE_0507 = "phone_0507"                # 050X 안심번호 (0507 = 네이버 스마트콜) → 메인
+PHONE_070 = "phone_070"                  # 인터넷 전화 → 타지역
+PHONE_REGULAR = "phone_regular"          # 지역번호/대표전화 → 메인
+ADDRESS_DETAILED = "address_detailed"    # 번지수/층·호 있음 → 메인
+ADDRESS_AREA_ONLY = "address_area_only"  # 시/구/동·도로명까지만 (번지·상세 없음) → 타지역
+FAR_FROM_KEYWORD = "far_from_keyword"    # 업체 좌표가 키워드 지명 반경 밖 → 타지역
+SCORE_HIGH = "score_high"                # 점수 기준 이상 → 타지역
+SCORE_LOW = "score_low"                  # 점수 기준 미만 → 메인
+DEFAULT = "default"                      # 어느 규칙에도 안 걸림
+
+REASONS = (NAME_BLACKLIST, PHONE_0507, PHONE_070, PHONE_REGULAR, ADDRESS_DETAILED,
+           ADDRESS_AREA_ONLY, FAR_FROM_KEYWORD, SCORE_HIGH, SCORE_LOW, DEFAULT)
+
+BLACKLIST_NAMES = frozenset({"흥신소"})
+NO_PHONE = frozenset({"", "-", "전화번호 없음"})
+NO_ADDRESS = frozenset({"", "주소 정보 없음"})
+
+COLUMNS = ("name", "address", "phone", "rating", "reviews", "keyword")
+# 좌표 열 (없으면 거리 규칙은 판단 안 함) - distance_km가 있으면 계산 생략
+NUMERIC_COLUMNS = ("latitude", "longitude", "distance_km")
+
+# 번지수 패턴 (123-45, 123 - 45, 신사동 638-2, 압구정로 306, 저동2가 35, 165호, 1층)
+DETAILED_ADDRESS_RE = re.compile(r'\d+\s*-\s*\d+|[로길가]\s+\d+|\d+\s*[층호]')
+DIGIT_RE = re.compile(r'\d')
+PUNCT_RE = re.compile(r'[^\w\s]')
+
+
+# ========== 표 정규화 ==========
+
+class Columns:
+    """판정에 쓰는 열 (문자열 열은 None/NaN → "", 좌표 열은 None/NaN → None)"""
+
+    def __init__(self, table, keyword: Optional[str] = None):
+        get = _column_getter(table)
+        self.size = _table_size(table)
+        for column in COLUMNS:
+            setattr(self, column, _as_text(get(column), self.size))
+        for column in NUMERIC_COLUMNS:
+            setattr(self, column, _as_float(get(column), self.size))
+        if keyword is not None:
+            self.keyword = [keyword] * self.size
+        self._distances_ready = any(d is not None for d in self.distance_km)
+        self._phone_kinds = None
+
+    def phone_kinds(self) -> List[str]:
+        """행별 전화번호 종류 (phone_numbers 분류, 처음 필요할 때 한 번 계산)"""
+        if self._phone_kinds is None:
+            self._phone_kinds = classify_phones(self.phone)
+        return self._phone_kinds
+
+    def distances(self) -> List[Optional[float]]:
+        """행별 키워드 지명까지 거리(km) - 처음 필요할 때 한 번 계산"""
+        if not self._distances_ready:
+            self.distance_km = landmark_index.distances(self.keyword, self.latitude, self.longitude)
+            self._distances_ready = True
+        return self.distance_km
+
+
+def _column_getter(table) -> Callable[[str], Optional[Sequence]]:
+    if _is_dataframe(table):
+        return lambda column: table[column].tolist() if column in table.columns else None
+    return lambda column: table.get(column)
+
+
+def _table_size(table) -> int:
+    if _is_dataframe(table):
+        return len(table.index)
+    sizes = {len(values) for values in table.values()}
+    if len(sizes) > 1:
+        raise ValueError(f"열 길이가 다릅니다: {sorted(sizes)}")
+    return sizes.pop() if sizes else 0
+
+
+def _as_text(values: Optional[Sequence], size: int) -> List[str]:
+    if values is None:
+        return [""] * size
+    # NaN은 자기 자신과 같지 않음
+    return ["" if v is None or v != v else v if isinstance(v, str) else str(v) for v in values]
+
+
+def _as_float(values: Optional[Sequence], size: int) -> List[Optional[float]]:
+    if values is None:
+        return [None] * size
+    result = []
+    for v in values:
+        try:
+            v = float(v)
+        except (TypeError, ValueError):
+            v = None
+        result.append(None if v is None or v != v else v)
+    return result
+
+
+def _is_dataframe(table) -> bool:
+    return hasattr(table, "columns") and hasattr(table, "index")
+
+
+# ========== 열 단위 조건 (Columns, 남은 행 번호 → 행마다 True/False) ==========
+
+Test = Callable[[Columns, List[int]], List[bool]]
+
+
+def name_blacklisted(c: Columns, rows: List[int]) -> List[bool]:
+    name = c.name
+    return [name[i].strip() in BLACKLIST_NAMES for i in rows]
+
+
+def _phone_kind_is(kind: str) -> Test:
+    def test(c: Columns, rows: List[int]) -> List[bool]:
+        kinds = c.phone_kinds()
+        return [kinds[i] == kind for i in rows]
+    return test
+
+
+phone_is_voip = _phone_kind_is(VOIP)
+phone_is_safe = _phone_kind_is(SAFE)
+
+
+def phone_has_digit(c: Columns, rows: List[int]) -> List[bool]:
+    phone, search = c.phone, DIGIT_RE.search
+    return [phone[i] not in NO_PHONE and search(phone[i]) is not None for i in rows]
+
+
+def address_detailed(c: Columns, rows: List[int]) -> List[bool]:
+    address, search = c.address, DETAILED_ADDRESS_RE.search
+    return [address[i] not in NO_ADDRESS and search(address[i]) is not None for i in rows]
+
+
+def address_area_only(c: Columns, rows: List[int]) -> List[bool]:
+    """지명 사전 기준으로 행정구역/도로명까지만 있는 주소 ("서울 강남구 역삼동", "경기 안산시 단원구")"""
+    address = c.address
+    return [parse_address(address[i]).is_area_only for i in rows]
+
+
+def address_missing(c: Columns, rows: List[int]) -> List[bool]:
+    address = c.address
+    return [address[i] in NO_ADDRESS for i in rows]
+
+
+def address_ends_with_region(c: Columns, rows: List[int]) -> List[bool]:
+    address = c.address
+    return [address[i] not in NO_ADDRESS and address[i].endswith(("동", "구", "시")) for i in rows]
+
+
+def address_vague(c: Columns, rows: List[int]) -> List[bool]:
+    """주소가 있지만 행정구역까지만이거나 숫자가 없음 (real 프로필 - '주소 정보 없음'도 주소로 취급)"""
+    address, search = c.address, DIGIT_RE.search
+    return [bool(address[i]) and (parse_address(address[i]).is_area_only or search(address[i]) is None)
+            for i in rows]
+
+
+def far_from_keyword(c: Columns, rows: List[int]) -> List[bool]:
+    """업체 좌표가 키워드 속 지명(강남역, 홍대, 분당 ...) 반경 밖 (지명/좌표가 없으면 False)"""
+    distance, keyword, is_far = c.distances(), c.keyword, landmark_index.is_far
+    return [is_far(keyword[i], distance[i]) for i in rows]
+
+
+def rating_missing(c: Columns, rows: List[int]) -> List[bool]:
+    rating = c.rating
+    return [not rating[i] for i in rows]
+
+
+def reviews_few(c: Columns, rows: List[int]) -> List[bool]:
+    """리뷰 0개 또는 3개 미만 (숫자가 아닌 값은 판단 안 함)"""
+    reviews = c.reviews
+    return [reviews[i].isdigit() and int(reviews[i]) < 3 for i in rows]
+
+
+def name_short(c: Columns, rows: List[int]) -> List[bool]:
+    name = c.name
+    return [len(name[i]) <= 30 for i in rows]
+
+
+@lru_cache(maxsize=256)
+def keyword_pattern(keyword: str, strip_punct: bool = False):
+    """키워드의 2글자 이상 단어 중 하나라도 포함하는지 보는 패턴 (단어가 없으면 None)"""
+    if strip_punct:
+        keyword = PUNCT_RE.sub("", keyword)
+    words = [w for w in keyword.split() if len(w) > 1]
+    if not words:
+        return None
+    return re.compile("|".join(re.escape(w) for w in words))
+
+
+def _name_has_keyword(strip_punct: bool) -> Test:
+    def test(c: Columns, rows: List[int]) -> List[bool]:
+        name, keyword = c.name, c.keyword
+        hits = []
+        for i in rows:
+            pattern = keyword_pattern(keyword[i], strip_punct) if keyword[i] else None
+            hits.append(pattern is not None and pattern.search(name[i]) is not None)
+        return hits
+    return test
+
+
+name_has_keyword = _name_has_keyword(strip_punct=False)
+name_has_keyword_words = _name_has_keyword(strip_punct=True)
+
+
+# ========== 프로필 ==========
+
+Rule = namedtuple("Rule", "reason other test")   # 조건이 맞으면 other 여부 확정
+Weight = namedtuple("Weight", "weight test")     # 조건이 맞으면 점수 가산
+
+
+@dataclass(frozen=True)
+class Profile:
+    """판정 규칙 묶음 - rules를 순서대로 적용하고, 남은 행은 weights 점수로 판정"""
+    name: str
+    rules: Tuple[Rule, ...] = ()
+    weights: Tuple[Weight, ...] = ()
+    threshold: float = 0.0
+    default_other: bool = False   # weights가 없을 때 남은 행의 판정
+
+
+PROFILES: Dict[str, Profile] = {
+    "core": Profile(
+        "core",
+        rules=(
+            Rule(NAME_BLACKLIST, True, name_blacklisted),
+            Rule(PHONE_070, True, phone_is_voip),
+            Rule(PHONE_REGULAR, False, phone_has_digit),
+            Rule(ADDRESS_DETAILED, False, address_detailed),
+            Rule(FAR_FROM_KEYWORD, True, far_from_keyword),
+            Rule(ADDRESS_AREA_ONLY, True, address_area_only),
+        ),
+        weights=(
+            Weight(1, rating_missing),
+            Weight(2, name_has_keyword),
+        ),
+        threshold=3,
+    ),
+    "streamlit": Profile(
+        "streamlit",
+        rules=(
+            Rule(NAME_BLACKLIST, True, name_blacklisted),
+            Rule(PHONE_0507, False, phone_is_safe),
+            Rule(PHONE_070, True, phone_is_voip),
+            Rule(PHONE_REGULAR, False, phone_has_digit),
+            Rule(FAR_FROM_KEYWORD, True, far_from_keyword),
+        ),
+    ),
+    "score": Profile(
+        "score",
+        weights=(
+            Weight(3, phone_is_voip),
+            Weight(2, address_area_only),
+            Weight(1, address_ends_with_region),
+            Weight(2, address_missing),
+            Weight(1, rating_missing),
+            Weight(2, name_has_keyword),
+        ),
+        threshold=4,
+    ),
+    "real": Profile(
+        "real",
+        weights=(
+            Weight(3, phone_is_voip),
+            Weight(2, address_vague),
+            Weight(1, rating_missing),
+            Weight(1, reviews_few),
+            Weight(2, name_has_keyword_words),
+            Weight(0.5, name_short),
+        ),
+        threshold=4,
+    ),
+}
+
+
+def get_profile(profile: Union[str, Profile]) -> Profile:
+    if isinstance(profile, Profile):
+        return profile
+    try:
+        return PROFILES[profile]
+    except KeyError:
+        raise ValueError(f"알 수 없는 프로필: {profile} (가능: {', '.join(PROFILES)})") from None
+
+
+# ========== 판정 ==========
+
+def evaluate(columns: Columns, profile: Profile) -> Tuple[List[bool], List[str]]:
+    """열 단위 판정 → (행별 타지역 여부, 행별 근거 코드)"""
+    other = [profile.default_other] * columns.size
+    reason = [DEFAULT] * columns.size
+    pending = list(range(columns.size))
+
+    for rule in profile.rules:
+        if not pending:
+            break
+        rest = []
+        for i, hit in zip(pending, rule.test(columns, pending)):
+            if hit:
+                other[i] = rule.other
+                reason[i] = rule.reason
+            else:
+                rest.append(i)
+        pending = rest
+
+    if profile.weights and pending:
+        scores = [0.0] * len(pending)
+        for weight in profile.weights:
+            for k, hit in enumerate(weight.test(columns, pending)):
+                if hit:
+                    scores[k] += weight.weight
+        for i, score in zip(pending, scores):
+            high = score >= profile.threshold
+            other[i] = high
+            reason[i] = SCORE_HIGH if high else SCORE_LOW
+
+    return other, reason
+
+
+def classify(table, profile: Union[str, Profile] = "core", keyword: Optional[str] = None):
+    """표 전체 판정
+
+    table: 열 이름(name/address/phone/rating/reviews/keyword, 선택: latitude/longitude) → 값 목록인 dict,
+           또는 pandas DataFrame (없는 열은 빈 값, keyword를 주면 keyword 열 대신 모든 행에 사용)
+    → {'place_type': [...], 'is_other_region': [...], 'reason': [...], 'distance_km': [...]}
+      DataFrame을 넣으면 같은 index의 DataFrame
+    """
+    columns = Columns(table, keyword)
+    other, reason = evaluate(columns, get_profile(profile))
+    result = {
+        "place_type": [OTHER if o else MAIN for o in other],
+        "is_other_region": other,
+        "reason": reason,
+        "distance_km": columns.distances(),
+    }
+    if _is_dataframe(table):
+        import pandas as pd
+        return pd.DataFrame(result, index=table.index)
+    return result
+
+
+def classify_records(records: Sequence[Dict], profile: Union[str, Profile] = "core",
+                     keyword: Optional[str] = None) -> Tuple[List[bool], List[str]]:
+    """크롤러 결과 dict 목록 판정 (행 → 열 변환 1회) → (행별 타지역 여부, 행별 근거 코드)"""
+    table = {column: [record.get(column) for record in records] for column in COLUMNS + NUMERIC_COLUMNS}
+    return evaluate(Columns(table, keyword), get_profile(profile))
+
+
+def classify_place(profile: Union[str, Profile], name: str = "", address: str = "", phone: str = "",
+                   rating: str = "", reviews: str = "", keyword: str = "",
+                   latitude: Optional[float] = None, longitude: Optional[float] = None) -> Tuple[bool, str]:
+    """업체 1건 판정 (아이템마다 바로 판정하는 크롤러용) → (타지역 여부, 근거 코드)"""
+    other, reason = classify_records(
+        [{"name": name, "address": address, "phone": phone, "rating": rating, "reviews": reviews,
+          "latitude": latitude, "longitude": longitude}],
+        profile, keyword,
+    )
+    return other[0], reason[0]
@@ -0,0 +1,149 @@
+"""
+요청 차단 프로필
+텍스트와 썸네일 src만 읽으므로 지도 타일/이미지/폰트/광고/분석 요청은
+page.route 또는 context.route로 중단시켜 로드 시간과 메모리를 줄인다.
+"""
+
+import os
+from collections import Counter
+from typing import Iterable, Optional
+
+ROUTE_PATTERN = "**/*"
+
+# 리소스 타입별 차단 기본값 (스타일시트는 레이아웃/스크롤 판정에 필요해 유지)
+DEFAULT_BLOCKED_TYPES = ("image", "media", "font")
+
+# URL에 포함되면 타입과 관계없이 차단
+DEFAULT_DENY_PATTERNS = (
+    "map.pstatic.net",        # 지도 타일
+    "panorama",               # 거리뷰/파노라마 에셋
+    "veta.naver.com",         # 광고
+    "tivan.naver.com",        # 광고
+    "lcs.naver.com",          # 로그 수집
+    "nlog.naver.com",         # 로그 수집
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+)
+
+# 차단된 요청의 대략적인 크기 (절감량 추정용, 바이트)
+TYPICAL_BYTES = {
+    "image": 25_000,
+    "media": 300_000,
+    "font": 40_000,
+    "stylesheet": 20_000,
+    "script": 50_000,
+    "xhr": 5_000,
+    "fetch": 5_000,
+}
+DEFAULT_TYPICAL_BYTES = 10_000
+
+
+def _env_list(name: str, default: Iterable[str]):
+    value = os.getenv(name)
+    if value is None:
+        return tuple(default)
+    return tuple(part.strip() for part in value.split(",") if part.strip())
+
+
+class BlockingProfile:
+    """차단 규칙 - 허용 패턴이 차단 규칙보다 우선"""
+
+    def __init__(self, block_types: Iterable[str] = DEFAULT_BLOCKED_TYPES,
+                 deny_patterns: Iterable[str] = DEFAULT_DENY_PATTERNS,
+                 allow_patterns: Iterable[str] = (), enabled: bool = True):
+        self.block_types = frozenset(block_types)
+        self.deny_patterns = tuple(deny_patterns)
+        self.allow_patterns = tuple(allow_patterns)
+        self.enabled = enabled
+
+    @classmethod
+    def from_env(cls):
+        """환경변수 설정 (BLOCK_RESOURCES=0이면 비활성화)
+
+        BLOCK_RESOURCE_TYPES / BLOCK_URL_PATTERNS / ALLOW_URL_PATTERNS는 쉼표 구분 목록
+        """
+        return cls(
+            block_types=_env_list("BLOCK_RESOURCE_TYPES", DEFAULT_BLOCKED_TYPES),
+            deny_patterns=_env_list("BLOCK_URL_PATTERNS", DEFAULT_DENY_PATTERNS),
+            allow_patterns=_env_list("ALLOW_URL_PATTERNS", ()),
+            enabled=os.getenv("BLOCK_RESOURCES", "1") != "0",
+        )
+
+    def should_block(self, resource_type: str, url: str) -> bool:
+        if not self.enabled:
+            return False
+        if any(pattern in url for pattern in self.allow_patterns):
+            return False
+        if resource_type in self.block_types:
+            return True
+        return any(pattern in url for pattern in self.deny_patterns)
+
+
+class BlockStats:
+    """키워드 1회 처리 동안의 차단 통계"""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.blocked = 0
+        self.allowed = 0
+        self.by_type = Counter()
+        self.bytes_saved = 0
+
+    def record(self, resource_type: str, blocked: bool):
+        if not blocked:
+            self.allowed += 1
+            return
+        self.blocked += 1
+        self.by_type[resource_type] += 1
+        self.bytes_saved += TYPICAL_BYTES.get(resource_type, DEFAULT_TYPICAL_BYTES)
+
+    def summary(self) -> str:
+        types = ", ".join(f"{t} {n}" for t, n in self.by_type.most_common())
+        return (f"요청 차단 {self.blocked}건 / 통과 {self.allowed}건"
+                f"{f' ({types})' if types else ''} · 약 {self.bytes_saved / 1024:.0f}KB 절감(추정)")
+
+
+class RequestBlocker:
+    """프로필을 page/context에 연결하고 통계를 모으는 라우트 핸들러
+
+    sync/async Playwright 모두 같은 핸들러를 사용한다
+    (async에서는 route.abort()/continue_()가 반환한 코루틴을 Playwright가 await).
+    """
+
+    def __init__(self, profile: Optional[BlockingProfile] = None):
+        self.profile = profile or BlockingProfile.from_env()
+        self.stats = BlockStats()
+        self._handler = self._handle
+
+    def _handle(self, route):
+        request = route.request
+        blocked = self.profile.should_block(request.resource_type, request.url)
+        self.stats.record(request.resource_type, blocked)
+        return route.abort() if blocked else route.continue_()
+
+    def attach(self, target):
+        """sync page/context에 연결"""
+        if self.profile.enabled:
+            target.route(ROUTE_PATTERN, self._handler)
+
+    def detach(self, target):
+        if self.profile.enabled:
+            try:
+                target.unroute(ROUTE_PATTERN, self._handler)
+            except Exception:
+                pass
+
+    async def attach_async(self, target):
+        """async page/context에 연결"""
+        if self.profile.enabled:
+            await target.route(ROUTE_PATTERN, self._handler)
+
+    async def detach_async(self, target):
+        if self.profile.enabled:
+            try:
+                await target.unroute(ROUTE_PATTERN, self._handler)
+            except Exception:
+                pass
@@ -0,0 +1,242 @@
+"""
+키워드 검색 결과 캐시 (SQLite)
+정규화한 키워드 + 크롤링 모드 + max_results를 키로 결과 목록을 저장
+
+- TTL 안: 즉시 반환 (hit)
+- TTL 지남 ~ TTL + stale_ttl: 저장된 결과를 즉시 반환하고 백그라운드에서 갱신 (stale-while-revalidate)
+- 그 외: 크롤링 후 저장 (miss)
+- 전체 크기가 max_bytes를 넘으면 가장 오래 사용하지 않은 항목부터 삭제 (LRU)
+"""
+
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from concurrent.futures import Future
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional
+
+
+DEFAULT_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "naver_place", "results.sqlite3")
+
+
+def normalize_keyword(keyword: str) -> str:
+    """캐시 키용 키워드 정규화 (전각/반각 통일, 소문자, 연속 공백 1칸)"""
+    keyword = unicodedata.normalize("NFKC", keyword or "")
+    return re.sub(r"\s+", " ", keyword).strip().lower()
+
+
+class ResultCache:
+    """검색 결과 캐시
+
+    submit()은 crawl()이 돌려주는 concurrent.futures.Future와 같은 형태의 Future를
+    반환하므로 브라우저 서비스(Flask)와 BrowserRuntime(Streamlit) 모두 그대로 쓸 수 있다.
+    """
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, ttl: float = 3600, stale_ttl: float = 86400,
+                 max_bytes: int = 50 * 1024 * 1024, enabled: bool = True):
+        self.path = path
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+
+        self._lock = threading.Lock()
+        self._refreshing = set()
+        self._stats = {
+            "hits": 0, "stale_hits": 0, "misses": 0, "bypasses": 0,
+            "refreshes": 0, "stores": 0, "evictions": 0,
+        }
+        if self.enabled:
+            self._init_db()
+
+    @classmethod
+    def from_env(cls):
+        """환경변수 설정 (RESULT_CACHE=0이면 비활성화)"""
+        return cls(
+            path=os.getenv("RESULT_CACHE_PATH", DEFAULT_CACHE_PATH),
+            ttl=float(os.getenv("RESULT_CACHE_TTL", "3600")),
+            stale_ttl=float(os.getenv("RESULT_CACHE_STALE_TTL", "86400")),
+            max_bytes=int(float(os.getenv("RESULT_CACHE_MAX_MB", "50")) * 1024 * 1024),
+            enabled=os.getenv("RESULT_CACHE", "1") != "0",
+        )
+
+    # ========== 조회/저장 ==========
+
+    def submit(self, keyword: str, mode: str, max_results: int,
+               crawl: Callable[[], Future], bypass: bool = False) -> Future:
+        """캐시 조회 후 결과 Future 반환 - 없거나 만료되면 crawl()로 크롤링"""
+        if not self.enabled:
+            return crawl()
+
+        key = self.make_key(keyword, mode, max_results)
+        if bypass:
+            self._count("bypasses")
+            return self._crawl_and_store(key, crawl)
+
+        entry = self._load(key)
+        if entry is not None:
+            results, age = entry
+            if age < self.ttl:
+                self._count("hits")
+                return _done(results)
+            if age < self.ttl + self.stale_ttl:
+                self._count("stale_hits")
+                self._refresh(key, crawl)
+                return _done(results)
+
+        self._count("misses")
+        return self._crawl_and_store(key, crawl)
+
+    @staticmethod
+    def make_key(keyword: str, mode: str, max_results: int) -> str:
+        return f"{mode}|{int(max_results)}|{normalize_keyword(keyword)}"
+
+    def store(self, key: str, results: List[Dict]):
+        """결과 저장 - 빈 결과(크롤링 실패)는 저장하지 않음"""
+        if not results:
+            return
+        payload = json.dumps(results, ensure_ascii=False)
+        now = time.time()
+        with self._lock, self._connect() as db:
+            db.execute(
+                "INSERT OR REPLACE INTO results (key, payload, size, created_at, accessed_at) VALUES (?, ?, ?, ?, ?)",
+                (key, payload, len(payload.encode("utf-8")), now, now)
+            )
+            self._stats["stores"] += 1
+            self._evict(db)
+
+    def invalidate(self, keyword: Optional[str] = None):
+        """키워드 캐시 삭제 (없으면 전체 삭제)"""
+        if not self.enabled:
+            return
+        with self._lock, self._connect() as db:
+            if keyword is None:
+                db.execute("DELETE FROM results")
+            else:
+                db.execute("DELETE FROM results WHERE key LIKE ?", (f"%|{normalize_keyword(keyword)}",))
+
+    def stats(self) -> Dict:
+        """적중/미스 통계 + 저장 항목 수/크기"""
+        with self._lock:
+            stats = dict(self._stats)
+        entries, size = 0, 0
+        if self.enabled:
+            with self._connect() as db:
+                entries, size = db.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM results").fetchone()
+        lookups = stats["hits"] + stats["stale_hits"] + stats["misses"]
+        stats.update({
+            "enabled": self.enabled,
+            "entries": entries,
+            "bytes": size,
+            "hit_rate": round((stats["hits"] + stats["stale_hits"]) / lookups, 3) if lookups else 0.0,
+        })
+        return stats
+
+    # ========== 내부 ==========
+
+    def _init_db(self):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as db:
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                " key TEXT PRIMARY KEY, payload TEXT NOT NULL, size INTEGER NOT NULL,"
+                " created_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            db.execute("CREATE INDEX IF NOT EXISTS results_accessed ON results (accessed_at)")
+
+    @contextmanager
+    def _connect(self):
+        # 스레드끼리 연결을 공유하지 않도록 작업마다 새로 연결 (로컬 파일이라 비용이 작음)
+        db = sqlite3.connect(self.path, timeout=10)
+        try:
+            with db:
+                yield db
+        finally:
+            db.close()
+
+    def _load(self, key: str):
+        with self._lock, self._connect() as db:
+            row = db.execute("SELECT payload, created_at FROM results WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            db.execute("UPDATE results SET accessed_at = ? WHERE key = ?", (time.time(), key))
+        payload, created_at = row
+        return json.loads(payload), time.time() - created_at
+
+    def _evict(self, db):
+        total = db.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        for key, size in db.execute("SELECT key, size FROM results ORDER BY accessed_at").fetchall():
+            if total <= self.max_bytes:
+                break
+            db.execute("DELETE FROM results WHERE key = ?", (key,))
+            total -= size
+            self._stats["evictions"] += 1
+
+    def _crawl_and_store(self, key: str, crawl: Callable[[], Future]) -> Future:
+        # 저장이 끝난 뒤 결과를 넘겨줌 - 호출자가 결과 dict를 수정하는 동안 직렬화하지 않도록
+        source = crawl()
+        future = Future()
+
+        def done(f):
+            self._store_future(key, f)
+            if f.cancelled():
+                future.cancel()
+                future.set_running_or_notify_cancel()
+            elif f.exception() is not None:
+                future.set_exception(f.exception())
+            else:
+                future.set_result(f.result())
+        source.add_done_callback(done)
+        return future
+
+    def _refresh(self, key: str, crawl: Callable[[], Future]):
+        """백그라운드 갱신 (같은 키는 동시에 1번만)"""
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+            self._stats["refreshes"] += 1
+        try:
+            future = crawl()
+        except Exception as e:
+            print(f"⚠️ 캐시 갱신 시작 실패: {e}")
+            with self._lock:
+                self._refreshing.discard(key)
+            return
+
+        def done(f):
+            try:
+                self._store_future(key, f)
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+        future.add_done_callback(done)
+
+    def _store_future(self, key: str, future: Future):
+        if future.cancelled() or future.exception() is not None:
+            return
+        if getattr(future.result(), "partial", False):
+            # 취소/시간 초과로 중간에 끊긴 결과는 다음 검색에서 다시 크롤링
+            return
+        try:
+            self.store(key, future.result())
+        except Exception as e:
+            print(f"⚠️ 캐시 저장 실패: {e}")
+
+    def _count(self, name: str):
+        with self._lock:
+            self._stats[name] += 1
+
+
+def _done(results) -> Future:
+    future = Future()
+    future.set_result(results)
+    return future
@@ -0,0 +1,204 @@
+"""
+이벤트 기반 대기 엔진
+고정 time.sleep / asyncio.sleep 대신 실제 신호(셀렉터, 아이템 수 안정화,
+네트워크 응답, iframe 이동)로 준비 완료를 판정하고 실제 대기 시간을 기록
+"""
+
+import itertools
+import time
+from dataclasses import dataclass
+from typing import List, Optional
+
+
+# 아이템 수가 quiet_ms 동안 변하지 않으면 안정화된 것으로 판단 (페이지 안에서 폴링)
+# token은 대기 호출마다 새로 발급 - 이전 호출의 관측값으로 즉시 통과하지 않도록
+SETTLE_SCRIPT = """
+([selector, quietMs, minCount, token]) => {
+    const count = document.querySelectorAll(selector).length;
+    const state = window.__waitSettle || (window.__waitSettle = {});
+    const now = performance.now();
+    const prev = state[token];
+    if (!prev || prev.count !== count) {
+        state[token] = {count: count, since: now};
+        return false;
+    }
+    if (count >= minCount && now - prev.since >= quietMs) {
+        delete state[token];
+        return true;
+    }
+    return false;
+}
+"""
+
+SETTLE_POLLING_MS = 100
+
+_tokens = itertools.count(1)
+
+
+@dataclass
+class WaitTiming:
+    """대기 1회 기록"""
+    signal: str
+    target: str
+    elapsed_ms: float
+    ok: bool
+
+
+class _WaitLog:
+    """대기 기록 공통 부분"""
+
+    def __init__(self, page):
+        self.page = page
+        self.timings: List[WaitTiming] = []
+
+    def _record(self, signal, target, started, ok):
+        elapsed = (time.perf_counter() - started) * 1000
+        self.timings.append(WaitTiming(signal, target, elapsed, ok))
+        return ok
+
+    @property
+    def total_ms(self) -> float:
+        return sum(t.elapsed_ms for t in self.timings)
+
+    def summary(self) -> str:
+        """대기 기록 요약 문자열 (로그 출력용)"""
+        parts = [
+            f"{t.signal}({t.target[:30]}) {t.elapsed_ms:.0f}ms{'' if t.ok else ' ⏱'}"
+            for t in self.timings
+        ]
+        return f"대기 {self.total_ms:.0f}ms: " + ", ".join(parts)
+
+
+class Waiter(_WaitLog):
+    """sync Playwright용 대기 엔진
+
+    모든 대기는 timeout(ms) 마감이 있으며 실패해도 예외 대신 False/None을 반환한다.
+    target을 주면 page 대신 해당 frame 안에서 확인한다.
+    """
+
+    def selector(self, selector: str, timeout: int = 10000, state: str = "attached", target=None) -> bool:
+        """셀렉터가 나타날 때까지 대기"""
+        started = time.perf_counter()
+        try:
+            (target or self.page).wait_for_selector(selector, timeout=timeout, state=state)
+            ok = True
+        except Exception:
+            ok = False
+        return self._record("selector", selector, started, ok)
+
+    def settled(self, selector: str, quiet_ms: int = 300, min_count: int = 1,
+                timeout: int = 3000, target=None) -> bool:
+        """아이템 수가 quiet_ms 동안 변하지 않을 때까지 대기 (스크롤/더보기 후)"""
+        started = time.perf_counter()
+        try:
+            (target or self.page).wait_for_function(
+                SETTLE_SCRIPT, arg=[selector, quiet_ms, min_count, next(_tokens)],
+                polling=SETTLE_POLLING_MS, timeout=timeout
+            )
+            ok = True
+        except Exception:
+            ok = False
+        return self._record("settled", selector, started, ok)
+
+    def response(self, url_part: str, timeout: int = 10000) -> bool:
+        """URL에 url_part가 포함된 네트워크 응답이 끝날 때까지 대기"""
+        started = time.perf_counter()
+        try:
+            self.page.wait_for_event(
+                "response", predicate=lambda r: url_part in r.url, timeout=timeout
+            ).finished()
+            ok = True
+        except Exception:
+            ok = False
+        return self._record("response", url_part, started, ok)
+
+    def frame(self, url_part: str, timeout: int = 10000):
+        """URL에 url_part가 포함된 frame으로 이동할 때까지 대기 → frame 또는 None"""
+        started = time.perf_counter()
+        found = _find_frame(self.page, url_part)
+        if not found:
+            try:
+                found = self.page.wait_for_event(
+                    "framenavigated", predicate=lambda f: url_part in f.url, timeout=timeout
+                )
+            except Exception:
+                found = _find_frame(self.page, url_part)
+        self._record("frame", url_part, started, found is not None)
+        return found
+
+    def load_state(self, state: str = "domcontentloaded", timeout: int = 10000, target=None) -> bool:
+        """문서 로드 상태 대기"""
+        started = time.perf_counter()
+        try:
+            (target or self.page).wait_for_load_state(state, timeout=timeout)
+            ok = True
+        except Exception:
+            ok = False
+        return self._record("load", state, started, ok)
+
+
+class AsyncWaiter(_WaitLog):
+    """async Playwright용 대기 엔진 (Waiter와 같은 인터페이스)"""
+
+    async def selector(self, selector: str, timeout: int = 10000, state: str = "attached", target=None) -> bool:
+        started = time.perf_counter()
+        try:
+            await (target or self.page).wait_for_selector(selector, timeout=timeout, state=state)
+            ok = True
+        except Exception:
+            ok = False
+        return self._record("selector", selector, started, ok)
+
+    async def settled(self, selector: str, quiet_ms: int = 300, min_count: int = 1,
+                      timeout: int = 3000, target=None) -> bool:
+        started = time.perf_counter()
+        try:
+            await (target or self.page).wait_for_function(
+                SETTLE_SCRIPT, arg=[selector, quiet_ms, min_count, next(_tokens)],
+                polling=SETTLE_POLLING_MS, timeout=timeout
+            )
+            ok = True
+        except Exception:
+            ok = False
+        return self._record("settled", selector, started, ok)
+
+    async def response(self, url_part: str, timeout: int = 10000) -> bool:
+        started = time.perf_counter()
+        try:
+            response = await self.page.wait_for_event(
+                "response", predicate=lambda r: url_part in r.url, timeout=timeout
+            )
+            await response.finished()
+            ok = True
+        except Exception:
+            ok = False
+        return self._record("response", url_part, started, ok)
+
+    async def frame(self, url_part: str, timeout: int = 10000):
+        started = time.perf_counter()
+        found = _find_frame(self.page, url_part)
+        if not found:
+            try:
+                found = await self.page.wait_for_event(
+                    "framenavigated", predicate=lambda f: url_part in f.url, timeout=timeout
+                )
+            except Exception:
+                found = _find_frame(self.page, url_part)
+        self._record("frame", url_part, started, found is not None)
+        return found
+
+    async def load_state(self, state: str = "domcontentloaded", timeout: int = 10000, target=None) -> bool:
+        started = time.perf_counter()
+        try:
+            await (target or self.page).wait_for_load_state(state, timeout=timeout)
+            ok = True
+        except Exception:
+            ok = False
+        return self._record("load", state, started, ok)
+
+
+def _find_frame(page, url_part: str) -> Optional[object]:
+    for frame in page.frames:
+        if url_part in frame.url:
+            return frame
+    return None